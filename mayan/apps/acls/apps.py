@@ -1,3 +1,6 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.apps import MayanAppConfig
@@ -9,6 +12,10 @@ from mayan.apps.views.html_widgets import ObjectLinkWidget
 
 from .classes import ModelPermission
 from .events import event_acl_deleted, event_acl_edited
+from .handlers import (
+    handler_access_cache_invalidate, handler_effective_grants_acl_changed,
+    handler_effective_grants_acl_permissions_changed
+)
 from .links import (
     link_acl_create, link_acl_delete, link_acl_permissions,
     link_global_acl_list
@@ -30,6 +37,8 @@ class ACLsApp(MayanAppConfig):
         GlobalAccessControlListProxy = self.get_model(
             model_name='GlobalAccessControlListProxy'
         )
+        Role = apps.get_model(app_label='permissions', model_name='Role')
+        User = get_user_model()
 
         EventModelRegistry.register(model=AccessControlList, menu=menu_object)
 
@@ -76,3 +85,52 @@ class ACLsApp(MayanAppConfig):
         menu_setup.bind_links(
             links=(link_global_acl_list,)
         )
+
+        # Access decisions cached for the current request or task are
+        # discarded when a grant changes during its lifetime.
+        m2m_changed.connect(
+            dispatch_uid='acls_handler_access_cache_invalidate_acl_permissions',
+            receiver=handler_access_cache_invalidate,
+            sender=AccessControlList.permissions.through
+        )
+        m2m_changed.connect(
+            dispatch_uid='acls_handler_access_cache_invalidate_role_groups',
+            receiver=handler_access_cache_invalidate,
+            sender=Role.groups.through
+        )
+        m2m_changed.connect(
+            dispatch_uid='acls_handler_access_cache_invalidate_role_permissions',
+            receiver=handler_access_cache_invalidate,
+            sender=Role.permissions.through
+        )
+        m2m_changed.connect(
+            dispatch_uid='acls_handler_access_cache_invalidate_user_groups',
+            receiver=handler_access_cache_invalidate,
+            sender=User.groups.through
+        )
+        post_delete.connect(
+            dispatch_uid='acls_handler_access_cache_invalidate_acl_delete',
+            receiver=handler_access_cache_invalidate,
+            sender=AccessControlList
+        )
+        post_save.connect(
+            dispatch_uid='acls_handler_access_cache_invalidate_acl_save',
+            receiver=handler_access_cache_invalidate,
+            sender=AccessControlList
+        )
+
+        m2m_changed.connect(
+            dispatch_uid='acls_handler_effective_grants_acl_permissions_changed',
+            receiver=handler_effective_grants_acl_permissions_changed,
+            sender=AccessControlList.permissions.through
+        )
+        post_delete.connect(
+            dispatch_uid='acls_handler_effective_grants_acl_delete',
+            receiver=handler_effective_grants_acl_changed,
+            sender=AccessControlList
+        )
+        post_save.connect(
+            dispatch_uid='acls_handler_effective_grants_acl_save',
+            receiver=handler_effective_grants_acl_changed,
+            sender=AccessControlList
+        )
@@ -1,5 +1,7 @@
+from contextlib import contextmanager
 import itertools
 import logging
+import threading
 
 from django.apps import apps
 from django.core.exceptions import ImproperlyConfigured
@@ -12,15 +14,163 @@ from mayan.apps.events.classes import EventModelRegistry
 logger = logging.getLogger(name=__name__)
 
 
+class AccessCache:
+    """
+    Scoped cache of access decisions keyed by user, permission, model and
+    object ID. While a scope is active, access checks are answered from the
+    cache. A miss evaluates the permission for the object and for all the
+    registered objects of the same model in a single query, which keeps
+    the number of ACL queries of a list view independent of its length.
+    """
+    _local = threading.local()
+
+    @classmethod
+    def get_current(cls):
+        return getattr(cls._local, 'access_cache', None)
+
+    @classmethod
+    def invalidate(cls):
+        access_cache = cls.get_current()
+        if access_cache:
+            access_cache.clear()
+
+    @classmethod
+    def register_objects(cls, object_list):
+        """
+        Add the objects to the candidates evaluated when a cache miss
+        occurs. The object list is only evaluated on the first miss.
+        """
+        access_cache = cls.get_current()
+        if access_cache:
+            access_cache.object_lists.append(object_list)
+
+    @classmethod
+    @contextmanager
+    def scope(cls):
+        """
+        Activate a cache for the current thread. Nested scopes share the
+        cache of the outermost scope.
+        """
+        access_cache = cls.get_current()
+
+        if access_cache:
+            yield access_cache
+        else:
+            access_cache = cls()
+            cls._local.access_cache = access_cache
+
+            try:
+                yield access_cache
+            finally:
+                cls._local.access_cache = None
+                logger.debug(
+                    'Access cache statistics: %s',
+                    access_cache.get_statistics()
+                )
+
+    def __init__(self):
+        self.clear()
+        self.hits = 0
+        self.misses = 0
+        self.queries = 0
+
+    def clear(self):
+        self.decisions = {}
+        self.object_lists = []
+        self.object_ids = {}
+
+    def get_decision(self, model, object_id, permission, user):
+        try:
+            result = self.decisions[
+                (user.pk, permission.pk, model, object_id)
+            ]
+        except KeyError:
+            self.misses += 1
+            raise
+        else:
+            self.hits += 1
+            return result
+
+    def get_pending_object_ids(self, model, permission, user):
+        """
+        Return the IDs of the registered objects of the model without a
+        decision for the permission and user.
+        """
+        while self.object_lists:
+            for obj in self.object_lists.pop():
+                meta = getattr(obj, '_meta', None)
+                if meta:
+                    self.object_ids.setdefault(meta.model, set()).add(obj.pk)
+
+        return {
+            object_id for object_id in self.object_ids.get(model, ()) if (
+                user.pk, permission.pk, model, object_id
+            ) not in self.decisions
+        }
+
+    def get_statistics(self):
+        return {
+            'decisions': len(self.decisions), 'hits': self.hits,
+            'misses': self.misses, 'queries': self.queries
+        }
+
+    def set_decisions(
+        self, model, object_id_list, allowed_object_id_list, permission, user
+    ):
+        self.queries += 1
+
+        for object_id in object_id_list:
+            self.decisions[
+                (user.pk, permission.pk, model, object_id)
+            ] = object_id in allowed_object_id_list
+
+
 class ModelPermission:
+    _effective_grant_models = None
     _field_query_functions = {}
     _inheritances = {}
     _inheritances_reverse = {}
     _manager_names = {}
     _model_permissions = {}
 
+    @classmethod
+    def _connect_effective_grant_handlers(cls, model, connect=True):
+        from django.db.models.signals import post_delete, post_save
+
+        from mayan.apps.common.signals import signal_mayan_post_bulk_create
+
+        from .handlers import (
+            handler_effective_grants_object_bulk_create,
+            handler_effective_grants_object_delete,
+            handler_effective_grants_object_save
+        )
+
+        cls._effective_grant_models = None
+
+        model = model._meta.concrete_model
+
+        for signal, receiver in (
+            (post_delete, handler_effective_grants_object_delete),
+            (post_save, handler_effective_grants_object_save),
+            (
+                signal_mayan_post_bulk_create,
+                handler_effective_grants_object_bulk_create
+            )
+        ):
+            dispatch_uid = 'acls_{}_{}'.format(
+                receiver.__name__, model._meta.label_lower
+            )
+
+            if connect:
+                signal.connect(
+                    dispatch_uid=dispatch_uid, receiver=receiver, sender=model
+                )
+            else:
+                signal.disconnect(dispatch_uid=dispatch_uid, sender=model)
+
     @classmethod
     def deregister(cls, model):
+        cls._connect_effective_grant_handlers(connect=False, model=model)
         cls._model_permissions.pop(model, None)
 
     @classmethod
@@ -41,6 +191,60 @@ class ModelPermission:
         else:
             return cls._model_permissions.keys()
 
+    @classmethod
+    def get_effective_grant_models(cls):
+        """
+        Return the concrete models whose access can be resolved from the
+        effective grants table, mapped to their inheritances as tuples of
+        field name and parent model. Models with a field query function,
+        with a generic foreign key inheritance or with a parent that is
+        excluded for the same reasons keep using the ACL filters.
+        """
+        if cls._effective_grant_models is None:
+            from django.contrib.contenttypes.fields import GenericForeignKey
+
+            result = {}
+
+            def resolve(model):
+                model = model._meta.concrete_model
+
+                if model not in result:
+                    # Models being resolved stay excluded, this breaks
+                    # inheritance cycles.
+                    result[model] = None
+
+                    if model in cls._field_query_functions:
+                        return None
+
+                    parents = []
+                    for inheritance in cls._inheritances.get(model, ()):
+                        related_field = get_related_field(
+                            model=model,
+                            related_field_name=inheritance['field_name']
+                        )
+                        if isinstance(related_field, GenericForeignKey) or not related_field.related_model:
+                            return None
+
+                        parent_model = related_field.related_model._meta.concrete_model
+                        if resolve(model=parent_model) is None:
+                            return None
+
+                        parents.append((inheritance['field_name'], parent_model))
+
+                    result[model] = tuple(parents)
+
+                return result[model]
+
+            for model in itertools.chain(cls._model_permissions, cls._inheritances):
+                resolve(model=model)
+
+            cls._effective_grant_models = {
+                model: parents for model, parents in result.items()
+                if parents is not None
+            }
+
+        return cls._effective_grant_models
+
     @classmethod
     def get_field_query_function(cls, model):
         return cls._field_query_functions[model]
@@ -149,8 +353,11 @@ class ModelPermission:
         # Allow the model to be used as the action_object for the ACL events.
         EventModelRegistry.register(model=model)
 
+        cls._connect_effective_grant_handlers(model=model)
+
     @classmethod
     def register_field_query_function(cls, model, function):
+        cls._effective_grant_models = None
         cls._field_query_functions[model] = function
 
     @classmethod
@@ -166,6 +373,8 @@ class ModelPermission:
             {'field_name': related, 'fk_field_cast': fk_field_cast}
         )
 
+        cls._connect_effective_grant_handlers(model=model)
+
     @classmethod
     def register_manager(cls, model, manager_name):
         cls._manager_names[model] = manager_name
@@ -0,0 +1,72 @@
+from django.apps import apps
+
+from .classes import AccessCache
+
+
+def _refresh_effective_grants_acl_object(acl):
+    EffectiveGrant = apps.get_model(
+        app_label='acls', model_name='EffectiveGrant'
+    )
+
+    model = acl.content_type.model_class()
+
+    if model:
+        EffectiveGrant.objects.refresh_objects(
+            model=model, object_id_list=(acl.object_id,)
+        )
+
+
+def handler_access_cache_invalidate(sender, **kwargs):
+    AccessCache.invalidate()
+
+
+def handler_effective_grants_acl_changed(sender, instance, **kwargs):
+    _refresh_effective_grants_acl_object(acl=instance)
+
+
+def handler_effective_grants_acl_permissions_changed(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    AccessControlList = apps.get_model(
+        app_label='acls', model_name='AccessControlList'
+    )
+
+    if action in ('post_add', 'post_clear', 'post_remove'):
+        if reverse:
+            # The instance is a stored permission and the primary key set
+            # holds the ACLs.
+            acls = AccessControlList.objects.filter(pk__in=pk_set or ())
+        else:
+            acls = (instance,)
+
+        for acl in acls:
+            _refresh_effective_grants_acl_object(acl=acl)
+
+
+def handler_effective_grants_object_bulk_create(sender, instances, **kwargs):
+    EffectiveGrant = apps.get_model(
+        app_label='acls', model_name='EffectiveGrant'
+    )
+
+    EffectiveGrant.objects.refresh_objects(
+        model=sender, object_id_list=[instance.pk for instance in instances]
+    )
+
+
+def handler_effective_grants_object_delete(sender, instance, **kwargs):
+    EffectiveGrant = apps.get_model(
+        app_label='acls', model_name='EffectiveGrant'
+    )
+
+    EffectiveGrant.objects.remove_object(obj=instance)
+
+
+def handler_effective_grants_object_save(sender, instance, **kwargs):
+    EffectiveGrant = apps.get_model(
+        app_label='acls', model_name='EffectiveGrant'
+    )
+
+    if not kwargs.get('raw', False):
+        EffectiveGrant.objects.refresh_objects(
+            model=sender, object_id_list=(instance.pk,)
+        )
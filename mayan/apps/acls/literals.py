@@ -0,0 +1,4 @@
+DEFAULT_ACLS_EFFECTIVE_GRANTS_ENABLE = False
+
+EFFECTIVE_GRANTS_CHUNK_SIZE = 500
+EFFECTIVE_GRANTS_TASK_RETRY_DELAY = 10
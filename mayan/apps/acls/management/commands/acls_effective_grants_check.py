@@ -0,0 +1,43 @@
+from django.core import management
+from django.utils.translation import ugettext_lazy as _
+
+from ...models import EffectiveGrant
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Compare the effective grants table with the ACLs and report the '
+        'missing and stale entries of each model.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repair', action='store_true', dest='repair',
+            help=_(
+                'Add the missing entries and remove the stale ones. Also '
+                'used to populate the table.'
+            )
+        )
+
+    def handle(self, *args, **options):
+        inconsistent = False
+
+        results = EffectiveGrant.objects.check_consistency(
+            repair=options['repair']
+        )
+
+        for model, missing_count, stale_count in results:
+            if missing_count or stale_count:
+                inconsistent = True
+
+            self.stdout.write(
+                '{}: missing: {}; stale: {}'.format(
+                    model._meta.label if model else 'Other models',
+                    missing_count, stale_count
+                )
+            )
+
+        if inconsistent and not options['repair']:
+            raise management.CommandError(
+                'The effective grants table is not consistent.'
+            )
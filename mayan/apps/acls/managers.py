@@ -2,10 +2,11 @@ from functools import reduce
 import logging
 import operator
 
+from django.apps import apps
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
-from django.db import models
+from django.db import models, transaction
 from django.db.models import CharField, Q, Value
 from django.db.models.functions import Cast, Concat
 from django.utils.encoding import force_text
@@ -17,8 +18,10 @@ from mayan.apps.common.utils import (
 from mayan.apps.permissions import Permission
 from mayan.apps.permissions.models import StoredPermission
 
+from .classes import AccessCache, ModelPermission
 from .exceptions import PermissionNotValidForClass
-from .classes import ModelPermission
+from .literals import EFFECTIVE_GRANTS_CHUNK_SIZE
+from .settings import setting_effective_grants_enable
 
 logger = logging.getLogger(name=__name__)
 
@@ -230,6 +233,47 @@ class AccessControlListManager(models.Manager):
 
         return result
 
+    def _check_access_cached(
+        self, access_cache, manager, obj, permissions, user
+    ):
+        model = obj._meta.model
+
+        for permission in permissions:
+            try:
+                result = access_cache.get_decision(
+                    model=model, object_id=obj.pk, permission=permission,
+                    user=user
+                )
+            except KeyError:
+                # Evaluate the permission for the object and all the other
+                # pending objects of the same model with a single query.
+                object_id_list = access_cache.get_pending_object_ids(
+                    model=model, permission=permission, user=user
+                )
+                object_id_list.add(obj.pk)
+
+                allowed_object_id_list = set(
+                    self.restrict_queryset(
+                        permission=permission, queryset=manager.filter(
+                            pk__in=object_id_list
+                        ), user=user
+                    ).values_list('pk', flat=True)
+                )
+
+                access_cache.set_decisions(
+                    allowed_object_id_list=allowed_object_id_list,
+                    model=model, object_id_list=object_id_list,
+                    permission=permission, user=user
+                )
+
+                result = obj.pk in allowed_object_id_list
+
+            # Default relationship betweens permissions is OR.
+            if result:
+                return True
+
+        return False
+
     def check_access(self, obj, permissions, user):
         # Allow specific managers for models that have more than one
         # for example the Document model when checking for access for a trashed
@@ -247,16 +291,27 @@ class AccessControlListManager(models.Manager):
             return True
         else:
             manager = ModelPermission.get_manager(model=obj._meta.model)
-            source_queryset = manager.all()
 
-        restricted_queryset = manager.none()
-        for permission in permissions:
-            # Default relationship betweens permissions is OR.
-            restricted_queryset = restricted_queryset | self.restrict_queryset(
-                permission=permission, queryset=source_queryset, user=user
+        access_cache = AccessCache.get_current()
+
+        if access_cache:
+            result = self._check_access_cached(
+                access_cache=access_cache, manager=manager, obj=obj,
+                permissions=permissions, user=user
             )
+        else:
+            source_queryset = manager.all()
 
-        if restricted_queryset.filter(pk=obj.pk).exists():
+            restricted_queryset = manager.none()
+            for permission in permissions:
+                # Default relationship betweens permissions is OR.
+                restricted_queryset = restricted_queryset | self.restrict_queryset(
+                    permission=permission, queryset=source_queryset, user=user
+                )
+
+            result = restricted_queryset.filter(pk=obj.pk).exists()
+
+        if result:
             return True
         else:
             raise PermissionDenied(
@@ -275,6 +330,19 @@ class AccessControlListManager(models.Manager):
                 permissions=(permission,), user=user
             )
         except PermissionDenied:
+            EffectiveGrant = apps.get_model(
+                app_label='acls', model_name='EffectiveGrant'
+            )
+
+            if EffectiveGrant.objects.is_enabled_for_model(model=queryset.model):
+                return queryset.filter(
+                    pk__in=EffectiveGrant.objects.get_object_id_queryset(
+                        model=queryset.model,
+                        stored_permission=permission.stored_permission,
+                        user=user
+                    )
+                )
+
             acl_filters = self._get_acl_filters(
                 queryset=queryset,
                 stored_permission=permission.stored_permission, user=user
@@ -380,3 +448,322 @@ class AccessControlListManager(models.Manager):
 
         if acl.permissions.count() == 0:
             acl.delete()
+
+
+class EffectiveGrantManager(models.Manager):
+    def _apply_differences(self, content_type, differences):
+        existing, missing, stale = differences
+
+        with transaction.atomic():
+            if stale:
+                self.filter(
+                    pk__in=[existing[entry] for entry in stale]
+                ).delete()
+
+            if missing:
+                self.bulk_create(
+                    objs=[
+                        self.model(
+                            content_type=content_type, object_id=object_id,
+                            permission_id=permission_id, role_id=role_id
+                        ) for object_id, permission_id, role_id in missing
+                    ], ignore_conflicts=True
+                )
+
+    def _get_chunks(self, object_id_list):
+        object_id_list = list(object_id_list)
+
+        for index in range(0, len(object_id_list), EFFECTIVE_GRANTS_CHUNK_SIZE):
+            yield object_id_list[index:index + EFFECTIVE_GRANTS_CHUNK_SIZE]
+
+    def _get_differences(self, content_type, model, object_id_list):
+        """
+        Compare the stored entries of the objects with the ones resulting
+        from their ACLs and from the stored entries of their parents.
+        Entries are tuples of object ID, permission ID and role ID.
+        """
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        expected = set(
+            AccessControlList.objects.filter(
+                content_type=content_type, object_id__in=object_id_list,
+                permissions__isnull=False
+            ).values_list('object_id', 'permissions', 'role_id')
+        )
+
+        for field_name, parent_model in ModelPermission.get_effective_grant_models()[model]:
+            children = {}
+            queryset = model._base_manager.filter(
+                pk__in=object_id_list
+            ).values_list('pk', '{}__pk'.format(field_name))
+
+            for object_id, parent_id in queryset:
+                if parent_id is not None:
+                    children.setdefault(parent_id, []).append(object_id)
+
+            queryset = self.filter(
+                content_type=ContentType.objects.get_for_model(
+                    model=parent_model
+                ), object_id__in=list(children)
+            ).values_list('object_id', 'permission_id', 'role_id')
+
+            for parent_id, permission_id, role_id in queryset:
+                for object_id in children[parent_id]:
+                    expected.add((object_id, permission_id, role_id))
+
+        existing = {
+            (object_id, permission_id, role_id): pk for
+            pk, object_id, permission_id, role_id in self.filter(
+                content_type=content_type, object_id__in=object_id_list
+            ).values_list('pk', 'object_id', 'permission_id', 'role_id')
+        }
+
+        return (
+            existing, expected.difference(existing),
+            set(existing).difference(expected)
+        )
+
+    def _get_models(self):
+        """
+        Return the models of the effective grants table, parents first.
+        """
+        effective_grant_models = ModelPermission.get_effective_grant_models()
+        depths = {}
+
+        def get_depth(model):
+            if model not in depths:
+                depths[model] = 1 + max(
+                    [
+                        get_depth(model=parent_model) for
+                        field_name, parent_model in effective_grant_models[model]
+                    ] or [-1]
+                )
+
+            return depths[model]
+
+        return sorted(
+            [
+                model for model in effective_grant_models
+                if apps.get_registered_model(
+                    app_label=model._meta.app_label,
+                    model_name=model._meta.model_name
+                ) is model
+            ], key=lambda model: (
+                get_depth(model=model), model._meta.label_lower
+            )
+        )
+
+    def _queue_children_refresh(self, model, object_id_list):
+        """
+        Queue the update of the entries of the children of the objects.
+        Each task queues the next level for the objects whose entries
+        changed.
+        """
+        for child_model, parents in ModelPermission.get_effective_grant_models().items():
+            for field_name, parent_model in parents:
+                if parent_model == model:
+                    queryset = child_model._base_manager.filter(
+                        **{
+                            '{}__pk__in'.format(field_name): list(object_id_list)
+                        }
+                    ).order_by('pk').values_list('pk', flat=True)
+
+                    self._queue_refresh(
+                        model=child_model, object_id_list=queryset
+                    )
+
+    def _queue_refresh(self, model, object_id_list):
+        """
+        Queue the update of the entries of the objects in tasks of up to
+        EFFECTIVE_GRANTS_CHUNK_SIZE objects.
+        """
+        from .tasks import task_effective_grants_refresh
+
+        for chunk in self._get_chunks(object_id_list=object_id_list):
+            task_effective_grants_refresh.apply_async(
+                kwargs={
+                    'app_label': model._meta.app_label,
+                    'model_name': model._meta.model_name,
+                    'object_id_list': chunk
+                }
+            )
+
+    def _remove_descendant_entries(self, model, entries):
+        """
+        Delete the entries of the descendants of the objects for the
+        permission and role pairs of the removed entries of the objects,
+        one inheritance level at a time. Returns the descendants whose
+        entries were deleted, by model, to restore with a refresh the
+        entries that they also obtain from other ACLs.
+        """
+        effective_grant_models = ModelPermission.get_effective_grant_models()
+        removed = {}
+        pending = [(model, entries)]
+
+        while pending:
+            model, entries = pending.pop(0)
+
+            pairs = {}
+            for object_id, permission_id, role_id in entries:
+                pairs.setdefault((permission_id, role_id), []).append(
+                    object_id
+                )
+
+            for child_model, parents in effective_grant_models.items():
+                for field_name, parent_model in parents:
+                    if parent_model != model:
+                        continue
+
+                    content_type = ContentType.objects.get_for_model(
+                        model=child_model
+                    )
+                    child_entries = set()
+
+                    for (permission_id, role_id), object_id_list in pairs.items():
+                        for chunk in self._get_chunks(object_id_list=object_id_list):
+                            queryset = self.filter(
+                                content_type=content_type,
+                                object_id__in=child_model._base_manager.filter(
+                                    **{'{}__pk__in'.format(field_name): chunk}
+                                ).values('pk'), permission_id=permission_id,
+                                role_id=role_id
+                            )
+
+                            child_object_id_list = tuple(
+                                queryset.values_list('object_id', flat=True)
+                            )
+
+                            if child_object_id_list:
+                                queryset.delete()
+                                child_entries.update(
+                                    (object_id, permission_id, role_id) for
+                                    object_id in child_object_id_list
+                                )
+
+                    if child_entries:
+                        removed.setdefault(child_model, set()).update(
+                            entry[0] for entry in child_entries
+                        )
+                        pending.append((child_model, child_entries))
+
+        return removed
+
+    def check_consistency(self, repair=False):
+        """
+        Compare the stored entries of every model with the ones resulting
+        from the ACLs and yield the model with the number of missing and
+        stale entries. Models are processed parents first, so repairing
+        also populates the table from scratch.
+        """
+        content_type_id_list = []
+
+        for model in self._get_models():
+            content_type = ContentType.objects.get_for_model(model=model)
+            content_type_id_list.append(content_type.pk)
+            missing_count = 0
+            stale_count = 0
+
+            object_id_list = model._base_manager.order_by('pk').values_list(
+                'pk', flat=True
+            )
+            for chunk in self._get_chunks(object_id_list=object_id_list):
+                differences = self._get_differences(
+                    content_type=content_type, model=model,
+                    object_id_list=chunk
+                )
+                missing_count += len(differences[1])
+                stale_count += len(differences[2])
+
+                if repair:
+                    self._apply_differences(
+                        content_type=content_type, differences=differences
+                    )
+
+            # Entries of deleted objects.
+            queryset = self.filter(content_type=content_type).exclude(
+                object_id__in=model._base_manager.values('pk')
+            )
+            stale_count += queryset.count()
+            if repair:
+                queryset.delete()
+
+            yield model, missing_count, stale_count
+
+        # Entries of models no longer resolved using the table.
+        queryset = self.exclude(content_type_id__in=content_type_id_list)
+        stale_count = queryset.count()
+        if repair:
+            queryset.delete()
+
+        yield None, 0, stale_count
+
+    def get_object_id_queryset(self, model, stored_permission, user):
+        return self.filter(
+            content_type=ContentType.objects.get_for_model(model=model),
+            permission=stored_permission, role__groups__user=user
+        ).values('object_id')
+
+    def is_enabled_for_model(self, model):
+        return setting_effective_grants_enable.value and (
+            model._meta.concrete_model in ModelPermission.get_effective_grant_models()
+        )
+
+    def refresh_objects(self, model, object_id_list):
+        """
+        Update the entries of the objects. The entries that the
+        descendants inherited from the removed entries are deleted in the
+        same transaction, so revoked access is not visible until the
+        queued refresh runs. Only the addition of the entries inherited
+        from the new entries is queued.
+        """
+        model = model._meta.concrete_model
+
+        if not self.is_enabled_for_model(model=model):
+            return
+
+        content_type = ContentType.objects.get_for_model(model=model)
+        added_object_id_list = set()
+        removed = {}
+
+        with transaction.atomic():
+            for chunk in self._get_chunks(object_id_list=object_id_list):
+                differences = self._get_differences(
+                    content_type=content_type, model=model,
+                    object_id_list=chunk
+                )
+                self._apply_differences(
+                    content_type=content_type, differences=differences
+                )
+
+                added_object_id_list.update(
+                    entry[0] for entry in differences[1]
+                )
+
+                if differences[2]:
+                    descendants = self._remove_descendant_entries(
+                        model=model, entries=differences[2]
+                    )
+                    for descendant_model, descendant_object_id_list in descendants.items():
+                        removed.setdefault(descendant_model, set()).update(
+                            descendant_object_id_list
+                        )
+
+        if added_object_id_list:
+            self._queue_children_refresh(
+                model=model, object_id_list=added_object_id_list
+            )
+
+        for descendant_model, descendant_object_id_list in removed.items():
+            self._queue_refresh(
+                model=descendant_model,
+                object_id_list=sorted(descendant_object_id_list)
+            )
+
+    def remove_object(self, obj):
+        if self.is_enabled_for_model(model=obj._meta.model):
+            self.filter(
+                content_type=ContentType.objects.get_for_model(model=obj),
+                object_id=obj.pk
+            ).delete()
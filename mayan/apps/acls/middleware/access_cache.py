@@ -0,0 +1,14 @@
+from ..classes import AccessCache
+
+
+class AccessCacheMiddleware:
+    """
+    Cache the access decisions made while processing a request, including
+    the rendering of its template response.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with AccessCache.scope():
+            return self.get_response(request)
@@ -0,0 +1,60 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('acls', '0004_auto_20210130_0322'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('permissions', '0004_auto_20191213_0044'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EffectiveGrant',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                ('object_id', models.PositiveIntegerField()),
+                (
+                    'content_type', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+', to='contenttypes.ContentType'
+                    )
+                ),
+                (
+                    'permission', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='effective_grants',
+                        to='permissions.StoredPermission',
+                        verbose_name='Permission'
+                    )
+                ),
+                (
+                    'role', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='effective_grants',
+                        to='permissions.Role', verbose_name='Role'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Effective grant',
+                'verbose_name_plural': 'Effective grants',
+                'unique_together': {
+                    ('content_type', 'object_id', 'role', 'permission')
+                },
+            },
+        ),
+        migrations.AddIndex(
+            model_name='effectivegrant',
+            index=models.Index(
+                fields=['content_type', 'permission', 'object_id'],
+                name='acls_effective_grant_idx'
+            ),
+        ),
+    ]
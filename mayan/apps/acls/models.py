@@ -14,7 +14,7 @@ from mayan.apps.events.decorators import method_event
 from mayan.apps.permissions.models import Role, StoredPermission
 
 from .events import event_acl_created, event_acl_deleted, event_acl_edited
-from .managers import AccessControlListManager
+from .managers import AccessControlListManager, EffectiveGrantManager
 
 logger = logging.getLogger(name=__name__)
 
@@ -121,3 +121,38 @@ class AccessControlList(ExtraDataModelMixin, models.Model):
 class GlobalAccessControlListProxy(AccessControlList):
     class Meta:
         proxy = True
+
+
+class EffectiveGrant(models.Model):
+    """
+    Materialized result of the ACLs and their inheritance. Each entry
+    grants a permission to a role for an object, either directly or
+    through the parents of the object.
+    """
+    content_type = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='+', to=ContentType
+    )
+    object_id = models.PositiveIntegerField()
+    permission = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='effective_grants',
+        to=StoredPermission, verbose_name=_('Permission')
+    )
+    role = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='effective_grants', to=Role,
+        verbose_name=_('Role')
+    )
+
+    objects = EffectiveGrantManager()
+
+    class Meta:
+        indexes = (
+            models.Index(
+                fields=('content_type', 'permission', 'object_id'),
+                name='acls_effective_grant_idx'
+            ),
+        )
+        unique_together = (
+            ('content_type', 'object_id', 'role', 'permission'),
+        )
+        verbose_name = _('Effective grant')
+        verbose_name_plural = _('Effective grants')
@@ -0,0 +1,8 @@
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.common.queues import queue_tools
+
+queue_tools.add_task_type(
+    label=_('Update effective grants'),
+    dotted_path='mayan.apps.acls.tasks.task_effective_grants_refresh'
+)
@@ -0,0 +1,18 @@
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.smart_settings.classes import SettingNamespace
+
+from .literals import DEFAULT_ACLS_EFFECTIVE_GRANTS_ENABLE
+
+namespace = SettingNamespace(label=_('ACLs'), name='acls')
+
+setting_effective_grants_enable = namespace.add_setting(
+    default=DEFAULT_ACLS_EFFECTIVE_GRANTS_ENABLE,
+    global_name='ACLS_EFFECTIVE_GRANTS_ENABLE', help_text=_(
+        'Resolve the access to objects using the table of effective grants '
+        'instead of evaluating the ACLs and their inheritance on each '
+        'query. The table is updated as ACLs and objects change. Populate '
+        'it with the "acls_effective_grants_check --repair" management '
+        'command after enabling this setting.'
+    )
+)
@@ -0,0 +1,25 @@
+from django.apps import apps
+from django.db import OperationalError
+
+from mayan.celery import app
+
+from .literals import EFFECTIVE_GRANTS_TASK_RETRY_DELAY
+
+
+@app.task(
+    bind=True, default_retry_delay=EFFECTIVE_GRANTS_TASK_RETRY_DELAY,
+    ignore_result=True
+)
+def task_effective_grants_refresh(self, app_label, model_name, object_id_list):
+    EffectiveGrant = apps.get_model(
+        app_label='acls', model_name='EffectiveGrant'
+    )
+
+    model = apps.get_model(app_label=app_label, model_name=model_name)
+
+    try:
+        EffectiveGrant.objects.refresh_objects(
+            model=model, object_id_list=object_id_list
+        )
+    except OperationalError as exception:
+        raise self.retry(exc=exception)
@@ -1,6 +1,11 @@
+from django.core.exceptions import PermissionDenied
+
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..classes import ModelPermission
+from ..classes import AccessCache, ModelPermission
+from ..models import AccessControlList
+
+from .mixins import ACLTestMixin
 
 
 class ModelPermissionTestCase(BaseTestCase):
@@ -8,3 +13,63 @@ class ModelPermissionTestCase(BaseTestCase):
         self.assertNotEqual(
             ModelPermission.get_classes(as_content_type=True).count(), 0
         )
+
+
+class AccessCacheTestCase(ACLTestMixin, BaseTestCase):
+    auto_create_acl_test_object = True
+
+    def _check_test_object_access(self, obj):
+        AccessControlList.objects.check_access(
+            obj=obj, permissions=(self.test_permission,),
+            user=self._test_case_user
+        )
+
+    def test_check_access_cached(self):
+        self.grant_access(
+            obj=self.test_object, permission=self.test_permission
+        )
+
+        with AccessCache.scope() as access_cache:
+            self._check_test_object_access(obj=self.test_object)
+
+            with self.assertNumQueries(num=0):
+                self._check_test_object_access(obj=self.test_object)
+
+        self.assertEqual(access_cache.get_statistics()['hits'], 1)
+        self.assertEqual(access_cache.get_statistics()['misses'], 1)
+
+    def test_check_access_registered_objects(self):
+        test_objects = [
+            self.test_object, self.TestModel.objects.create(),
+            self.TestModel.objects.create()
+        ]
+
+        self.grant_access(
+            obj=self.test_object, permission=self.test_permission
+        )
+
+        with AccessCache.scope() as access_cache:
+            AccessCache.register_objects(object_list=test_objects)
+
+            self._check_test_object_access(obj=self.test_object)
+
+            with self.assertNumQueries(num=0):
+                for test_object in test_objects[1:]:
+                    with self.assertRaises(expected_exception=PermissionDenied):
+                        self._check_test_object_access(obj=test_object)
+
+        self.assertEqual(access_cache.get_statistics()['queries'], 1)
+
+    def test_check_access_invalidation(self):
+        with AccessCache.scope():
+            with self.assertRaises(expected_exception=PermissionDenied):
+                self._check_test_object_access(obj=self.test_object)
+
+            self.grant_access(
+                obj=self.test_object, permission=self.test_permission
+            )
+
+            try:
+                self._check_test_object_access(obj=self.test_object)
+            except PermissionDenied:
+                self.fail('PermissionDenied exception was not expected.')
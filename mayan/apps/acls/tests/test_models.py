@@ -2,12 +2,15 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
 from django.db import models
+from django.test import override_settings
+
+import mock
 
 from mayan.apps.events.classes import EventModelRegistry
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..classes import ModelPermission
-from ..models import AccessControlList
+from ..models import AccessControlList, EffectiveGrant
 
 from .mixins import ACLTestMixin
 
@@ -173,6 +176,158 @@ class PermissionTestCase(ACLTestMixin, BaseTestCase):
         self.assertTrue(self.test_acl.get_absolute_url())
 
 
+@override_settings(ACLS_EFFECTIVE_GRANTS_ENABLE=True)
+class EffectiveGrantPermissionTestCase(PermissionTestCase):
+    def _get_test_object_child_restricted_queryset(self):
+        return AccessControlList.objects.restrict_queryset(
+            permission=self.test_permission,
+            queryset=self.TestModelChild._default_manager.all(),
+            user=self._test_case_user
+        )
+
+    def test_child_create_with_inherited_acl(self):
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        test_object_child = self.TestModelChild.objects.create(
+            parent=self.test_object_parent
+        )
+
+        self.assertTrue(
+            test_object_child in self._get_test_object_child_restricted_queryset()
+        )
+
+    def test_child_delete_with_inherited_acl(self):
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        effective_grant_count = EffectiveGrant.objects.count()
+
+        self.test_object_child.delete()
+
+        self.assertEqual(
+            EffectiveGrant.objects.count(), effective_grant_count - 1
+        )
+
+    def test_filtering_with_revoked_inherited_permissions(self):
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+        self.revoke_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        self.assertFalse(
+            self.test_object_child in self._get_test_object_child_restricted_queryset()
+        )
+        self.assertEqual(EffectiveGrant.objects.count(), 0)
+
+    def test_check_consistency(self):
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        EffectiveGrant.objects.filter(
+            object_id=self.test_object_child.pk,
+            content_type=ContentType.objects.get_for_model(
+                model=self.TestModelChild
+            )
+        ).delete()
+
+        self.assertFalse(
+            self.test_object_child in self._get_test_object_child_restricted_queryset()
+        )
+
+        results = {
+            model: (missing_count, stale_count) for
+            model, missing_count, stale_count in
+            EffectiveGrant.objects.check_consistency(repair=True)
+        }
+        self.assertEqual(results[self.TestModelChild], (1, 0))
+        self.assertEqual(results[self.TestModelParent], (0, 0))
+
+        self.assertTrue(
+            self.test_object_child in self._get_test_object_child_restricted_queryset()
+        )
+
+    @mock.patch('mayan.apps.acls.tasks.task_effective_grants_refresh.apply_async')
+    def test_parent_acl_change_queues_children_refresh(self, mock_apply_async):
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        self.assertFalse(
+            self.test_object_child in self._get_test_object_child_restricted_queryset()
+        )
+        self.assertEqual(mock_apply_async.call_count, 1)
+        self.assertEqual(
+            mock_apply_async.call_args[1]['kwargs'], {
+                'app_label': self.TestModelChild._meta.app_label,
+                'model_name': self.TestModelChild._meta.model_name,
+                'object_id_list': [self.test_object_child.pk]
+            }
+        )
+
+    @mock.patch('mayan.apps.acls.tasks.task_effective_grants_refresh.apply_async')
+    def test_parent_acl_revoke_hides_child(self, mock_apply_async):
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+        EffectiveGrant.objects.refresh_objects(
+            model=self.TestModelChild,
+            object_id_list=(self.test_object_child.pk,)
+        )
+        self.assertTrue(
+            self.test_object_child in self._get_test_object_child_restricted_queryset()
+        )
+
+        mock_apply_async.reset_mock()
+
+        self.revoke_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        self.assertFalse(
+            self.test_object_child in self._get_test_object_child_restricted_queryset()
+        )
+        self.assertEqual(EffectiveGrant.objects.count(), 0)
+        self.assertEqual(
+            mock_apply_async.call_args[1]['kwargs']['object_id_list'],
+            [self.test_object_child.pk]
+        )
+
+    def test_parent_acl_revoke_with_child_acl(self):
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+        self.grant_access(
+            obj=self.test_object_child, permission=self.test_permission
+        )
+        self.revoke_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        self.assertTrue(
+            self.test_object_child in self._get_test_object_child_restricted_queryset()
+        )
+
+
 class InheritedPermissionTestCase(ACLTestMixin, BaseTestCase):
     def test_retrieve_inherited_role_permission_not_model_applicable(self):
         self.TestModel = self._create_test_model()
@@ -1,5 +1,6 @@
 import io
 import logging
+import os
 import shutil
 import struct
 
@@ -10,7 +11,7 @@ import sh
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
-from mayan.apps.storage.utils import NamedTemporaryFile
+from mayan.apps.storage.utils import NamedTemporaryFile, fs_cleanup, mkdtemp
 
 from ..classes import ConverterBase
 from ..exceptions import PageCountError
@@ -84,6 +85,54 @@ class Python(ConverterBase):
             finally:
                 new_file_object.close()
 
+    def convert_pages(self, page_number_list):
+        """
+        Rasterize each contiguous range of the requested PDF pages with a
+        single pdftoppm execution using one temporary copy of the
+        source file.
+        """
+        if self.mime_type == 'application/pdf' and pdftoppm:
+            new_file_object = NamedTemporaryFile()
+            output_directory = mkdtemp()
+            try:
+                self.file_object.seek(0)
+                shutil.copyfileobj(
+                    fsrc=self.file_object, fdst=new_file_object
+                )
+                self.file_object.seek(0)
+                new_file_object.flush()
+
+                for first, last in self.get_page_ranges(page_number_list):
+                    pdftoppm(
+                        new_file_object.name,
+                        os.path.join(output_directory, 'page'),
+                        f=first + 1, l=last + 1
+                    )
+
+                    # pdftoppm names the output files <prefix>-<page>.<ext>
+                    # with the page number padded to the width of the
+                    # document's page count.
+                    page_filenames = {}
+                    for filename in os.listdir(output_directory):
+                        name, extension = os.path.splitext(filename)
+                        page_filenames[
+                            int(name.rsplit('-', 1)[1]) - 1
+                        ] = os.path.join(output_directory, filename)
+
+                    for page_number in range(first, last + 1):
+                        filename = page_filenames[page_number]
+                        with open(file=filename, mode='rb') as file_object:
+                            image = Image.open(fp=file_object)
+                            image.load()
+
+                        fs_cleanup(filename=filename)
+                        yield page_number, image
+            finally:
+                new_file_object.close()
+                fs_cleanup(filename=output_directory)
+        else:
+            yield from super().convert_pages(page_number_list=page_number_list)
+
     def get_page_count(self):
         super().get_page_count()
 
@@ -174,6 +223,21 @@ class Python(ConverterBase):
 
             return page_count
 
+    def get_page_ranges(self, page_number_list):
+        """
+        Group a list of page numbers into (first, last) tuples of
+        consecutive page numbers.
+        """
+        page_ranges = []
+
+        for page_number in page_number_list:
+            if page_ranges and page_ranges[-1][1] + 1 == page_number:
+                page_ranges[-1][1] = page_number
+            else:
+                page_ranges.append([page_number, page_number])
+
+        return [tuple(page_range) for page_range in page_ranges]
+
     def get_pdfinfo_page_count(self, file_object):
         process = pdfinfo('-', _in=file_object)
         page_count = int(
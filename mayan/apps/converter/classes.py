@@ -94,6 +94,15 @@ class ConverterBase:
     def convert(self, page_number=DEFAULT_PAGE_NUMBER):
         self.page_number = page_number
 
+    def convert_pages(self, page_number_list):
+        """
+        Convert several pages of the source file object. Yields a tuple of
+        page number and image for each page. Backends able to rasterize a
+        page range in a single pass should override this method.
+        """
+        for page_number in page_number_list:
+            yield page_number, self.convert(page_number=page_number)
+
     def get_page(self, output_format=None):
         output_format = output_format or setting_graphics_backend_arguments.value.get(
             'pillow_format', DEFAULT_PILLOW_FORMAT
@@ -148,6 +157,39 @@ class ConverterBase:
             self.image.seek(page_number)
             self.image.load()
 
+    def seek_pages(self, page_number_list):
+        """
+        Iterate over several pages of the source file object opening or
+        converting the file only once. For each page the page image is
+        made the current image of the converter and the page number
+        is yielded.
+        """
+        # Starting with #0
+        self.file_object.seek(0)
+
+        try:
+            image = Image.open(fp=self.file_object)
+        except IOError:
+            # Cannot identify image file
+            page_images = self.convert_pages(page_number_list=page_number_list)
+
+            for page_number, self.image in page_images:
+                yield page_number
+        except PIL.Image.DecompressionBombError as exception:
+            logger.error(
+                'Unable to seek document page. Increase the value of '
+                'the argument "pillow_maximum_image_pixels" in the '
+                'CONVERTER_GRAPHICS_BACKEND_ARGUMENTS setting; %s',
+                exception
+            )
+            raise
+        else:
+            for page_number in page_number_list:
+                image.seek(page_number)
+                image.load()
+                self.image = image
+                yield page_number
+
     def soffice(self):
         """
         Executes LibreOffice as a sub process
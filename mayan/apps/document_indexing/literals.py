@@ -1 +1,3 @@
+DEFAULT_REBUILD_CHUNK_SIZE = 1000
 DEFAULT_TASK_RETRY_DELAY = 5
+REBUILD_CHUNK_LOCK_EXPIRE = 60 * 30  # Adjust to worst case scenario
@@ -0,0 +1,90 @@
+import time
+
+from django.core import management
+from django.core.management.base import CommandError
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.documents.models import Document
+from mayan.apps.templating.classes import Template
+
+from ...models import IndexTemplate
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Measure the per document cost of evaluating the node templates of '
+        'an index with and without the compiled template cache. Nothing is '
+        'written to the index.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count', action='store', default=100, dest='count', type=int,
+            help=_('Number of documents to evaluate. Defaults to 100.')
+        )
+        parser.add_argument(
+            'slug', action='store',
+            help=_('Slug of the index template to evaluate.')
+        )
+
+    def evaluate(self, documents, template_nodes, cache):
+        start = time.perf_counter()
+
+        for document in documents:
+            for template_node in template_nodes:
+                template_node.evaluate(
+                    document=document, template=Template(
+                        cache=cache, template_string=template_node.expression
+                    )
+                )
+
+        return (time.perf_counter() - start) / len(documents)
+
+    def handle(self, *args, **options):
+        try:
+            index_template = IndexTemplate.objects.get(slug=options['slug'])
+        except IndexTemplate.DoesNotExist:
+            raise CommandError(
+                'Unknown index template: %s' % options['slug']
+            )
+
+        template_nodes = tuple(
+            index_template.node_templates.filter(enabled=True).exclude(
+                pk=index_template.template_root.pk
+            )
+        )
+        documents = tuple(
+            Document.valid.filter(
+                document_type__in=index_template.document_types.all()
+            )[:options['count']]
+        )
+
+        if not documents:
+            raise CommandError('No documents to evaluate.')
+
+        uncached = self.evaluate(
+            cache=False, documents=documents, template_nodes=template_nodes
+        )
+
+        Template.cache_clear()
+        cached = self.evaluate(
+            cache=True, documents=documents, template_nodes=template_nodes
+        )
+        cache_info = Template.get_cache_info()
+
+        self.stdout.write(
+            'Documents: {}; template nodes: {}'.format(
+                len(documents), len(template_nodes)
+            )
+        )
+        self.stdout.write(
+            'Uncached: {:.3f} ms per document'.format(uncached * 1000)
+        )
+        self.stdout.write(
+            'Cached: {:.3f} ms per document'.format(cached * 1000)
+        )
+        self.stdout.write(
+            'Cache hits: {}; misses: {}'.format(
+                cache_info.hits, cache_info.misses
+            )
+        )
@@ -0,0 +1,49 @@
+from django.core import management
+from django.core.management.base import CommandError
+from django.utils.translation import ugettext_lazy as _
+
+from ...models import IndexTemplate
+from ...tasks import task_rebuild_index
+
+
+class Command(management.BaseCommand):
+    help = 'Queue the rebuild of index templates.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--resume', action='store_true', dest='resume',
+            help=_(
+                'Queue only the pending chunks of interrupted rebuilds '
+                'instead of resetting the indexes.'
+            )
+        )
+        parser.add_argument(
+            'slugs', action='store', nargs='*',
+            help=_(
+                'Slugs of the index templates to rebuild. Defaults to all '
+                'the index templates.'
+            )
+        )
+
+    def handle(self, *args, **options):
+        queryset = IndexTemplate.objects.all()
+
+        if options['slugs']:
+            queryset = queryset.filter(slug__in=options['slugs'])
+
+            unknown_slugs = set(options['slugs']) - set(
+                queryset.values_list('slug', flat=True)
+            )
+            if unknown_slugs:
+                raise CommandError(
+                    'Unknown index templates: %s' % ', '.join(
+                        sorted(unknown_slugs)
+                    )
+                )
+
+        for index_template in queryset:
+            task_rebuild_index.apply_async(
+                kwargs={
+                    'index_id': index_template.pk, 'resume': options['resume']
+                }
+            )
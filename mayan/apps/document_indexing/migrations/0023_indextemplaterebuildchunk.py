@@ -0,0 +1,50 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('document_indexing', '0022_indexinstance'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndexTemplateRebuildChunk',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'document_id_start', models.PositiveIntegerField(
+                        verbose_name='Document ID start'
+                    )
+                ),
+                (
+                    'document_id_end', models.PositiveIntegerField(
+                        verbose_name='Document ID end'
+                    )
+                ),
+                (
+                    'completed', models.BooleanField(
+                        default=False, verbose_name='Completed'
+                    )
+                ),
+                (
+                    'index_template', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='rebuild_chunks',
+                        to='document_indexing.IndexTemplate',
+                        verbose_name='Index template'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Index template rebuild chunk',
+                'verbose_name_plural': 'Index template rebuild chunks',
+                'ordering': ('document_id_start',),
+            },
+        ),
+    ]
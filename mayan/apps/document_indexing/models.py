@@ -23,6 +23,8 @@ from .managers import (
     DocumentIndexInstanceNodeManager, IndexTemplateManager,
     IndexInstanceNodeManager
 )
+from .literals import REBUILD_CHUNK_LOCK_EXPIRE
+from .settings import setting_rebuild_chunk_size
 
 logger = logging.getLogger(name=__name__)
 
@@ -101,12 +103,14 @@ class IndexTemplate(ExtraDataModelMixin, models.Model):
 
     def index_document(self, document):
         """
-        Method to start the indexing process for a document. The entire process
-        happens inside one transaction. The document is first removed from all
-        the index nodes to which it already belongs. The different index
+        Method to start the indexing process for a document. The entire
+        process happens inside one transaction. The different index
         templates that match this document's type are evaluated and for each
         result a node is fetched or created and the document is added to that
-        node.
+        node. The resulting nodes are compared with the nodes to which the
+        document already belongs. The document is removed only from the
+        nodes it no longer matches and only the branches of those nodes are
+        checked for empty nodes.
         """
         logger.debug('Index; Indexing document: %s', document)
 
@@ -114,17 +118,155 @@ class IndexTemplate(ExtraDataModelMixin, models.Model):
             # Only index valid documents
             self.initialize_instance_root()
 
+            template_root = self.template_root
+
+            lock = LockingBackend.get_backend().acquire_lock(
+                name=template_root.get_lock_string()
+            )
+
+            try:
+                with transaction.atomic():
+                    index_instance_node_id_list = set(
+                        IndexInstanceNode.objects.filter(
+                            index_template_node__index=self,
+                            documents=document
+                        ).values_list('pk', flat=True)
+                    )
+
+                    index_instance_node_id_list_new = template_root.index_document(
+                        acquire_lock=False, document=document
+                    )
+
+                    index_instance_node_queryset_stale = IndexInstanceNode.objects.filter(
+                        pk__in=index_instance_node_id_list - index_instance_node_id_list_new
+                    )
+
+                    for index_instance_node in index_instance_node_queryset_stale:
+                        index_instance_node.remove_document(document=document)
+                        # Delete the node and its ancestors if they are
+                        # now empty.
+                        index_instance_node.delete_empty()
+            finally:
+                lock.release()
+
+    def index_documents(self, queryset):
+        """
+        Index several documents at once. The templates are evaluated for
+        all the documents first without holding the index lock. The
+        resulting nodes are then looked up level by level, the missing ones
+        are created and the documents are linked in bulk. Documents are
+        only added to nodes, stale memberships are not removed. Used when
+        rebuilding the index.
+        """
+        self.initialize_instance_root()
+
+        template_root = self.template_root
+
+        template_node_children = {}
+        templates = {}
+        for template_node in self.node_templates.filter(enabled=True).exclude(pk=template_root.pk):
+            template_node_children.setdefault(
+                template_node.parent_id, []
+            ).append(template_node)
+            templates[template_node.pk] = Template(
+                template_string=template_node.expression
+            )
+
+        # Paths are tuples of (template node ID, value) pairs starting
+        # from the first level below the root.
+        paths = set()
+        path_documents = {}
+
+        def evaluate(document, parent_template_node_id, parent_path):
+            for template_node in template_node_children.get(parent_template_node_id, ()):
+                result = template_node.evaluate(
+                    document=document, template=templates[template_node.pk]
+                )
+
+                if result:
+                    path = parent_path + ((template_node.pk, result),)
+                    paths.add(path)
+
+                    if template_node.link_documents:
+                        path_documents.setdefault(path, []).append(
+                            document.pk
+                        )
+
+                    evaluate(
+                        document=document,
+                        parent_template_node_id=template_node.pk,
+                        parent_path=path
+                    )
+
+        for document in queryset.iterator():
+            evaluate(
+                document=document, parent_template_node_id=template_root.pk,
+                parent_path=()
+            )
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=template_root.get_lock_string()
+        )
+
+        try:
             with transaction.atomic():
-                # Remove the document from all instance nodes from
-                # this index
-                for index_instance_node in IndexInstanceNode.objects.filter(index_template_node__index=self, documents=document):
-                    index_instance_node.remove_document(document=document)
+                path_node_ids = {
+                    (): template_root.get_instance_root_node().pk
+                }
 
-                # Delete all empty nodes. Starting from the bottom up
-                for index_instance_node in self.instance_root.get_leafnodes():
-                    index_instance_node.delete_empty()
+                depth = 1
+                while True:
+                    level_paths = [path for path in paths if len(path) == depth]
+                    if not level_paths:
+                        break
+
+                    existing_node_ids = {
+                        (parent_id, index_template_node_id, value): pk
+                        for pk, parent_id, index_template_node_id, value in IndexInstanceNode.objects.filter(
+                            parent_id__in=[
+                                path_node_ids[path[:-1]] for path in level_paths
+                            ], index_template_node_id__in=[
+                                path[-1][0] for path in level_paths
+                            ]
+                        ).values_list(
+                            'pk', 'parent_id', 'index_template_node_id',
+                            'value'
+                        )
+                    }
 
-            self.template_root.index_document(document=document)
+                    for path in level_paths:
+                        parent_id = path_node_ids[path[:-1]]
+                        index_template_node_id, value = path[-1]
+
+                        try:
+                            path_node_ids[path] = existing_node_ids[
+                                (parent_id, index_template_node_id, value)
+                            ]
+                        except KeyError:
+                            # Fetch the parent for each insert, the
+                            # tree values change with every insert.
+                            path_node_ids[path] = IndexInstanceNode.objects.create(
+                                index_template_node_id=index_template_node_id,
+                                parent=IndexInstanceNode.objects.get(
+                                    pk=parent_id
+                                ), value=value
+                            ).pk
+
+                    depth += 1
+
+                IndexInstanceNodeDocument = IndexInstanceNode.documents.through
+
+                IndexInstanceNodeDocument.objects.bulk_create(
+                    objs=[
+                        IndexInstanceNodeDocument(
+                            document_id=document_id,
+                            indexinstancenode_id=path_node_ids[path]
+                        ) for path, document_id_list in path_documents.items()
+                        for document_id in document_id_list
+                    ], ignore_conflicts=True
+                )
+        finally:
+            lock.release()
 
     def initialize_instance_root(self):
         return self.template_root.initialize_index_instance_root_node()
@@ -136,29 +278,86 @@ class IndexTemplate(ExtraDataModelMixin, models.Model):
     def natural_key(self):
         return (self.slug,)
 
+    def get_rebuild_progress(self):
+        """
+        Return the percentage of the current rebuild that has completed or
+        None if the index is not being rebuilt.
+        """
+        total = self.rebuild_chunks.count()
+
+        if total:
+            return self.rebuild_chunks.filter(completed=True).count() / total
+    get_rebuild_progress.short_description = _('Rebuild progress')
+
+    def get_rebuild_progress_display(self):
+        progress = self.get_rebuild_progress()
+
+        if progress is None:
+            return _('None')
+        else:
+            return '{:.0%}'.format(progress)
+    get_rebuild_progress_display.short_description = _('Rebuild progress')
+
     def rebuild(self):
         """
         Delete and reconstruct the index by deleting of all its instance nodes
         and recreating them for the documents whose types are associated with
         this index
         """
-        # Delete all index instance nodes by deleting the root index
-        # instance node. All child index instance nodes will be cascade
-        # deleted.
-        try:
-            self.instance_root.delete()
-        except IndexInstanceNode.DoesNotExist:
-            # Empty index, ignore this exception
-            pass
+        for rebuild_chunk in self.rebuild_prepare():
+            rebuild_chunk.process()
 
-        # Create the new root index instance node
-        self.template_root.index_instance_nodes.create()
+    def rebuild_prepare(self, chunk_size=None, resume=False):
+        """
+        Split the documents to index into ranges of document IDs. Return
+        the chunks pending processing. If a previous rebuild was interrupted
+        and `resume` is True the pending chunks of that rebuild are returned
+        without resetting the index.
+        """
+        if resume and self.rebuild_chunks.exists():
+            return self.rebuild_chunks.filter(completed=False)
+
+        chunk_size = chunk_size or setting_rebuild_chunk_size.value
+
+        with transaction.atomic():
+            self.rebuild_chunks.all().delete()
+
+            # Delete all index instance nodes by deleting the root index
+            # instance node. All child index instance nodes will be cascade
+            # deleted.
+            self.reset()
+
+            document_id_list = Document.valid.filter(
+                document_type__in=self.document_types.all()
+            ).order_by('pk').values_list('pk', flat=True)
+
+            rebuild_chunks = []
+            document_id_chunk = []
+            for document_id in document_id_list.iterator():
+                document_id_chunk.append(document_id)
+
+                if len(document_id_chunk) == chunk_size:
+                    rebuild_chunks.append(
+                        IndexTemplateRebuildChunk(
+                            document_id_end=document_id_chunk[-1],
+                            document_id_start=document_id_chunk[0],
+                            index_template=self
+                        )
+                    )
+                    document_id_chunk = []
+
+            if document_id_chunk:
+                rebuild_chunks.append(
+                    IndexTemplateRebuildChunk(
+                        document_id_end=document_id_chunk[-1],
+                        document_id_start=document_id_chunk[0],
+                        index_template=self
+                    )
+                )
+
+            IndexTemplateRebuildChunk.objects.bulk_create(objs=rebuild_chunks)
 
-        # Re-index each document with a type associated with this index
-        for document in Document.objects.filter(document_type__in=self.document_types.all()):
-            # Evaluate each index template node for each document
-            # associated with this index.
-            self.index_document(document=document)
+        return self.rebuild_chunks.filter(completed=False)
 
     def reset(self):
         try:
@@ -247,6 +446,34 @@ class IndexTemplateNode(MPTTModel):
         else:
             return self.expression
 
+    def evaluate(self, document, template=None):
+        """
+        Render the expression of this template node for the document.
+        Return an empty string if the expression fails to render.
+        """
+        logger.debug(
+            'IndexTemplateNode; Evaluating template: %s', self.expression
+        )
+
+        try:
+            template = template or Template(template_string=self.expression)
+            result = template.render(context={'document': document})
+        except Exception as exception:
+            logger.debug('Evaluating error: %s', exception)
+            error_message = _(
+                'Error indexing document: %(document)s; expression: '
+                '%(expression)s; %(exception)s'
+            ) % {
+                'document': document,
+                'expression': self.expression,
+                'exception': exception
+            }
+            logger.debug(error_message)
+            return ''
+        else:
+            logger.debug('Evaluation result: %s', result)
+            return result
+
     def get_lock_string(self):
         return 'indexing:indexing_template_node_{}'.format(self.pk)
 
@@ -254,6 +481,13 @@ class IndexTemplateNode(MPTTModel):
         return self.index_instance_nodes.get(parent=None)
 
     def index_document(self, document, acquire_lock=True, index_instance_node_parent=None):
+        """
+        Evaluate this template node and its children for the document.
+        Return the IDs of the index instance nodes to which the document
+        was linked.
+        """
+        index_instance_node_id_list = set()
+
         # Start transaction after the lock in case the locking backend uses
         # the database.
         try:
@@ -275,9 +509,11 @@ class IndexTemplateNode(MPTTModel):
                         index_instance_root_node = self.get_instance_root_node()
 
                         for child in self.get_children():
-                            child.index_document(
-                                document=document, acquire_lock=False,
-                                index_instance_node_parent=index_instance_root_node
+                            index_instance_node_id_list.update(
+                                child.index_document(
+                                    document=document, acquire_lock=False,
+                                    index_instance_node_parent=index_instance_root_node
+                                )
                             )
                 elif self.enabled:
                     with transaction.atomic():
@@ -287,53 +523,116 @@ class IndexTemplateNode(MPTTModel):
                             'My parent instance node is: %s',
                             index_instance_node_parent
                         )
-                        logger.debug(
-                            'IndexTemplateNode; Evaluating template: %s', self.expression
-                        )
+                        result = self.evaluate(document=document)
 
-                        try:
-                            template = Template(
-                                template_string=self.expression
-                            )
-                            result = template.render(
-                                context={'document': document}
+                        if result:
+                            index_instance_node, created = self.index_instance_nodes.get_or_create(
+                                parent=index_instance_node_parent,
+                                value=result
                             )
-                        except Exception as exception:
-                            logger.debug('Evaluating error: %s', exception)
-                            error_message = _(
-                                'Error indexing document: %(document)s; expression: '
-                                '%(expression)s; %(exception)s'
-                            ) % {
-                                'document': document,
-                                'expression': self.expression,
-                                'exception': exception
-                            }
-                            logger.debug(error_message)
-                        else:
-                            logger.debug('Evaluation result: %s', result)
 
-                            if result:
-                                index_instance_node, created = self.index_instance_nodes.get_or_create(
-                                    parent=index_instance_node_parent,
-                                    value=result
+                            if self.link_documents:
+                                index_instance_node.documents.add(document)
+                                index_instance_node_id_list.add(
+                                    index_instance_node.pk
                                 )
 
-                                if self.link_documents:
-                                    index_instance_node.documents.add(document)
-
-                                for child in self.get_children():
+                            for child in self.get_children():
+                                index_instance_node_id_list.update(
                                     child.index_document(
                                         document=document, acquire_lock=False,
                                         index_instance_node_parent=index_instance_node
                                     )
+                                )
             finally:
                 if acquire_lock:
                     lock.release()
 
+        return index_instance_node_id_list
+
     def initialize_index_instance_root_node(self):
         self.index_instance_nodes.get_or_create(parent=None)
 
 
+class IndexTemplateRebuildChunk(models.Model):
+    """
+    Range of document IDs to index as part of the rebuild of an index.
+    Completed chunks are kept until all the chunks of the rebuild are
+    completed to allow resuming an interrupted rebuild.
+    """
+    index_template = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='rebuild_chunks',
+        to=IndexTemplate, verbose_name=_('Index template')
+    )
+    document_id_start = models.PositiveIntegerField(
+        verbose_name=_('Document ID start')
+    )
+    document_id_end = models.PositiveIntegerField(
+        verbose_name=_('Document ID end')
+    )
+    completed = models.BooleanField(
+        default=False, verbose_name=_('Completed')
+    )
+
+    class Meta:
+        ordering = ('document_id_start',)
+        verbose_name = _('Index template rebuild chunk')
+        verbose_name_plural = _('Index template rebuild chunks')
+
+    def __str__(self):
+        return '{}: {}-{}'.format(
+            self.index_template, self.document_id_start,
+            self.document_id_end
+        )
+
+    def get_lock_string(self):
+        return 'indexing:index_template_rebuild_chunk_{}'.format(self.pk)
+
+    def process(self):
+        """
+        Index the documents of the chunk. Chunks queued more than once when
+        resuming a rebuild are only processed once.
+        """
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self.get_lock_string(), timeout=REBUILD_CHUNK_LOCK_EXPIRE
+        )
+
+        try:
+            try:
+                self.refresh_from_db(fields=('completed',))
+            except IndexTemplateRebuildChunk.DoesNotExist:
+                # The rebuild was restarted or has finished.
+                return
+
+            if self.completed:
+                return
+
+            self.index_template.index_documents(
+                queryset=Document.valid.filter(
+                    document_type__in=self.index_template.document_types.all(),
+                    pk__gte=self.document_id_start,
+                    pk__lte=self.document_id_end
+                )
+            )
+
+            self.completed = True
+            self.save(update_fields=('completed',))
+        finally:
+            lock.release()
+
+        rebuild_chunks = self.index_template.rebuild_chunks.all()
+
+        logger.info(
+            'Index rebuild progress for: %s; %d/%d chunks', self.index_template,
+            rebuild_chunks.filter(completed=True).count(),
+            rebuild_chunks.count()
+        )
+
+        if not rebuild_chunks.filter(completed=False).exists():
+            # Rebuild finished.
+            rebuild_chunks.delete()
+
+
 class IndexInstance(IndexTemplate):
     """
     Model that represents an evaluated index. This is an index whose nodes
@@ -415,14 +714,25 @@ class IndexInstanceNode(MPTTModel):
             raise
         else:
             try:
-                if self.get_documents().count() == 0 and self.get_children().count() == 0:
+                if not self.get_documents().exists() and not self.get_children().exists():
                     if not self.is_root_node():
                         # I'm not a root node, I can be deleted
+                        parent_id = self.parent_id
                         self.delete()
 
-                        if self.parent.is_root_node():
-                            # My parent is not a root node, it can be deleted
-                            self.parent.delete_empty()
+                        try:
+                            # Reload the parent to get the updated tree
+                            # values after the deletion.
+                            parent = IndexInstanceNode.objects.get(
+                                pk=parent_id
+                            )
+                        except IndexInstanceNode.DoesNotExist:
+                            """Parent already deleted."""
+                        else:
+                            if not parent.is_root_node():
+                                # My parent is not a root node, it can be
+                                # deleted if empty.
+                                parent.delete_empty()
             finally:
                 lock.release()
 
@@ -24,3 +24,7 @@ queue_tools.add_task_type(
     label=_('Rebuild index'),
     dotted_path='mayan.apps.document_indexing.tasks.task_rebuild_index'
 )
+queue_tools.add_task_type(
+    label=_('Rebuild index chunk'),
+    dotted_path='mayan.apps.document_indexing.tasks.task_index_rebuild_chunk'
+)
@@ -2,12 +2,20 @@ from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.smart_settings.classes import SettingNamespace
 
-from .literals import DEFAULT_TASK_RETRY_DELAY
+from .literals import DEFAULT_REBUILD_CHUNK_SIZE, DEFAULT_TASK_RETRY_DELAY
 
 namespace = SettingNamespace(
     label=_('Document indexing'), name='document_indexing',
 )
 
+setting_rebuild_chunk_size = namespace.add_setting(
+    default=DEFAULT_REBUILD_CHUNK_SIZE,
+    global_name='DOCUMENT_INDEXING_REBUILD_CHUNK_SIZE', help_text=_(
+        'Number of documents indexed by each task when rebuilding an index. '
+        'The chunks of a rebuild are processed in parallel and an '
+        'interrupted rebuild resumes from the chunks not yet completed.'
+    )
+)
 setting_task_retry = namespace.add_setting(
     default=DEFAULT_TASK_RETRY_DELAY,
     global_name='DOCUMENT_INDEXING_TASK_RETRY_DELAY', help_text=_(
@@ -61,21 +61,56 @@ def task_index_document(self, document_id):
             raise self.retry(exc=exception)
 
 
+@app.task(
+    bind=True, default_retry_delay=setting_task_retry.value, max_retries=None,
+    ignore_result=True
+)
+def task_index_rebuild_chunk(self, rebuild_chunk_id):
+    IndexTemplateRebuildChunk = apps.get_model(
+        app_label='document_indexing', model_name='IndexTemplateRebuildChunk'
+    )
+
+    try:
+        rebuild_chunk = IndexTemplateRebuildChunk.objects.get(
+            pk=rebuild_chunk_id
+        )
+    except IndexTemplateRebuildChunk.DoesNotExist:
+        # The rebuild was restarted or has finished.
+        pass
+    else:
+        try:
+            rebuild_chunk.process()
+        except OperationalError as exception:
+            logger.warning(
+                'Operational error while trying to process index rebuild '
+                'chunk: %s; %s', rebuild_chunk, exception
+            )
+            raise self.retry(exc=exception)
+        except LockError as exception:
+            raise self.retry(exc=exception)
+
+
 @app.task(
     bind=True, default_retry_delay=setting_task_retry.value,
     ignore_result=True
 )
-def task_rebuild_index(self, index_id):
+def task_rebuild_index(self, index_id, resume=False):
     IndexTemplate = apps.get_model(
         app_label='document_indexing', model_name='IndexTemplate'
     )
 
-    try:
-        index = IndexTemplate.objects.get(pk=index_id)
-        index.rebuild()
-    except LockError as exception:
-        # This index is being rebuilt by another task, retry later
-        raise self.retry(exc=exception)
+    index = IndexTemplate.objects.get(pk=index_id)
+
+    # When resuming an interrupted rebuild only its pending chunks are
+    # queued, otherwise the index is reset.
+    rebuild_chunk_id_list = list(
+        index.rebuild_prepare(resume=resume).values_list('pk', flat=True)
+    )
+
+    for rebuild_chunk_id in rebuild_chunk_id_list:
+        task_index_rebuild_chunk.apply_async(
+            kwargs={'rebuild_chunk_id': rebuild_chunk_id}
+        )
 
 
 @app.task(
@@ -0,0 +1,74 @@
+from io import StringIO
+
+from django.core import management
+from django.core.management.base import CommandError
+
+import mock
+
+from mayan.apps.documents.tests.mixins.document_mixins import DocumentTestMixin
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from .literals import TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION
+from .mixins import IndexTemplateTestMixin
+
+
+class IndexBenchmarkManagementCommandTestCase(
+    IndexTemplateTestMixin, DocumentTestMixin, BaseTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_document_stub()
+        self._create_test_index_template(add_test_document_type=True)
+        self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression=TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION,
+            link_documents=True
+        )
+
+    def _call_command(self):
+        output = StringIO()
+        management.call_command(
+            'index_benchmark', self.test_index_template.slug, stdout=output
+        )
+        return output.getvalue()
+
+    def test_index_benchmark_command(self):
+        output = self._call_command()
+
+        self.assertTrue('Cache hits: 0; misses: 1' in output)
+
+
+class IndexRebuildManagementCommandTestCase(
+    IndexTemplateTestMixin, DocumentTestMixin, BaseTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_index_template(add_test_document_type=True)
+
+    @mock.patch('mayan.apps.document_indexing.tasks.task_rebuild_index.apply_async')
+    def test_index_rebuild_command(self, mock_apply_async):
+        management.call_command('index_rebuild', self.test_index_template.slug)
+
+        self.assertEqual(
+            mock_apply_async.call_args[1]['kwargs'], {
+                'index_id': self.test_index_template.pk, 'resume': False
+            }
+        )
+
+    @mock.patch('mayan.apps.document_indexing.tasks.task_rebuild_index.apply_async')
+    def test_index_rebuild_command_resume(self, mock_apply_async):
+        management.call_command('index_rebuild', resume=True)
+
+        self.assertEqual(
+            mock_apply_async.call_args[1]['kwargs'], {
+                'index_id': self.test_index_template.pk, 'resume': True
+            }
+        )
+
+    def test_index_rebuild_command_unknown_slug(self):
+        with self.assertRaises(expected_exception=CommandError):
+            management.call_command('index_rebuild', 'unknown_slug')
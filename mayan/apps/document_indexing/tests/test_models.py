@@ -1,3 +1,6 @@
+import mock
+
+from mayan.apps.documents.models import Document
 from mayan.apps.documents.tests.base import DocumentTestMixin
 from mayan.apps.documents.tests.literals import (
     TEST_DOCUMENT_DESCRIPTION, TEST_DOCUMENT_DESCRIPTION_EDITED,
@@ -6,7 +9,10 @@ from mayan.apps.documents.tests.literals import (
 from mayan.apps.metadata.models import MetadataType, DocumentTypeMetadataType
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..models import IndexInstanceNode, IndexTemplate, IndexTemplateNode
+from ..models import (
+    IndexInstanceNode, IndexTemplate, IndexTemplateNode,
+    IndexTemplateRebuildChunk
+)
 
 from .literals import (
     TEST_INDEX_TEMPLATE_DOCUMENT_DESCRIPTION_EXPRESSION,
@@ -131,6 +137,45 @@ class IndexTestCase(IndexTemplateTestMixin, DocumentTestMixin, BaseTestCase):
             )
         )
 
+    def test_edited_document_empty_branch_deletion(self):
+        self._create_test_document_stub()
+
+        level_1 = self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression=TEST_INDEX_TEMPLATE_DOCUMENT_DESCRIPTION_EXPRESSION,
+            link_documents=False
+        )
+        self.test_index_template.node_templates.create(
+            parent=level_1,
+            expression=TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION,
+            link_documents=True
+        )
+
+        self.test_documents[0].description = TEST_DOCUMENT_DESCRIPTION
+        self.test_documents[0].save()
+        self.test_documents[1].description = TEST_DOCUMENT_DESCRIPTION_EDITED
+        self.test_documents[1].save()
+
+        self.test_documents[0].description = TEST_DOCUMENT_DESCRIPTION_EDITED
+        self.test_documents[0].save()
+
+        # The previous branch of the first document is deleted and the
+        # branch of the second document is reused.
+        self.assertEqual(
+            set(IndexInstanceNode.objects.values_list('value', flat=True)),
+            set(
+                [
+                    '', TEST_DOCUMENT_DESCRIPTION_EDITED,
+                    self.test_documents[0].label, self.test_documents[1].label
+                ]
+            )
+        )
+        self.assertEqual(
+            IndexInstanceNode.objects.filter(
+                value=TEST_DOCUMENT_DESCRIPTION_EDITED
+            ).count(), 1
+        )
+
     def test_metadata_indexing(self):
         metadata_type = MetadataType.objects.create(
             name=TEST_METADATA_TYPE_NAME, label=TEST_METADATA_TYPE_LABEL
@@ -272,5 +317,92 @@ class IndexTestCase(IndexTemplateTestMixin, DocumentTestMixin, BaseTestCase):
             instance_node.documents.all(), [repr(self.test_document)]
         )
 
+    def test_rebuild_resume(self):
+        self._create_test_document_stub()
+
+        level_1 = self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression='{{ document.uuid }}', link_documents=False
+        )
+        self.test_index_template.node_templates.create(
+            parent=level_1,
+            expression=TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION,
+            link_documents=True
+        )
+
+        rebuild_chunks = self.test_index_template.rebuild_prepare(
+            chunk_size=1, resume=False
+        )
+        self.assertEqual(rebuild_chunks.count(), 2)
+
+        rebuild_chunk = rebuild_chunks.first()
+        rebuild_chunk.process()
+        self.assertEqual(self.test_index_template.get_rebuild_progress(), 0.5)
+
+        # Resuming returns only the pending chunk and keeps the nodes of
+        # the completed chunk.
+        rebuild_chunks = self.test_index_template.rebuild_prepare(
+            chunk_size=1, resume=True
+        )
+        self.assertEqual(rebuild_chunks.count(), 1)
+
+        # Test documents use random primary keys, find the document of the
+        # completed chunk.
+        test_document = Document.objects.get(
+            pk=rebuild_chunk.document_id_start
+        )
+        self.assertTrue(
+            test_document in IndexInstanceNode.objects.get(
+                value=test_document.label
+            ).documents.all()
+        )
+
+        rebuild_chunks.first().process()
+
+        self.assertEqual(self.test_index_template.get_rebuild_progress(), None)
+
+        for test_document in self.test_documents:
+            index_instance_node = IndexInstanceNode.objects.get(
+                parent__value=str(test_document.uuid)
+            )
+            self.assertEqual(index_instance_node.value, test_document.label)
+            self.assertQuerysetEqual(
+                index_instance_node.documents.all(), [repr(test_document)]
+            )
+
+    def test_rebuild_chunk_duplicate_process(self):
+        self._create_test_document_stub()
+
+        rebuild_chunks = list(
+            self.test_index_template.rebuild_prepare(chunk_size=1)
+        )
+        rebuild_chunks[0].process()
+
+        # A copy of the chunk queued before it was completed.
+        rebuild_chunk = IndexTemplateRebuildChunk.objects.get(
+            pk=rebuild_chunks[0].pk
+        )
+        rebuild_chunk.completed = False
+
+        with mock.patch.object(
+            IndexTemplate, 'index_documents'
+        ) as mock_index_documents:
+            rebuild_chunk.process()
+
+        self.assertEqual(mock_index_documents.call_count, 0)
+
+    def test_rebuild_reset(self):
+        self._create_test_document_stub()
+
+        self.test_index_template.rebuild_prepare(chunk_size=1)[0].process()
+        self.assertEqual(self.test_index_template.get_rebuild_progress(), 0.5)
+
+        # Not resuming discards the interrupted rebuild.
+        rebuild_chunks = self.test_index_template.rebuild_prepare(
+            chunk_size=1
+        )
+        self.assertEqual(rebuild_chunks.count(), 2)
+        self.assertEqual(self.test_index_template.get_rebuild_progress(), 0)
+
     def test_method_get_absolute_url(self):
         self.assertTrue(self.test_index_template.get_absolute_url())
@@ -4,6 +4,7 @@ from shutil import copyfileobj
 import subprocess
 
 from django.apps import apps
+from django.db import transaction
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
@@ -66,6 +67,62 @@ class Parser:
         for document_file_page in document_file.pages.all():
             self.process_document_file_page(document_file_page=document_file_page)
 
+    def update_document_file_page_contents(self, document_file, content_list):
+        """
+        Store the content of all the pages of a document file updating
+        existing rows and creating the missing ones in bulk. Pages
+        without a matching content entry are stored as empty.
+        """
+        DocumentFilePageContent = apps.get_model(
+            app_label='document_parsing', model_name='DocumentFilePageContent'
+        )
+
+        document_file_pages = tuple(document_file.pages.all())
+
+        if len(content_list) != len(document_file_pages):
+            logger.warning(
+                'Parsed page count (%d) does not match the page count of '
+                'document file: %s (%d)', len(content_list), document_file,
+                len(document_file_pages)
+            )
+
+        existing_contents = {
+            document_file_page_content.document_file_page_id: document_file_page_content
+            for document_file_page_content in DocumentFilePageContent.objects.filter(
+                document_file_page__document_file=document_file
+            )
+        }
+
+        contents_create = []
+        contents_update = []
+
+        for document_file_page in document_file_pages:
+            try:
+                content = content_list[document_file_page.page_number - 1]
+            except IndexError:
+                content = ''
+
+            try:
+                document_file_page_content = existing_contents[
+                    document_file_page.pk
+                ]
+            except KeyError:
+                contents_create.append(
+                    DocumentFilePageContent(
+                        content=content,
+                        document_file_page=document_file_page
+                    )
+                )
+            else:
+                document_file_page_content.content = content
+                contents_update.append(document_file_page_content)
+
+        with transaction.atomic():
+            DocumentFilePageContent.objects.bulk_update(
+                objs=contents_update, fields=('content',)
+            )
+            DocumentFilePageContent.objects.bulk_create(objs=contents_create)
+
     def process_document_file_page(self, document_file_page):
         DocumentFilePageContent = apps.get_model(
             app_label='document_parsing', model_name='DocumentFilePageContent'
@@ -120,45 +177,100 @@ class PopplerParser(Parser):
 
         logger.debug('self.pdftotext_path: %s', self.pdftotext_path)
 
-    def execute(self, file_object, page_number):
-        logger.debug('Parsing PDF page: %d', page_number)
-
+    def _execute_pdftotext(self, file_object, arguments=()):
         temporary_file_object = NamedTemporaryFile()
         copyfileobj(fsrc=file_object, fdst=temporary_file_object)
-        temporary_file_object.seek(0)
-
-        command = []
-        command.append(self.pdftotext_path)
-        command.append('-f')
-        command.append(str(page_number))
-        command.append('-l')
-        command.append(str(page_number))
+        temporary_file_object.flush()
+
+        command = [self.pdftotext_path]
+        command.extend(arguments)
         command.append(temporary_file_object.name)
         command.append('-')
 
-        proc = subprocess.Popen(
-            command, close_fds=True, stderr=subprocess.PIPE,
-            stdout=subprocess.PIPE
-        )
-        return_code = proc.wait()
-        if return_code != 0:
-            logger.error(proc.stderr.readline())
+        try:
+            proc = subprocess.Popen(
+                command, close_fds=True, stderr=subprocess.PIPE,
+                stdout=subprocess.PIPE
+            )
+            # Read the output while the process runs to avoid blocking
+            # on a full pipe when parsing large documents.
+            output, error = proc.communicate()
+        finally:
             temporary_file_object.close()
 
+        if proc.returncode != 0:
+            logger.error(force_text(s=error))
             raise ParserError
 
-        output = proc.stdout.read()
-        temporary_file_object.close()
+        return output
 
-        if output == b'\x0c':
+    def _get_page_content(self, output):
+        if output in (b'', b'\x0c'):
             logger.debug('Parser didn\'t return any output')
             return ''
 
         if output[-3:] == b'\x0a\x0a\x0c':
             return force_text(s=output[:-3])
 
+        if output[-2:] == b'\x0a\x0a':
+            return force_text(s=output[:-2])
+
         return force_text(s=output)
 
+    def execute(self, file_object, page_number):
+        logger.debug('Parsing PDF page: %d', page_number)
+
+        output = self._execute_pdftotext(
+            arguments=('-f', str(page_number), '-l', str(page_number)),
+            file_object=file_object
+        )
+
+        return self._get_page_content(output=output)
+
+    def execute_document(self, file_object):
+        """
+        Parse all the pages with a single pdftotext call. pdftotext
+        terminates every page with a form feed.
+        """
+        logger.debug('Parsing PDF document')
+
+        output = self._execute_pdftotext(file_object=file_object)
+
+        return [
+            self._get_page_content(output=page_output)
+            for page_output in output.split(b'\x0c')[:-1]
+        ]
+
+    def process_document_file(self, document_file):
+        """
+        Parse the entire document file in one pass. Use
+        process_document_file_page for targeted re-parsing of individual
+        pages.
+        """
+        logger.info(
+            'Starting parsing for document file: %s', document_file
+        )
+
+        file_object = document_file.get_intermediate_file()
+
+        try:
+            content_list = self.execute_document(file_object=file_object)
+            self.update_document_file_page_contents(
+                content_list=content_list, document_file=document_file
+            )
+        except ParserError:
+            raise
+        except Exception as exception:
+            error_message = _('Exception parsing document file; %s') % exception
+            logger.error(error_message, exc_info=True)
+            raise ParserError(error_message)
+        finally:
+            file_object.close()
+
+        logger.info(
+            'Finished parsing document file: %s', document_file
+        )
+
 
 Parser.register(
     mimetypes=('application/pdf',),
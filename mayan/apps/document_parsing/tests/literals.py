@@ -1,2 +1,3 @@
 TEST_DOCUMENT_CONTENT = 'Sample text'
 TEST_PARSING_INDEX_NODE_TEMPLATE = '{% if "sample" in document.file_latest.content|join:" "|lower %}sample{% endif %}'
+TEST_DOCUMENT_PAGE_CONTENT_LIST = ('Page one', 'Page two')
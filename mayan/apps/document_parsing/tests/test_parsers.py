@@ -1,9 +1,12 @@
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
-from mayan.apps.documents.tests.literals import TEST_HYBRID_DOCUMENT
+from mayan.apps.documents.tests.literals import (
+    TEST_HYBRID_DOCUMENT, TEST_MULTI_PAGE_TIFF
+)
 
-from ..parsers import PopplerParser
+from ..models import DocumentFilePageContent
+from ..parsers import Parser, PopplerParser
 
-from .literals import TEST_DOCUMENT_CONTENT
+from .literals import TEST_DOCUMENT_CONTENT, TEST_DOCUMENT_PAGE_CONTENT_LIST
 
 
 class ParserTestCase(GenericDocumentTestCase):
@@ -17,3 +20,26 @@ class ParserTestCase(GenericDocumentTestCase):
         self.assertTrue(
             TEST_DOCUMENT_CONTENT in self.test_document_file.pages.first().content.content
         )
+
+
+class ParserPageContentTestCase(GenericDocumentTestCase):
+    test_document_filename = TEST_MULTI_PAGE_TIFF
+
+    def test_update_document_file_page_contents(self):
+        test_document_file_pages = self.test_document_file.pages.all()
+
+        DocumentFilePageContent.objects.create(
+            content='old', document_file_page=test_document_file_pages[0]
+        )
+
+        Parser().update_document_file_page_contents(
+            content_list=TEST_DOCUMENT_PAGE_CONTENT_LIST,
+            document_file=self.test_document_file
+        )
+
+        self.assertEqual(
+            [
+                document_file_page.content.content
+                for document_file_page in self.test_document_file.pages.all()
+            ], list(TEST_DOCUMENT_PAGE_CONTENT_LIST)
+        )
@@ -1,5 +1,5 @@
 from django.apps import apps
-from django.db.models.signals import post_migrate, post_save
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.acls.classes import ModelPermission
@@ -13,7 +13,10 @@ from mayan.apps.common.menus import (
     menu_related, menu_secondary, menu_setup, menu_tools
 )
 from mayan.apps.documents.links.document_type_links import link_document_type_list
-from mayan.apps.events.classes import EventModelRegistry, ModelEventType
+from mayan.apps.events.classes import (
+    EventModelRegistry, EventType, ModelEventType
+)
+from mayan.apps.events.signals import signal_post_events_commit
 from mayan.apps.logging.classes import ErrorLog
 from mayan.apps.logging.permissions import permission_error_log_view
 from mayan.apps.navigation.classes import SourceColumn
@@ -23,7 +26,8 @@ from .classes import DocumentStateHelper, WorkflowAction
 from .events import event_workflow_template_edited
 from .handlers import (
     handler_create_workflow_image_cache, handler_index_document,
-    handler_launch_workflow, handler_trigger_transition
+    handler_launch_workflow, handler_trigger_transition,
+    handler_update_workflow_instance_current_states
 )
 from .html_widgets import WorkflowLogExtraDataWidget, widget_transition_events
 from .links import (
@@ -74,9 +78,6 @@ class DocumentStatesApp(MayanAppConfig):
     def ready(self):
         super().ready()
 
-        Action = apps.get_model(
-            app_label='actstream', model_name='Action'
-        )
         Document = apps.get_model(
             app_label='documents', model_name='Document'
         )
@@ -600,8 +601,13 @@ class DocumentStatesApp(MayanAppConfig):
             receiver=handler_index_document,
             sender=WorkflowInstanceLogEntry
         )
-        post_save.connect(
+        post_delete.connect(
+            dispatch_uid='workflows_handler_update_workflow_instance_current_states',
+            receiver=handler_update_workflow_instance_current_states,
+            sender=WorkflowTransition
+        )
+        signal_post_events_commit.connect(
             dispatch_uid='workflows_handler_trigger_transition',
             receiver=handler_trigger_transition,
-            sender=Action
+            sender=EventType
         )
@@ -26,6 +26,19 @@ def handler_index_document(sender, **kwargs):
     )
 
 
+def handler_update_workflow_instance_current_states(sender, **kwargs):
+    WorkflowInstance = apps.get_model(
+        app_label='document_states', model_name='WorkflowInstance'
+    )
+
+    # The last transition of the workflow instances whose latest log
+    # entry was deleted along with the transition is set to null but the
+    # datetime is kept.
+    WorkflowInstance.objects.filter(
+        last_transition__isnull=True, last_transition_datetime__isnull=False
+    ).update_current_states()
+
+
 def handler_launch_workflow(sender, instance, created, **kwargs):
     if created:
         task_launch_all_workflow_for.apply_async(
@@ -33,41 +46,87 @@ def handler_launch_workflow(sender, instance, created, **kwargs):
         )
 
 
-def handler_trigger_transition(sender, **kwargs):
-    action = kwargs['instance']
-
+def handler_trigger_transition(sender, action_list, **kwargs):
+    """
+    Perform the transitions triggered by a list of committed events. The
+    trigger transitions and the workflow instances of all the documents
+    of the list are fetched with one query each.
+    """
+    ContentType = apps.get_model(
+        app_label='contenttypes', model_name='ContentType'
+    )
     Document = apps.get_model(
         app_label='documents', model_name='Document'
     )
     WorkflowInstance = apps.get_model(
         app_label='document_states', model_name='WorkflowInstance'
     )
-    WorkflowTransition = apps.get_model(
-        app_label='document_states', model_name='WorkflowTransition'
+    WorkflowTransitionTriggerEvent = apps.get_model(
+        app_label='document_states',
+        model_name='WorkflowTransitionTriggerEvent'
     )
 
-    trigger_transitions = WorkflowTransition.objects.filter(
-        trigger_events__event_type__name=kwargs['instance'].verb
-    )
+    document_content_type = ContentType.objects.get_for_model(model=Document)
 
-    if isinstance(action.target, Document):
-        workflow_instances = WorkflowInstance.objects.filter(
-            workflow__transitions__in=trigger_transitions, document=action.target
-        ).distinct()
-    elif isinstance(action.action_object, Document):
-        workflow_instances = WorkflowInstance.objects.filter(
-            workflow__transitions__in=trigger_transitions, document=action.action_object
-        ).distinct()
-    else:
-        workflow_instances = WorkflowInstance.objects.none()
-
-    for workflow_instance in workflow_instances:
-        # Select the first transition that is valid for this workflow state
-        valid_transitions = list(
-            set(trigger_transitions) & set(workflow_instance.get_transition_choices())
+    # List of tuples of action and document ID. The target takes
+    # precedence over the action object.
+    document_actions = []
+    for action in action_list:
+        if action.target_content_type_id == document_content_type.pk:
+            document_id = action.target_object_id
+        elif action.action_object_content_type_id == document_content_type.pk:
+            document_id = action.action_object_object_id
+        else:
+            continue
+
+        document_actions.append(
+            (action, Document._meta.pk.to_python(document_id))
         )
-        if valid_transitions:
-            workflow_instance.do_transition(
-                comment=_('Event trigger: %s') % EventType.get(name=action.verb).label,
-                transition=valid_transitions[0]
+
+    if not document_actions:
+        return
+
+    trigger_transitions = {}
+    queryset = WorkflowTransitionTriggerEvent.objects.filter(
+        event_type__name__in={
+            action.verb for action, document_id in document_actions
+        }
+    ).select_related('event_type', 'transition')
+
+    for trigger_event in queryset:
+        trigger_transitions.setdefault(
+            trigger_event.event_type.name, set()
+        ).add(trigger_event.transition)
+
+    if not trigger_transitions:
+        return
+
+    workflow_instances = {}
+    queryset = WorkflowInstance.objects.filter(
+        document_id__in={
+            document_id for action, document_id in document_actions
+        },
+        workflow__transitions__in=set().union(*trigger_transitions.values())
+    ).distinct()
+
+    for workflow_instance in queryset:
+        workflow_instances.setdefault(
+            workflow_instance.document_id, []
+        ).append(workflow_instance)
+
+    for action, document_id in document_actions:
+        if action.verb not in trigger_transitions:
+            continue
+
+        for workflow_instance in workflow_instances.get(document_id, ()):
+            # Select the first transition that is valid for this workflow state
+            valid_transitions = list(
+                trigger_transitions[action.verb] & set(
+                    workflow_instance.get_transition_choices()
+                )
             )
+            if valid_transitions:
+                workflow_instance.do_transition(
+                    comment=_('Event trigger: %s') % EventType.get(name=action.verb).label,
+                    transition=valid_transitions[0]
+                )
@@ -0,0 +1,18 @@
+from django.core import management
+
+from ...models import WorkflowInstance
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Calculate the current state of all the workflow instances from '
+        'their log entries. Used to populate or repair the stored current '
+        'state.'
+    )
+
+    def handle(self, *args, **options):
+        count = WorkflowInstance.objects.update_current_states()
+
+        self.stdout.write(
+            'Workflow instances updated: {}'.format(count)
+        )
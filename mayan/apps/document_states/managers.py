@@ -1,4 +1,6 @@
+from django.apps import apps
 from django.db import models
+from django.db.models import OuterRef, Subquery
 
 
 class WorkflowManager(models.Manager):
@@ -8,6 +10,38 @@ class WorkflowManager(models.Manager):
                 workflow_template.launch_for(document=document)
 
 
+class WorkflowInstanceQuerySet(models.QuerySet):
+    def update_current_states(self):
+        """
+        Calculate the current state, last transition and last transition
+        datetime of the workflow instances from their latest log entry
+        using a single update query. Used to populate the fields and to
+        repair them after log entries are deleted.
+        """
+        WorkflowInstanceLogEntry = apps.get_model(
+            app_label='document_states',
+            model_name='WorkflowInstanceLogEntry'
+        )
+
+        latest_log_entries = WorkflowInstanceLogEntry.objects.filter(
+            workflow_instance=OuterRef('pk')
+        ).order_by('-datetime', '-pk')
+
+        return self.update(
+            last_transition=Subquery(
+                queryset=latest_log_entries.values('transition')[:1]
+            ),
+            last_transition_datetime=Subquery(
+                queryset=latest_log_entries.values('datetime')[:1]
+            ),
+            state=Subquery(
+                queryset=latest_log_entries.values(
+                    'transition__destination_state'
+                )[:1]
+            )
+        )
+
+
 class ValidWorkflowInstanceManager(models.Manager):
     def get_queryset(self):
         return models.QuerySet(
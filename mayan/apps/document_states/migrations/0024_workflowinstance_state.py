@@ -0,0 +1,85 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def operation_update_workflow_instance_current_states(apps, schema_editor):
+    WorkflowInstance = apps.get_model(
+        app_label='document_states', model_name='WorkflowInstance'
+    )
+    WorkflowInstanceLogEntry = apps.get_model(
+        app_label='document_states', model_name='WorkflowInstanceLogEntry'
+    )
+
+    latest_log_entries = WorkflowInstanceLogEntry.objects.using(
+        alias=schema_editor.connection.alias
+    ).filter(
+        workflow_instance=OuterRef('pk')
+    ).order_by('-datetime', '-pk')
+
+    WorkflowInstance.objects.using(
+        alias=schema_editor.connection.alias
+    ).update(
+        last_transition=Subquery(
+            queryset=latest_log_entries.values('transition')[:1]
+        ),
+        last_transition_datetime=Subquery(
+            queryset=latest_log_entries.values('datetime')[:1]
+        ),
+        state=Subquery(
+            queryset=latest_log_entries.values(
+                'transition__destination_state'
+            )[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('document_states', '0023_auto_20200930_0726'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workflowinstance',
+            name='last_transition',
+            field=models.ForeignKey(
+                blank=True, null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name='+', to='document_states.WorkflowTransition',
+                verbose_name='Last transition'
+            ),
+        ),
+        migrations.AddField(
+            model_name='workflowinstance',
+            name='last_transition_datetime',
+            field=models.DateTimeField(
+                blank=True, null=True,
+                verbose_name='Last transition datetime'
+            ),
+        ),
+        migrations.AddField(
+            model_name='workflowinstance',
+            name='state',
+            field=models.ForeignKey(
+                blank=True, help_text='Destination state of the last '
+                'transition. Empty when the workflow instance is at the '
+                'initial state.', null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name='workflow_instances',
+                to='document_states.WorkflowState',
+                verbose_name='Current state'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='workflowinstance',
+            index=models.Index(
+                fields=['workflow', 'state'],
+                name='document_states_wi_state_idx'
+            ),
+        ),
+        migrations.RunPython(
+            code=operation_update_workflow_instance_current_states,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
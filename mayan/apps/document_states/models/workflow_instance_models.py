@@ -3,7 +3,7 @@ import logging
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.urls import reverse
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
@@ -11,10 +11,11 @@ from django.utils.translation import ugettext_lazy as _
 from mayan.apps.acls.models import AccessControlList
 from mayan.apps.documents.models import Document
 
-from ..managers import ValidWorkflowInstanceManager
+from ..managers import ValidWorkflowInstanceManager, WorkflowInstanceQuerySet
 from ..permissions import permission_workflow_instance_transition
 
 from .workflow_models import Workflow
+from .workflow_state_models import WorkflowState
 from .workflow_transition_models import (
     WorkflowTransition, WorkflowTransitionField
 )
@@ -35,11 +36,32 @@ class WorkflowInstance(models.Model):
     context = models.TextField(
         blank=True, verbose_name=_('Context')
     )
+    state = models.ForeignKey(
+        blank=True, help_text=_(
+            'Destination state of the last transition. Empty when the '
+            'workflow instance is at the initial state.'
+        ), null=True, on_delete=models.SET_NULL,
+        related_name='workflow_instances', to=WorkflowState,
+        verbose_name=_('Current state')
+    )
+    last_transition = models.ForeignKey(
+        blank=True, null=True, on_delete=models.SET_NULL, related_name='+',
+        to=WorkflowTransition, verbose_name=_('Last transition')
+    )
+    last_transition_datetime = models.DateTimeField(
+        blank=True, null=True, verbose_name=_('Last transition datetime')
+    )
 
-    objects = models.Manager()
+    objects = WorkflowInstanceQuerySet.as_manager()
     valid = ValidWorkflowInstanceManager()
 
     class Meta:
+        indexes = (
+            models.Index(
+                fields=('workflow', 'state'),
+                name='document_states_wi_state_idx'
+            ),
+        )
         ordering = ('workflow',)
         unique_together = ('document', 'workflow')
         verbose_name = _('Workflow instance')
@@ -101,10 +123,7 @@ class WorkflowInstance(models.Model):
         archived; this field will tell at the current state where the
         document is right now.
         """
-        try:
-            return self.get_last_transition().destination_state
-        except AttributeError:
-            return self.workflow.get_initial_state()
+        return self.state or self.workflow.get_initial_state()
 
     def get_last_log_entry(self):
         try:
@@ -117,10 +136,7 @@ class WorkflowInstance(models.Model):
         Last Transition - The last transition used by the last user to put
         the document in the actual state.
         """
-        try:
-            return self.get_last_log_entry().transition
-        except AttributeError:
-            return None
+        return self.last_transition
 
     def get_runtime_context(self):
         """
@@ -161,6 +177,11 @@ class WorkflowInstance(models.Model):
         """
         return json.loads(s=self.context or '{}')
 
+    def set_current_state(self, transition):
+        self.last_transition = transition
+        self.state = transition.destination_state
+        self.save(update_fields=('last_transition', 'state'))
+
 
 class WorkflowInstanceLogEntry(models.Model):
     """
@@ -222,7 +243,25 @@ class WorkflowInstanceLogEntry(models.Model):
         return json.loads(s=self.extra_data or '{}')
 
     def save(self, *args, **kwargs):
-        result = super().save(*args, **kwargs)
+        is_new = self._state.adding
+
+        with transaction.atomic():
+            if is_new:
+                # Store the new current state before saving the entry to
+                # make it available to the receivers of the post_save
+                # signal and to the state actions.
+                self.workflow_instance.set_current_state(
+                    transition=self.transition
+                )
+
+            result = super().save(*args, **kwargs)
+
+            if is_new:
+                self.workflow_instance.last_transition_datetime = self.datetime
+                self.workflow_instance.save(
+                    update_fields=('last_transition_datetime',)
+                )
+
         context = self.workflow_instance.get_context()
         context.update(
             {
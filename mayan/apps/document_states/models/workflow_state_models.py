@@ -2,11 +2,10 @@ import hashlib
 import json
 import logging
 
-from django.apps import apps
 from django.conf import settings
 from django.core import serializers
 from django.db import models
-from django.db.models import F, Max, Q
+from django.db.models import Q
 from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
@@ -95,34 +94,20 @@ class WorkflowState(ExtraDataModelMixin, models.Model):
         return self.actions.filter(when=WORKFLOW_ACTION_ON_EXIT)
 
     def get_documents(self):
-        WorkflowInstanceLogEntry = apps.get_model(
-            app_label='document_states',
-            model_name='WorkflowInstanceLogEntry'
-        )
+        query = Q(workflows__state=self)
 
-        latest_entries = WorkflowInstanceLogEntry.objects.annotate(
-            max_datetime=Max(
-                'workflow_instance__log_entries__datetime'
+        if self.initial:
+            # Workflow instances without transitions are at the initial
+            # state.
+            query |= Q(
+                workflows__state__isnull=True,
+                workflows__workflow=self.workflow_id
             )
-        ).filter(
-            datetime=F('max_datetime')
-        )
 
-        state_latest_entries = latest_entries.filter(
-            transition__destination_state=self
-        )
-
-        return Document.valid.filter(
-            Q(
-                workflows__pk__in=state_latest_entries.values_list(
-                    'workflow_instance', flat=True
-                )
-            ) | Q(
-                workflows__log_entries__isnull=True,
-                workflows__workflow__states=self,
-                workflows__workflow__states__initial=True
-            )
-        ).distinct()
+        # A document has a single instance of each workflow, both
+        # conditions are evaluated on the same join and no duplicates
+        # are possible.
+        return Document.valid.filter(query)
 
     def get_hash(self):
         result = hashlib.sha256(
@@ -5,6 +5,8 @@ from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.events.classes import EventType
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..models import WorkflowInstance
+
 from .literals import (
     TEST_DOCUMENT_EDIT_WORKFLOW_TEMPLATE_STATE_ACTION_DOTTED_PATH,
     TEST_DOCUMENT_EDIT_WORKFLOW_TEMPLATE_STATE_ACTION_TEXT_LABEL,
@@ -51,6 +53,133 @@ class WorkflowInstanceModelTestCase(
 
         self.assertEqual(self.test_document.workflows.count(), 0)
 
+    def test_workflow_instance_current_state(self):
+        self._create_test_document_stub()
+
+        self.test_workflow_instance = self.test_document.workflows.first()
+
+        self.assertEqual(self.test_workflow_instance.state, None)
+        self.assertEqual(
+            self.test_workflow_instance.get_current_state(),
+            self.test_workflow_template_states[0]
+        )
+
+        log_entry = self.test_workflow_instance.do_transition(
+            transition=self.test_workflow_template_transition
+        )
+
+        self.test_workflow_instance.refresh_from_db()
+        self.assertEqual(
+            self.test_workflow_instance.state,
+            self.test_workflow_template_states[1]
+        )
+        self.assertEqual(
+            self.test_workflow_instance.last_transition,
+            self.test_workflow_template_transition
+        )
+        self.assertEqual(
+            self.test_workflow_instance.last_transition_datetime,
+            log_entry.datetime
+        )
+
+    def test_workflow_instance_current_state_transition_delete(self):
+        self._create_test_document_stub()
+
+        self.test_workflow_instance = self.test_document.workflows.first()
+        self.test_workflow_instance.do_transition(
+            transition=self.test_workflow_template_transition
+        )
+
+        self.test_workflow_template_transition.delete()
+
+        self.test_workflow_instance.refresh_from_db()
+        self.assertEqual(self.test_workflow_instance.state, None)
+        self.assertEqual(
+            self.test_workflow_instance.last_transition_datetime, None
+        )
+        self.assertEqual(
+            self.test_workflow_instance.get_current_state(),
+            self.test_workflow_template_states[0]
+        )
+
+    def test_workflow_instance_update_current_states(self):
+        self._create_test_document_stub()
+
+        self.test_workflow_instance = self.test_document.workflows.first()
+        log_entry = self.test_workflow_instance.do_transition(
+            transition=self.test_workflow_template_transition
+        )
+
+        WorkflowInstance.objects.update(
+            last_transition=None, last_transition_datetime=None, state=None
+        )
+
+        WorkflowInstance.objects.update_current_states()
+
+        self.test_workflow_instance.refresh_from_db()
+        self.assertEqual(
+            self.test_workflow_instance.state,
+            self.test_workflow_template_states[1]
+        )
+        self.assertEqual(
+            self.test_workflow_instance.last_transition,
+            self.test_workflow_template_transition
+        )
+        self.assertEqual(
+            self.test_workflow_instance.last_transition_datetime,
+            log_entry.datetime
+        )
+
+    def test_workflow_state_get_documents(self):
+        self._create_test_document_stub()
+
+        self.test_workflow_instance = self.test_document.workflows.first()
+
+        self.assertEqual(
+            list(self.test_workflow_template_states[0].get_documents()),
+            [self.test_document]
+        )
+        self.assertEqual(
+            self.test_workflow_template_states[1].get_documents().count(), 0
+        )
+
+        self.test_workflow_instance.do_transition(
+            transition=self.test_workflow_template_transition
+        )
+
+        self.assertEqual(
+            self.test_workflow_template_states[0].get_documents().count(), 0
+        )
+        self.assertEqual(
+            list(self.test_workflow_template_states[1].get_documents()),
+            [self.test_document]
+        )
+
+    def test_workflow_template_transition_event_trigger_bulk(self):
+        self._create_test_document_stub()
+
+        self.test_workflow_instance = self.test_document.workflows.first()
+
+        EventType.refresh()
+
+        self.test_workflow_template_transition.trigger_events.create(
+            event_type=event_document_edited.get_stored_event_type()
+        )
+
+        event_document_edited.commit_bulk(
+            event_list=(
+                (self._test_case_user, None, self.test_document),
+                (self._test_case_user, None, self.test_document),
+            )
+        )
+
+        self.test_workflow_instance.refresh_from_db()
+        self.assertEqual(
+            self.test_workflow_instance.get_current_state(),
+            self.test_workflow_template_states[1]
+        )
+        self.assertEqual(self.test_workflow_instance.log_entries.count(), 1)
+
     def test_workflow_template_transition_no_condition(self):
         self._create_test_document_stub()
 
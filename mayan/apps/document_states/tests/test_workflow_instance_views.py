@@ -192,6 +192,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_selection_get_view()
         self.assertEqual(response.status_code, 404)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -218,6 +219,7 @@ class WorkflowInstanceTransitionViewTestCase(
             status_code=200
         )
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -237,6 +239,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_selection_get_view()
         self.assertEqual(response.status_code, 404)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -267,6 +270,7 @@ class WorkflowInstanceTransitionViewTestCase(
             status_code=200
         )
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -286,6 +290,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_selection_get_view()
         self.assertEqual(response.status_code, 404)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -316,6 +321,7 @@ class WorkflowInstanceTransitionViewTestCase(
             status_code=200
         )
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -341,6 +347,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_selection_get_view()
         self.assertEqual(response.status_code, 404)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -355,6 +362,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_selection_post_view()
         self.assertEqual(response.status_code, 404)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -374,6 +382,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_selection_post_view()
         self.assertEqual(response.status_code, 200)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -397,6 +406,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_selection_post_view()
         self.assertEqual(response.status_code, 302)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -416,6 +426,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_selection_post_view()
         self.assertEqual(response.status_code, 404)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -439,6 +450,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_selection_post_view()
         self.assertEqual(response.status_code, 302)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -464,6 +476,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_selection_post_view()
         self.assertEqual(response.status_code, 404)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -478,6 +491,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_execute_view()
         self.assertEqual(response.status_code, 404)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -497,6 +511,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_execute_view()
         self.assertEqual(response.status_code, 404)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -516,6 +531,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_execute_view()
         self.assertEqual(response.status_code, 404)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -539,6 +555,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_execute_view()
         self.assertEqual(response.status_code, 302)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[1]
@@ -558,6 +575,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_execute_view()
         self.assertEqual(response.status_code, 404)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -581,6 +599,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_execute_view()
         self.assertEqual(response.status_code, 302)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[1]
@@ -606,6 +625,7 @@ class WorkflowInstanceTransitionViewTestCase(
         response = self._request_test_workflow_instance_transition_execute_view()
         self.assertEqual(response.status_code, 404)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
@@ -651,6 +671,7 @@ class WorkflowInstanceTransitionFieldViewTestCase(
         response = self._request_test_workflow_instance_transition_execute_view()
         self.assertEqual(response.status_code, 302)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[1]
@@ -676,6 +697,7 @@ class WorkflowInstanceTransitionFieldViewTestCase(
         response = self._request_test_workflow_instance_transition_execute_view()
         self.assertEqual(response.status_code, 404)
 
+        self.test_workflow_instance.refresh_from_db()
         self.assertEqual(
             self.test_workflow_instance.get_current_state(),
             self.test_workflow_template_states[0]
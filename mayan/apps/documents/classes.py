@@ -7,8 +7,8 @@ from django.utils.translation import ugettext_lazy as _
 from django.utils.text import format_lazy
 
 __all__ = (
-    'BaseDocumentFilenameGenerator', 'OriginalDocumentFilenameGenerator',
-    'UUIDDocumentFilenameGenerator'
+    'BaseDocumentFilenameGenerator', 'DocumentFileIngestStream',
+    'OriginalDocumentFilenameGenerator', 'UUIDDocumentFilenameGenerator'
 )
 
 
@@ -52,6 +52,67 @@ class BaseDocumentFilenameGenerator:
         raise NotImplementedError
 
 
+class DocumentFileIngestStream:
+    """
+    Wrapper for the source file object of a new document file. Calculates
+    the checksum and keeps the header used to detect the MIME type while
+    the storage backend reads the content, avoiding reading the file back
+    from the storage. Data read again after seeking back is not hashed
+    twice.
+    """
+    def __init__(self, file_object, hash_object, header_size):
+        self.file_object = file_object
+        self.hash_object = hash_object
+        self.hashed_size = 0
+        self.header = bytearray()
+        self.header_size = header_size
+        self.is_complete = False
+        self.is_sequential = True
+
+    def __getattr__(self, name):
+        return getattr(self.file_object, name)
+
+    def finish(self):
+        """
+        Read the remainder of the content not consumed by the storage
+        backend. Returns False if the content was not read sequentially
+        and the results are not usable.
+        """
+        if self.is_sequential and not self.is_complete:
+            self.file_object.seek(self.hashed_size)
+
+            while self.read(65535):
+                """Read until the end of the content."""
+
+        return self.is_sequential
+
+    def get_checksum(self):
+        return force_text(s=self.hash_object.hexdigest())
+
+    def read(self, size=-1):
+        position = self.file_object.tell()
+        data = self.file_object.read(size)
+
+        if position > self.hashed_size:
+            # Data was skipped, the hash can no longer be calculated.
+            self.is_sequential = False
+        elif data:
+            if position + len(data) > self.hashed_size:
+                data_new = data[self.hashed_size - position:]
+                self.hash_object.update(data_new)
+
+                if len(self.header) < self.header_size:
+                    self.header.extend(
+                        data_new[:self.header_size - len(self.header)]
+                    )
+
+                self.hashed_size += len(data_new)
+        elif size != 0 and position == self.hashed_size:
+            self.is_complete = True
+
+        return data
+
+
 class OriginalDocumentFilenameGenerator(BaseDocumentFilenameGenerator):
     name = 'original'
     label = _('Original')
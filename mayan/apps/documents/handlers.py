@@ -9,6 +9,7 @@ from .settings import (
     setting_document_version_page_image_cache_maximum_size
 )
 from .signals import signal_post_initial_document_type
+from .tasks import task_document_file_pages_image_generate
 
 
 def handler_create_default_document_type(sender, **kwargs):
@@ -41,3 +42,10 @@ def handler_create_document_version_page_image_cache(sender, **kwargs):
             'maximum_size': setting_document_version_page_image_cache_maximum_size.value,
         }, defined_storage_name=STORAGE_NAME_DOCUMENT_VERSION_PAGE_IMAGE_CACHE,
     )
+
+
+def handler_document_file_pages_image_generate(sender, instance, **kwargs):
+    if instance.document.document_type.pages_image_generate:
+        task_document_file_pages_image_generate.apply_async(
+            kwargs={'document_file_id': instance.pk}
+        )
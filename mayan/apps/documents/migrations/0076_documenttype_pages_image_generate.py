@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('documents', '0075_delete_duplicateddocumentold'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documenttype',
+            name='pages_image_generate',
+            field=models.BooleanField(
+                default=False, help_text='Render the images of all the '
+                'pages of new document files in the background after '
+                'upload so that the first view of the document does not '
+                'wait for the rendering.',
+                verbose_name='Generate page images on upload'
+            ),
+        ),
+    ]
@@ -1,4 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
+from io import BytesIO
 import logging
 import shutil
 
@@ -11,26 +13,38 @@ from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.classes import ModelQueryFields
 from mayan.apps.databases.model_mixins import ExtraDataModelMixin
-from mayan.apps.common.signals import signal_mayan_pre_save
+from mayan.apps.common.signals import (
+    signal_mayan_post_bulk_create, signal_mayan_pre_save
+)
 from mayan.apps.converter.classes import ConverterBase
+from mayan.apps.converter.literals import CONVERTER_OFFICE_FILE_MIMETYPES
 from mayan.apps.converter.exceptions import (
     InvalidOfficeFormat, PageCountError
 )
 from mayan.apps.events.classes import EventManagerMethodAfter
 from mayan.apps.events.decorators import method_event
 from mayan.apps.file_caching.models import CachePartitionFile
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.mimetype.api import get_mimetype
+from mayan.apps.mimetype.literals import MIMETYPE_HEADER_SIZE
 from mayan.apps.storage.classes import DefinedStorageLazy
+from mayan.apps.storage.literals import MSG_MIME_TYPES
 
+from ..classes import DocumentFileIngestStream
 from ..events import (
     event_document_file_created, event_document_file_deleted,
     event_document_file_downloaded, event_document_file_edited
 )
 from ..literals import (
+    DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME, DOCUMENT_IMAGE_TASK_TIMEOUT,
     STORAGE_NAME_DOCUMENT_FILE_PAGE_IMAGE_CACHE, STORAGE_NAME_DOCUMENT_FILES
 )
 from ..managers import DocumentFileManager, ValidDocumentFileManager
-from ..settings import setting_hash_block_size
+from ..settings import (
+    setting_document_file_page_image_generate_workers,
+    setting_hash_block_size
+)
 from ..signals import (
     signal_post_document_created, signal_post_document_file_upload
 )
@@ -164,6 +178,29 @@ class DocumentFile(
     def __str__(self):
         return self.get_label()
 
+    def _page_image_save(self, cache_filename, document_file_page, image):
+        lock_name = document_file_page.get_lock_name(
+            _combined_cache_filename=cache_filename
+        )
+        try:
+            lock = LockingBackend.get_backend().acquire_lock(
+                name=lock_name, timeout=DOCUMENT_IMAGE_TASK_TIMEOUT
+            )
+        except LockError:
+            # The page image is being generated by a request.
+            return
+        else:
+            try:
+                try:
+                    document_file_page.cache_partition.get_file(
+                        filename=cache_filename
+                    )
+                except CachePartitionFile.DoesNotExist:
+                    with document_file_page.cache_partition.create_file(filename=cache_filename) as file_object:
+                        file_object.write(image.getvalue())
+            finally:
+                lock.release()
+
     @cached_property
     def cache(self):
         Cache = apps.get_model(app_label='file_caching', model_name='Cache')
@@ -178,11 +215,7 @@ class DocumentFile(
         )
         return partition
 
-    def checksum_update(self, save=True):
-        """
-        Open a document file's file and update the checksum field using
-        the user provided checksum function
-        """
+    def _get_checksum(self, file_object):
         block_size = setting_hash_block_size.value
         if block_size == 0:
             # If the setting value is 0 that means disable read limit. To disable
@@ -191,21 +224,78 @@ class DocumentFile(
             # https://docs.python.org/2/tutorial/inputoutput.html#methods-of-file-objects
             block_size = -1
 
-        if self.exists():
-            hash_object = DocumentFile.hash_function()
-            with self.open() as file_object:
-                while (True):
-                    data = file_object.read(block_size)
-                    if not data:
-                        break
+        hash_object = DocumentFile.hash_function()
+        while (True):
+            data = file_object.read(block_size)
+            if not data:
+                break
 
-                    hash_object.update(data)
+            hash_object.update(data)
 
-            self.checksum = force_text(s=hash_object.hexdigest())
-            if save:
-                self.save()
+        return force_text(s=hash_object.hexdigest())
+
+    def _ingest(self, ingest_stream):
+        """
+        Update the checksum, MIME type and page count of a new document
+        file from the source file object read by the storage backend
+        instead of reading the stored file back.
+        """
+        file_object = ingest_stream.file_object
+
+        result = DocumentFile._execute_hooks(
+            hook_list=DocumentFile._pre_open_hooks,
+            instance=self, file_object=file_object
+        )
 
-            return self.checksum
+        if result:
+            file_object = result['file_object']
+
+        if file_object is ingest_stream.file_object and ingest_stream.finish():
+            self.checksum = ingest_stream.get_checksum()
+
+            try:
+                self.mimetype, self.encoding = get_mimetype(
+                    file_object=file_object,
+                    header=bytes(ingest_stream.header)
+                )
+            except Exception:
+                self.mimetype = ''
+                self.encoding = ''
+        else:
+            # The content was transformed by a pre open hook or was not
+            # read sequentially.
+            file_object.seek(0)
+            self.checksum_update(file_object=file_object, save=False)
+            file_object.seek(0)
+            self.mimetype_update(file_object=file_object, save=False)
+
+        super().save(update_fields=('checksum', 'encoding', 'mimetype'))
+
+        file_object.seek(0)
+        self.page_count_update(file_object=file_object, save=False)
+
+        if file_object is not ingest_stream.file_object:
+            file_object.close()
+
+    def checksum_update(self, file_object=None, save=True):
+        """
+        Open a document file's file and update the checksum field using
+        the user provided checksum function. An already opened file object
+        of the content can be provided to avoid reading it from the
+        storage.
+        """
+        if file_object:
+            self.checksum = self._get_checksum(file_object=file_object)
+        elif self.exists():
+            with self.open() as file_object:
+                self.checksum = self._get_checksum(file_object=file_object)
+        else:
+            return
+
+        if save:
+            self.save()
+
+        return self.checksum
 
     @method_event(
         event_manager_class=EventManagerMethodAfter,
@@ -287,7 +377,7 @@ class DocumentFile(
             try:
                 with self.open() as file_object:
                     converter = ConverterBase.get_converter_class()(
-                        file_object=file_object
+                        file_object=file_object, mime_type=self.mimetype
                     )
                     with converter.to_pdf() as pdf_file_object:
                         with self.cache_partition.create_file(filename=cache_filename) as file_object:
@@ -316,16 +406,43 @@ class DocumentFile(
             logger.debug('Intermediate file found.')
             return cache_file.open()
 
+    def get_intermediate_file_mimetype(self):
+        """
+        Return the MIME type of the intermediate file from the MIME type
+        stored when the file was uploaded, to avoid detecting it every time
+        a converter is created. Office files are converted to PDF. Returns
+        None when the type can only be known by inspecting the file.
+        """
+        if self.mimetype in MSG_MIME_TYPES:
+            # The message member converted depends on the content.
+            return None
+        elif self.mimetype in CONVERTER_OFFICE_FILE_MIMETYPES:
+            return 'application/pdf'
+        else:
+            return self.mimetype or None
+
     def get_label(self):
         return self.filename
     get_label.short_description = _('Label')
 
-    def mimetype_update(self, save=True):
+    def mimetype_update(self, file_object=None, save=True):
         """
         Read a document verions's file and determine the mimetype by calling
-        the get_mimetype wrapper
+        the get_mimetype wrapper. An already opened file object of the
+        content can be provided to avoid reading it from the storage.
         """
-        if self.exists():
+        if file_object:
+            try:
+                self.mimetype, self.encoding = get_mimetype(
+                    file_object=file_object
+                )
+            except Exception:
+                self.mimetype = ''
+                self.encoding = ''
+            finally:
+                if save:
+                    self.save()
+        elif self.exists():
             try:
                 with self.open() as file_object:
                     self.mimetype, self.encoding = get_mimetype(
@@ -366,13 +483,19 @@ class DocumentFile(
             else:
                 return file_object
 
-    def page_count_update(self, save=True):
+    def page_count_update(self, file_object=None, save=True):
         try:
-            with self.open() as file_object:
+            if file_object:
                 converter = ConverterBase.get_converter_class()(
                     file_object=file_object, mime_type=self.mimetype
                 )
                 detected_pages = converter.get_page_count()
+            else:
+                with self.open() as file_object:
+                    converter = ConverterBase.get_converter_class()(
+                        file_object=file_object, mime_type=self.mimetype
+                    )
+                    detected_pages = converter.get_page_count()
         except PageCountError:
             """Converter backend doesn't understand the format."""
         else:
@@ -382,10 +505,20 @@ class DocumentFile(
 
             self.pages.all().delete()
 
-            for page_number in range(detected_pages):
-                DocumentFilePage.objects.create(
-                    document_file=self, page_number=page_number + 1
-                )
+            DocumentFilePage.objects.bulk_create(
+                objs=[
+                    DocumentFilePage(
+                        document_file=self, page_number=page_number + 1
+                    ) for page_number in range(detected_pages)
+                ]
+            )
+
+            # Not all database backends return the primary keys of bulk
+            # created rows, fetch the pages again.
+            signal_mayan_post_bulk_create.send(
+                instances=list(self.file_pages.all()),
+                sender=DocumentFilePage
+            )
 
             if save:
                 self.save()
@@ -400,6 +533,114 @@ class DocumentFile(
         queryset = ModelQueryFields.get(model=DocumentFilePage).get_queryset()
         return queryset.filter(pk__in=self.file_pages.values('pk'))
 
+    def pages_base_image_generate(self, page_number_list=None):
+        """
+        Render the base image of the pages not yet in the cache with a
+        single pass of the converter over the intermediate file. Returns
+        the number of page images rendered.
+        """
+        queryset = self.file_pages.all()
+
+        if page_number_list is not None:
+            queryset = queryset.filter(page_number__in=page_number_list)
+
+        document_file_pages = {
+            document_file_page.uuid: document_file_page for document_file_page in queryset
+        }
+
+        cached_partition_names = CachePartitionFile.objects.filter(
+            filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME,
+            partition__cache=self.cache,
+            partition__name__in=document_file_pages.keys()
+        ).values_list('partition__name', flat=True)
+
+        for partition_name in cached_partition_names:
+            document_file_pages.pop(partition_name)
+
+        pages_by_index = {
+            document_file_page.page_number - 1: document_file_page for document_file_page in document_file_pages.values()
+        }
+
+        if not pages_by_index:
+            return 0
+
+        with self.get_intermediate_file() as file_object:
+            converter = ConverterBase.get_converter_class()(
+                file_object=file_object,
+                mime_type=self.get_intermediate_file_mimetype()
+            )
+
+            page_number_iterator = converter.seek_pages(
+                page_number_list=sorted(pages_by_index)
+            )
+
+            for page_number in page_number_iterator:
+                page_image = converter.get_page()
+                cache_partition = pages_by_index[page_number].cache_partition
+
+                with cache_partition.create_file(filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME) as cache_file_object:
+                    cache_file_object.write(page_image.getvalue())
+
+        return len(pages_by_index)
+
+    def pages_image_generate(self, maximum_workers=None):
+        """
+        Render the base image and the default display image of every page.
+        The intermediate file is converted in a single pass and the
+        display transformations are executed by a bounded pool of threads.
+        Database and cache access remain in the calling thread. Returns
+        the number of display images rendered.
+        """
+        maximum_workers = maximum_workers or setting_document_file_page_image_generate_workers.value
+
+        self.pages_base_image_generate()
+
+        page_job_list = []
+        for document_file_page in self.file_pages.all():
+            transformation_list = document_file_page.get_combined_transformation_list()
+            cache_filename = document_file_page.get_combined_cache_filename(
+                _transformation_list=transformation_list
+            )
+
+            try:
+                document_file_page.cache_partition.get_file(
+                    filename=cache_filename
+                )
+            except CachePartitionFile.DoesNotExist:
+                page_job_list.append(
+                    (document_file_page, cache_filename, transformation_list)
+                )
+
+        with ThreadPoolExecutor(max_workers=maximum_workers) as executor:
+            # Submit the jobs in batches to bound the number of page
+            # images held in memory.
+            for index in range(0, len(page_job_list), maximum_workers):
+                future_list = []
+                for document_file_page, cache_filename, transformation_list in page_job_list[index:index + maximum_workers]:
+                    cache_file = document_file_page.cache_partition.get_file(
+                        filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
+                    )
+                    with cache_file.open() as file_object:
+                        base_image = BytesIO(file_object.read())
+
+                    future = executor.submit(
+                        document_file_page.transform_image,
+                        file_object=base_image,
+                        transformations=transformation_list
+                    )
+                    future_list.append(
+                        (document_file_page, cache_filename, future)
+                    )
+
+                for document_file_page, cache_filename, future in future_list:
+                    self._page_image_save(
+                        cache_filename=cache_filename,
+                        document_file_page=document_file_page,
+                        image=future.result()
+                    )
+
+        return len(page_job_list)
+
     def save(self, *args, **kwargs):
         """
         Overloaded save method that updates the document file's checksum,
@@ -407,9 +648,20 @@ class DocumentFile(
         """
         user = kwargs.pop('_user', self.__dict__.pop('_event_actor', None))
         new_document_file = not self.pk
+        ingest_stream = None
 
         if new_document_file:
             logger.info('Creating new file for document: %s', self.document)
+
+            if self.file and not self.file._committed:
+                # Calculate the checksum and capture the MIME type header
+                # while the storage backend reads the new file.
+                ingest_stream = DocumentFileIngestStream(
+                    file_object=self.file.file,
+                    hash_object=DocumentFile.hash_function(),
+                    header_size=MIMETYPE_HEADER_SIZE
+                )
+                self.file.file = ingest_stream
             DocumentFile.execute_pre_create_hooks(
                 kwargs={
                     'document': self.document,
@@ -438,11 +690,19 @@ class DocumentFile(
                     event_document_file_created.commit(
                         actor=user, target=self, action_object=self.document
                     )
-                    self.checksum_update(save=False)
-                    self.mimetype_update(save=False)
-                    self._event_actor = user
-                    self.save()
-                    self.page_count_update(save=False)
+                    if ingest_stream:
+                        self._ingest(ingest_stream=ingest_stream)
+                    else:
+                        self.checksum_update(save=False)
+                        self.mimetype_update(save=False)
+                        super().save(
+                            update_fields=('checksum', 'encoding', 'mimetype')
+                        )
+                        self.page_count_update(save=False)
+
+                    event_document_file_edited.commit(
+                        actor=user, target=self, action_object=self.document
+                    )
 
                     logger.info(
                         'New document file "%s" created for document: %s',
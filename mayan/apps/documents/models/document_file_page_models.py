@@ -17,7 +17,9 @@ from mayan.apps.converter.transformations import (
 from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.lock_manager.backends.base import LockingBackend
 
-from ..literals import DOCUMENT_IMAGE_TASK_TIMEOUT
+from ..literals import (
+    DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME, DOCUMENT_IMAGE_TASK_TIMEOUT
+)
 from ..managers import DocumentFilePageManager, ValidDocumentFilePageManager
 from ..settings import (
     setting_display_width, setting_display_height, setting_zoom_max_level,
@@ -56,6 +58,23 @@ class DocumentFilePage(PagedModelMixin, models.Model):
     objects = DocumentFilePageManager()
     valid = ValidDocumentFilePageManager()
 
+    @staticmethod
+    def transform_image(file_object, transformations=None):
+        """
+        Apply runtime transformations to a page image file object. Does
+        not access the database and is safe to execute from a thread.
+        """
+        converter = ConverterBase.get_converter_class()(
+            file_object=file_object
+        )
+
+        converter.seek_page(page_number=0)
+
+        for transformation in transformations or ():
+            converter.transform(transformation=transformation)
+
+        return converter.get_page()
+
     def __str__(self):
         return self.get_label()
 
@@ -214,7 +233,7 @@ class DocumentFilePage(PagedModelMixin, models.Model):
         return transformation_list
 
     def get_image(self, transformations=None):
-        cache_filename = 'base_image'
+        cache_filename = DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
         logger.debug('Page cache filename: %s', cache_filename)
 
         try:
@@ -225,7 +244,8 @@ class DocumentFilePage(PagedModelMixin, models.Model):
             try:
                 with self.document_file.get_intermediate_file() as file_object:
                     converter = ConverterBase.get_converter_class()(
-                        file_object=file_object
+                        file_object=file_object,
+                        mime_type=self.document_file.get_intermediate_file_mimetype()
                     )
                     converter.seek_page(page_number=self.page_number - 1)
 
@@ -252,20 +272,10 @@ class DocumentFilePage(PagedModelMixin, models.Model):
             logger.debug('Page cache file "%s" found', cache_filename)
 
             with cache_file.open() as file_object:
-                converter = ConverterBase.get_converter_class()(
-                    file_object=file_object
+                return DocumentFilePage.transform_image(
+                    file_object=file_object, transformations=transformations
                 )
 
-                converter.seek_page(page_number=0)
-
-                # This code is also repeated below to allow using a context
-                # manager with cache_file.open and close it automatically.
-                # Apply runtime transformations
-                for transformation in transformations or ():
-                    converter.transform(transformation=transformation)
-
-                return converter.get_page()
-
     def get_label(self):
         return _(
             '%(document_file)s - page %(page_num)d of %(total_pages)d'
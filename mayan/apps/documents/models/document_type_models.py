@@ -76,6 +76,14 @@ class DocumentType(ExtraDataModelMixin, models.Model):
         )
     )
 
+    pages_image_generate = models.BooleanField(
+        default=False, help_text=_(
+            'Render the images of all the pages of new document files in '
+            'the background after upload so that the first view of the '
+            'document does not wait for the rendering.'
+        ), verbose_name=_('Generate page images on upload')
+    )
+
     objects = DocumentTypeManager()
 
     class Meta:
@@ -11,6 +11,7 @@ from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.classes import ModelQueryFields
+from mayan.apps.common.signals import signal_mayan_post_bulk_create
 from mayan.apps.converter.exceptions import AppImageError
 from mayan.apps.databases.model_mixins import ExtraDataModelMixin
 from mayan.apps.events.classes import EventManagerMethodAfter, EventManagerSave
@@ -21,7 +22,8 @@ from mayan.apps.templating.classes import Template
 
 from ..events import (
     event_document_version_created, event_document_version_deleted,
-    event_document_version_edited, event_document_version_exported
+    event_document_version_edited, event_document_version_exported,
+    event_document_version_page_created
 )
 from ..literals import (
     IMAGE_ERROR_NO_VERSION_PAGES,
@@ -267,14 +269,28 @@ class DocumentVersion(ExtraDataModelMixin, models.Model):
         if not annotated_content_object_list:
             annotated_content_object_list = ()
 
-        for content_object_entry in annotated_content_object_list:
-            version_page = DocumentVersionPage(
-                document_version=self,
-                content_object=content_object_entry['content_object'],
-                page_number=content_object_entry['page_number']
+        DocumentVersionPage.objects.bulk_create(
+            objs=[
+                DocumentVersionPage(
+                    document_version=self,
+                    content_object=content_object_entry['content_object'],
+                    page_number=content_object_entry['page_number']
+                ) for content_object_entry in annotated_content_object_list
+            ]
+        )
+
+        # Not all database backends return the primary keys of bulk
+        # created rows, fetch the pages again.
+        version_pages = list(self.version_pages.all())
+
+        for version_page in version_pages:
+            event_document_version_page_created.commit(
+                action_object=self, actor=_user, target=version_page
             )
-            version_page._event_actor = _user
-            version_page.save()
+
+        signal_mayan_post_bulk_create.send(
+            instances=version_pages, sender=DocumentVersionPage
+        )
 
         signal_post_document_version_remap.send(
             sender=DocumentVersion, instance=self
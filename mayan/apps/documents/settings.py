@@ -9,6 +9,7 @@ from .literals import (
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND_ARGUMENTS,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_TIME,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_MAXIMUM_SIZE,
+    DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_GENERATE_WORKERS,
     DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND,
     DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND_ARGUMENTS,
     DEFAULT_DOCUMENTS_HASH_BLOCK_SIZE, DEFAULT_DOCUMENTS_LIST_THUMBNAIL_WIDTH,
@@ -64,6 +65,13 @@ setting_document_file_page_image_cache_time = namespace.add_setting(
         '1 year.'
     )
 )
+setting_document_file_page_image_generate_workers = namespace.add_setting(
+    default=DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_GENERATE_WORKERS,
+    global_name='DOCUMENTS_FILE_PAGE_IMAGE_GENERATE_WORKERS', help_text=_(
+        'Maximum number of threads used to transform the page images when '
+        'all the pages of a document file are pre-rendered.'
+    )
+)
 setting_document_file_storage_backend = namespace.add_setting(
     default=DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND,
     global_name='DOCUMENTS_FILE_STORAGE_BACKEND', help_text=_(
@@ -86,6 +86,28 @@ def task_document_file_page_image_generate(
         raise self.retry(exc=exception)
 
 
+@app.task(
+    bind=True,
+    default_retry_delay=setting_task_document_file_page_image_generate_retry_delay.value,
+    ignore_result=True
+)
+def task_document_file_pages_image_generate(self, document_file_id):
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+
+    document_file = DocumentFile.objects.get(pk=document_file_id)
+
+    try:
+        document_file.pages_image_generate()
+    except LockError as exception:
+        logger.warning(
+            'LockError during attempt to generate the page images of '
+            'document file: %s. Retrying.', document_file
+        )
+        raise self.retry(exc=exception)
+
+
 @app.task(
     bind=True, default_retry_delay=UPLOAD_NEW_VERSION_RETRY_DELAY,
     ignore_result=True
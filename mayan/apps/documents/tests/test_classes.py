@@ -0,0 +1,59 @@
+import hashlib
+from io import BytesIO
+
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import DocumentFileIngestStream
+
+from .literals import TEST_SMALL_DOCUMENT_CHECKSUM, TEST_SMALL_DOCUMENT_PATH
+
+
+class DocumentFileIngestStreamTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        with open(file=TEST_SMALL_DOCUMENT_PATH, mode='rb') as file_object:
+            self.test_data = file_object.read()
+
+        self.test_ingest_stream = DocumentFileIngestStream(
+            file_object=BytesIO(self.test_data),
+            hash_object=hashlib.sha256(), header_size=16
+        )
+
+    def test_sequential_read(self):
+        while self.test_ingest_stream.read(1024):
+            """Read the entire content."""
+
+        self.assertTrue(self.test_ingest_stream.finish())
+        self.assertEqual(
+            self.test_ingest_stream.get_checksum(),
+            TEST_SMALL_DOCUMENT_CHECKSUM
+        )
+        self.assertEqual(
+            bytes(self.test_ingest_stream.header), self.test_data[:16]
+        )
+
+    def test_partial_read(self):
+        self.test_ingest_stream.read(100)
+
+        self.assertTrue(self.test_ingest_stream.finish())
+        self.assertEqual(
+            self.test_ingest_stream.get_checksum(),
+            TEST_SMALL_DOCUMENT_CHECKSUM
+        )
+
+    def test_repeated_read(self):
+        self.test_ingest_stream.read(100)
+        self.test_ingest_stream.seek(0)
+        self.test_ingest_stream.read()
+
+        self.assertTrue(self.test_ingest_stream.finish())
+        self.assertEqual(
+            self.test_ingest_stream.get_checksum(),
+            TEST_SMALL_DOCUMENT_CHECKSUM
+        )
+
+    def test_skipped_read(self):
+        self.test_ingest_stream.seek(100)
+        self.test_ingest_stream.read()
+
+        self.assertFalse(self.test_ingest_stream.finish())
@@ -1,7 +1,16 @@
 from pathlib import Path
+from tempfile import NamedTemporaryFile
+
+from PIL import Image
+import mock
+
+from mayan.apps.file_caching.models import CachePartitionFile
+from mayan.apps.mimetype.literals import MIMETYPE_HEADER_SIZE
+
+from ..literals import DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
 
 from .base import GenericDocumentTestCase
-from .literals import TEST_SMALL_DOCUMENT_CHECKSUM
+from .literals import TEST_MULTI_PAGE_TIFF, TEST_SMALL_DOCUMENT_CHECKSUM
 
 
 class DocumentFileTestCase(GenericDocumentTestCase):
@@ -46,5 +55,113 @@ class DocumentFileTestCase(GenericDocumentTestCase):
             self.test_document_file.filename, self.test_document.label
         )
 
+    @mock.patch('mayan.apps.mimetype.api.get_mimetype_from_file')
+    def test_file_create_full_file_mimetype(self, mock_get_mimetype_from_file):
+        mock_get_mimetype_from_file.return_value = (
+            'application/x-test', 'binary'
+        )
+
+        with NamedTemporaryFile() as file_object:
+            file_object.write(b'\0' * (MIMETYPE_HEADER_SIZE + 1))
+            file_object.seek(0)
+
+            test_document_file = self.test_document.file_new(
+                file_object=file_object
+            )
+
+        self.assertTrue(mock_get_mimetype_from_file.called)
+        self.assertEqual(test_document_file.mimetype, 'application/x-test')
+
     def test_method_get_absolute_url(self):
         self.assertTrue(self.test_document.file_latest.get_absolute_url())
+
+
+class DocumentFilePageImageGenerateTestCase(GenericDocumentTestCase):
+    test_document_filename = TEST_MULTI_PAGE_TIFF
+
+    def _get_test_document_file_page_display_image_count(self):
+        count = 0
+        for document_file_page in self.test_document_file.file_pages.all():
+            cache_filename = document_file_page.get_combined_cache_filename()
+            count += document_file_page.cache_partition.files.filter(
+                filename=cache_filename
+            ).count()
+
+        return count
+
+    def _get_test_document_file_page_base_image_count(self):
+        return CachePartitionFile.objects.filter(
+            filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME,
+            partition__name__in=[
+                page.uuid for page in self.test_document_file.file_pages.all()
+            ]
+        ).count()
+
+    def test_method_pages_base_image_generate(self):
+        self.assertEqual(
+            self.test_document_file.pages_base_image_generate(), 2
+        )
+        self.assertEqual(
+            self._get_test_document_file_page_base_image_count(), 2
+        )
+
+    def test_method_pages_base_image_generate_cached(self):
+        self.test_document_file.pages_base_image_generate(
+            page_number_list=(2,)
+        )
+
+        self.assertEqual(
+            self.test_document_file.pages_base_image_generate(), 1
+        )
+        self.assertEqual(
+            self._get_test_document_file_page_base_image_count(), 2
+        )
+
+    def test_method_pages_base_image_generate_image(self):
+        self.test_document_file.pages_base_image_generate()
+
+        test_document_file_page = self.test_document_file.file_pages.last()
+
+        with test_document_file_page.cache_partition.get_file(filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME).open() as file_object:
+            cached_image = Image.open(fp=file_object)
+            cached_image.load()
+
+        with self.test_document_file.open() as file_object:
+            source_image = Image.open(fp=file_object)
+            source_image.seek(1)
+
+            self.assertEqual(cached_image.size, source_image.size)
+
+    def test_method_pages_image_generate(self):
+        self.assertEqual(
+            self.test_document_file.pages_image_generate(maximum_workers=1),
+            2
+        )
+        self.assertEqual(
+            self._get_test_document_file_page_base_image_count(), 2
+        )
+        self.assertEqual(
+            self._get_test_document_file_page_display_image_count(), 2
+        )
+
+    def test_method_pages_image_generate_cached(self):
+        self.test_document_file.pages_image_generate()
+
+        self.assertEqual(self.test_document_file.pages_image_generate(), 0)
+
+    def test_pages_image_generate_on_upload(self):
+        self.test_document_type.pages_image_generate = True
+        self.test_document_type.save()
+
+        self._upload_test_document()
+
+        self.assertEqual(
+            self._get_test_document_file_page_display_image_count(), 2
+        )
+
+    def test_pages_image_generate_on_upload_disabled(self):
+        self._upload_test_document()
+
+        self.assertEqual(
+            self._get_test_document_file_page_display_image_count(), 0
+        )
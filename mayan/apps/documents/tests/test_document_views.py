@@ -1,4 +1,6 @@
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from ..models.document_models import Document
 from ..models.document_type_models import DocumentType
@@ -105,6 +107,30 @@ class DocumentViewTestCase(
             response=response, status_code=200, text=self.test_document.label
         )
 
+    def test_document_list_view_acl_query_count(self):
+        self.grant_access(
+            obj=self.test_document_type, permission=permission_document_view
+        )
+
+        def get_acl_query_count():
+            with CaptureQueriesContext(connection=connection) as queries:
+                response = self._request_test_document_list_view()
+                self.assertEqual(response.status_code, 200)
+
+            return len(
+                [
+                    query for query in queries.captured_queries if
+                    'acls_accesscontrollist' in query['sql']
+                ]
+            )
+
+        acl_query_count = get_acl_query_count()
+
+        self._upload_test_document()
+        self._upload_test_document()
+
+        self.assertEqual(get_acl_query_count(), acl_query_count)
+
     def test_trashed_document_list_view_with_access(self):
         self.grant_access(
             obj=self.test_document, permission=permission_document_view
@@ -1,14 +1,19 @@
+from django.test import override_settings
+
+import mock
+
 from mayan.apps.acls.classes import ModelPermission
+from mayan.apps.acls.models import AccessControlList
 from mayan.apps.acls.permissions import permission_acl_edit
 from mayan.apps.acls.tests.mixins import (
     ACLTestMixin, AccessControlListViewTestMixin
 )
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..models import DocumentType
+from ..models import DocumentFilePage, DocumentType, DocumentVersionPage
 from ..permissions import permission_document_view
 
-from .base import GenericDocumentViewTestCase
+from .base import GenericDocumentTestCase, GenericDocumentViewTestCase
 
 
 class DocumentTypeACLPermissionsTestCase(BaseTestCase):
@@ -34,3 +39,64 @@ class DocumentTypeACLPermissionsViewTestCase(
             response=response, text=permission_document_view.label,
             status_code=200
         )
+
+
+@override_settings(ACLS_EFFECTIVE_GRANTS_ENABLE=True)
+class DocumentTypeEffectiveGrantsTestCase(GenericDocumentTestCase):
+    auto_upload_test_document = False
+
+    def test_document_upload_with_document_type_access(self):
+        self.grant_access(
+            obj=self.test_document_type, permission=permission_document_view
+        )
+
+        self._upload_test_document()
+
+        for model, filter_kwargs in (
+            (
+                DocumentFilePage, {
+                    'document_file__document': self.test_document
+                }
+            ),
+            (
+                DocumentVersionPage, {
+                    'document_version__document': self.test_document
+                }
+            )
+        ):
+            queryset = model.objects.filter(**filter_kwargs)
+
+            self.assertTrue(queryset.exists())
+            self.assertEqual(
+                AccessControlList.objects.restrict_queryset(
+                    permission=permission_document_view, queryset=queryset,
+                    user=self._test_case_user
+                ).count(), queryset.count()
+            )
+
+    def test_document_type_access_revoke(self):
+        self.grant_access(
+            obj=self.test_document_type, permission=permission_document_view
+        )
+
+        self._upload_test_document()
+
+        with mock.patch(
+            'mayan.apps.acls.tasks.task_effective_grants_refresh.apply_async'
+        ):
+            self.revoke_access(
+                obj=self.test_document_type,
+                permission=permission_document_view
+            )
+
+        queryset = DocumentFilePage.objects.filter(
+            document_file__document=self.test_document
+        )
+
+        self.assertTrue(queryset.exists())
+        self.assertEqual(
+            AccessControlList.objects.restrict_queryset(
+                permission=permission_document_view, queryset=queryset,
+                user=self._test_case_user
+            ).count(), 0
+        )
@@ -81,7 +81,7 @@ class DocumentTypeListView(SingleObjectListView):
 
 
 class DocumentTypeCreateView(SingleObjectCreateView):
-    fields = ('label',)
+    fields = ('label', 'pages_image_generate')
     model = DocumentType
     post_action_redirect = reverse_lazy(
         viewname='documents:document_type_list'
@@ -116,7 +116,7 @@ class DocumentTypeDeleteView(SingleObjectDeleteView):
 
 
 class DocumentTypeEditView(SingleObjectEditView):
-    fields = ('label',)
+    fields = ('label', 'pages_image_generate')
     model = DocumentType
     object_permission = permission_document_type_edit
     pk_url_kwarg = 'document_type_id'
@@ -25,6 +25,9 @@ class DjangoSearchBackend(SearchBackend):
 
         return SearchBackend.limit_queryset(queryset=queryset)
 
+    def clear_search_model_index(self, search_model):
+        """This backend doesn't keep an index."""
+
     def deindex_instance(self, instance):
         """This backend doesn't remove instances."""
 
@@ -34,6 +37,18 @@ class DjangoSearchBackend(SearchBackend):
         database directly.
         """
 
+    def index_instance_list(self, instance_list):
+        """
+        This backend doesn't index instances. Searches query the
+        database directly.
+        """
+
+    def index_instances(self, search_model, id_list):
+        """
+        This backend doesn't index instances. Searches query the
+        database directly.
+        """
+
     def get_search_query(self, search_model, query_string, global_and_search=False):
         return SearchQuery(
             query_string=query_string, search_model=search_model,
@@ -25,3 +25,8 @@ DJANGO_TO_WHOOSH_FIELD_MAP = {
     RGBColorField: {'field': whoosh.fields.TEXT},
 }
 WHOOSH_INDEX_DIRECTORY_NAME = 'whoosh'
+WHOOSH_INDEX_LOCK_NAME_TEMPLATE = 'dynamic_search_whoosh_index_{}'
+WHOOSH_INDEX_WRITER_ASYNC = False
+WHOOSH_INDEX_WRITER_LIMITMB = 128
+WHOOSH_INDEX_WRITER_MULTISEGMENT = False
+WHOOSH_INDEX_WRITER_PROCS = 1
@@ -4,7 +4,8 @@ from pathlib import Path
 import whoosh
 from whoosh import qparser
 from whoosh.filedb.filestore import FileStorage
-from whoosh.index import EmptyIndexError
+from whoosh.index import EmptyIndexError, LockError as WhooshLockError
+from whoosh.writing import AsyncWriter
 
 from django.conf import settings
 
@@ -12,9 +13,14 @@ from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
 
 from ..classes import SearchBackend, SearchField, SearchModel
-from ..settings import setting_results_limit
-
-from .literals import DJANGO_TO_WHOOSH_FIELD_MAP, WHOOSH_INDEX_DIRECTORY_NAME
+from ..settings import setting_indexing_chunk_size, setting_results_limit
+
+from .literals import (
+    DJANGO_TO_WHOOSH_FIELD_MAP, WHOOSH_INDEX_DIRECTORY_NAME,
+    WHOOSH_INDEX_LOCK_NAME_TEMPLATE, WHOOSH_INDEX_WRITER_ASYNC,
+    WHOOSH_INDEX_WRITER_LIMITMB, WHOOSH_INDEX_WRITER_MULTISEGMENT,
+    WHOOSH_INDEX_WRITER_PROCS
+)
 logger = logging.getLogger(name=__name__)
 
 
@@ -29,6 +35,18 @@ class WhooshSearchBackend(SearchBackend):
             )
         )
         self.index_path.mkdir(exist_ok=True)
+        self.writer_async = self.kwargs.get(
+            'writer_async', WHOOSH_INDEX_WRITER_ASYNC
+        )
+        self.writer_limitmb = self.kwargs.get(
+            'writer_limitmb', WHOOSH_INDEX_WRITER_LIMITMB
+        )
+        self.writer_multisegment = self.kwargs.get(
+            'writer_multisegment', WHOOSH_INDEX_WRITER_MULTISEGMENT
+        )
+        self.writer_procs = self.kwargs.get(
+            'writer_procs', WHOOSH_INDEX_WRITER_PROCS
+        )
 
     def _search(self, query_string, search_model, user, global_and_search=False):
         index = self.get_index(search_model=search_model)
@@ -84,23 +102,33 @@ class WhooshSearchBackend(SearchBackend):
             index.schema, indexname=search_model.get_full_name()
         )
 
+    def _acquire_search_model_lock(self, search_model, bulk=False):
+        if self.writer_async and not bulk:
+            # The asynchronous writer buffers the changes until Whoosh's
+            # own index write lock is available.
+            return None
+        else:
+            return LockingBackend.get_backend().acquire_lock(
+                name=self.get_lock_name(search_model=search_model)
+            )
+
     def deindex_instance(self, instance):
+        search_model = SearchModel.get_for_model(instance=instance)
+
         try:
-            lock = LockingBackend.get_backend().acquire_lock(
-                name='dynamic_search_whoosh_deindex_instance'
-            )
+            lock = self._acquire_search_model_lock(search_model=search_model)
         except LockError:
             raise
         else:
             try:
-                search_model = SearchModel.get_for_model(instance=instance)
                 index = self.get_index(search_model=search_model)
 
-                writer = index.writer()
+                writer = self.get_writer(index=index)
                 writer.delete_by_term('id', str(instance.pk))
                 writer.commit()
             finally:
-                lock.release()
+                if lock:
+                    lock.release()
 
     def get_index(self, search_model):
         storage = self.get_storage()
@@ -154,63 +182,88 @@ class WhooshSearchBackend(SearchBackend):
     def get_storage(self):
         return FileStorage(path=self.index_path)
 
-    def index_instance(self, instance, exclude_set=None):
+    def get_lock_name(self, search_model):
+        """
+        Each search model has its own index and its own lock to allow
+        indexing different search models concurrently.
+        """
+        return WHOOSH_INDEX_LOCK_NAME_TEMPLATE.format(
+            search_model.get_full_name()
+        )
+
+    def get_writer(self, index, bulk=False):
+        """
+        Return a writer for the index. Bulk writers use Whoosh's
+        multiprocessing writer when more than one process is configured.
+        Other writers are asynchronous when enabled and buffer the changes
+        in a background thread while the index is locked. Whoosh's own
+        index lock errors are raised as LockError to have the tasks retry.
+        """
+        writer_kwargs = {'limitmb': self.writer_limitmb}
+
+        if bulk:
+            if self.writer_procs > 1:
+                writer_kwargs['multisegment'] = self.writer_multisegment
+                writer_kwargs['procs'] = self.writer_procs
+        elif self.writer_async:
+            return AsyncWriter(index=index, writerargs=writer_kwargs)
+
         try:
-            lock = LockingBackend.get_backend().acquire_lock(
-                name='dynamic_search_whoosh_index_instance'
+            return index.writer(**writer_kwargs)
+        except WhooshLockError as exception:
+            raise LockError(
+                'Unable to acquire the write lock of index: {}'.format(
+                    index.indexname
+                )
+            ) from exception
+
+    def index_instance(self, instance, exclude_set=None):
+        self.index_instance_list(
+            exclude_set=exclude_set, instance_list=(instance,)
+        )
+
+    def index_instance_list(self, instance_list, exclude_set=None):
+        # Collect all the instances and their related instances first to
+        # index each one only once and to use a single writer per search
+        # model.
+        exclude_set = exclude_set or set()
+        instance_set = set()
+
+        for instance in instance_list:
+            self._collect_index_instances(
+                exclude_set=exclude_set, instance=instance,
+                instance_set=instance_set
             )
-        except LockError:
-            raise
-        else:
+
+        search_model_instances = {}
+
+        for instance in instance_set:
             try:
-                # Use a private method to allow using a single lock for
-                # all recursions.
-                self._index_instance(
-                    instance=instance, exclude_set=exclude_set
-                )
-            finally:
-                lock.release()
+                search_model = SearchModel.get_for_model(instance=instance)
+            except KeyError:
+                """
+                A KeyError is not fatal. It means search is not configured
+                for this instance but it was collected to check if one of
+                its field's related models are configured for search and
+                need to be updated.
+                """
+            else:
+                search_model_instances.setdefault(
+                    search_model, []
+                ).append(instance)
 
-    def _index_instance(self, instance, exclude_set=None):
-        if not exclude_set:
-            exclude_set = set()
+        for search_model, instances in search_model_instances.items():
+            self._index_search_model_instances(
+                instances=instances, search_model=search_model
+            )
 
+    def _collect_index_instances(self, exclude_set, instance, instance_set):
         # Avoid infinite recursion.
         if instance in exclude_set:
             return
 
         exclude_set.add(instance)
-
-        try:
-            search_model = SearchModel.get_for_model(instance=instance)
-        except KeyError:
-            """
-            A KeyError is not fatal. It means search is not configured
-            for this instance but we still need to check if one of its
-            field's related models are configure for search and need
-            to be updated.
-            """
-        else:
-            index = self.get_index(search_model=search_model)
-
-            writer = index.writer()
-            kwargs = search_model.sieve(
-                field_map=self.get_resolved_field_map(search_model=search_model), instance=instance
-            )
-            writer.delete_by_term('id', str(instance.pk))
-            try:
-                writer.add_document(**kwargs)
-                writer.commit()
-            except Exception as exception:
-                logger.error(
-                    'Unexpected exception while indexing object id: %s, '
-                    'search model: %s, index data: %s, raw data: %s, '
-                    'field map: %s; %s', search_model.get_full_name(),
-                    instance.pk, kwargs, instance.__dict__,
-                    self.get_resolved_field_map(search_model=search_model),
-                    exception, exc_info=True
-                )
-                raise
+        instance_set.add(instance)
 
         for field_class in instance._meta.get_fields():
             # Only to recursive indexing for related models that are
@@ -231,18 +284,85 @@ class WhooshSearchBackend(SearchBackend):
                             # foreign key.
                             results = [field_instance]
 
-                    for instance in results:
-                        self._index_instance(
-                            instance=instance, exclude_set=exclude_set
+                    for result in results:
+                        self._collect_index_instances(
+                            exclude_set=exclude_set, instance=result,
+                            instance_set=instance_set
                         )
 
-    def index_search_model(self, search_model):
+    def _index_search_model_instances(
+        self, instances, search_model, bulk=False
+    ):
+        """
+        Write the index data of several instances of the same search
+        model using a single writer and commit.
+        """
+        try:
+            lock = self._acquire_search_model_lock(
+                bulk=bulk, search_model=search_model
+            )
+        except LockError:
+            raise
+        else:
+            try:
+                self._write_search_model_instances(
+                    bulk=bulk, instances=instances, search_model=search_model
+                )
+            finally:
+                if lock:
+                    lock.release()
+
+    def _write_search_model_instances(self, bulk, instances, search_model):
         index = self.get_index(search_model=search_model)
+        field_map = self.get_resolved_field_map(search_model=search_model)
+        instance = None
+        kwargs = {}
 
-        # Clear the model index
-        self.get_storage().create_index(
-            index.schema, indexname=search_model.get_full_name()
+        writer = self.get_writer(bulk=bulk, index=index)
+        try:
+            for instance in instances:
+                kwargs = search_model.sieve(
+                    field_map=field_map, instance=instance
+                )
+                writer.delete_by_term('id', str(instance.pk))
+                writer.add_document(**kwargs)
+                # Errors fetching the next instance are not caused by
+                # the instance already indexed.
+                instance = None
+        except Exception as exception:
+            writer.cancel()
+
+            if instance is None:
+                logger.error(
+                    'Unexpected exception while indexing search model: '
+                    '%s; %s', search_model.get_full_name(), exception,
+                    exc_info=True
+                )
+            else:
+                logger.error(
+                    'Unexpected exception while indexing object id: %s, '
+                    'search model: %s, index data: %s, raw data: %s, '
+                    'field map: %s; %s', instance.pk,
+                    search_model.get_full_name(), kwargs, instance.__dict__,
+                    field_map, exception, exc_info=True
+                )
+            raise
+        else:
+            writer.commit()
+
+    def index_instances(self, search_model, id_list):
+        self._index_search_model_instances(
+            bulk=True, instances=search_model.get_indexing_queryset(
+                id_list=id_list
+            ), search_model=search_model
+        )
+
+    def index_search_model(self, search_model):
+        self.clear_search_model_index(search_model=search_model)
+
+        id_list_chunks = search_model.get_id_list_chunks(
+            chunk_size=setting_indexing_chunk_size.value
         )
 
-        for instance in search_model.model._meta.default_manager.all():
-            self.index_instance(instance=instance)
+        for id_list in id_list_chunks:
+            self.index_instances(search_model=search_model, id_list=id_list)
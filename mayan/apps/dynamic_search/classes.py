@@ -2,6 +2,7 @@ from collections import Iterable
 import logging
 
 from django.apps import apps
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.signals import post_save, pre_delete
 from django.utils.encoding import force_text
 from django.utils.functional import cached_property
@@ -10,6 +11,7 @@ from django.utils.translation import ugettext as _
 
 from mayan.apps.common.class_mixins import AppsModuleLoaderMixin
 from mayan.apps.common.exceptions import ResolverPipelineError
+from mayan.apps.common.signals import signal_mayan_post_bulk_create
 from mayan.apps.common.utils import (
     ResolverPipelineModelAttribute, get_related_field
 )
@@ -45,12 +47,35 @@ class SearchBackend:
     def _search(self, global_and_search, search_model, query_string, user):
         raise NotImplementedError
 
+    def clear_search_model_index(self, search_model):
+        raise NotImplementedError
+
     def deindex_instance(self, instance):
         raise NotImplementedError
 
     def index_instance(self, instance):
         raise NotImplementedError
 
+    def index_instance_list(self, instance_list):
+        """
+        Index a list of instances of any model. Backends that can
+        deduplicate related instances or write several instances in a
+        single operation should override this method.
+        """
+        for instance in instance_list:
+            self.index_instance(instance=instance)
+
+    def index_instances(self, search_model, id_list):
+        """
+        Index a batch of instances of a search model. Backends that can
+        write several instances in a single operation should override
+        this method.
+        """
+        queryset = search_model.get_indexing_queryset(id_list=id_list)
+
+        for instance in queryset:
+            self.index_instance(instance=instance)
+
     def search(
         self, search_model, query_string, user, global_and_search=False
     ):
@@ -217,7 +242,8 @@ class SearchModel(AppsModuleLoaderMixin):
     def initialize():
         # Hide a circular import
         from .handlers import (
-            handler_factory_deindex_instance, handler_index_instance
+            handler_factory_deindex_instance, handler_index_instance,
+            handler_index_instance_list
         )
 
         for search_model in SearchModel.all():
@@ -226,6 +252,11 @@ class SearchModel(AppsModuleLoaderMixin):
                 receiver=handler_index_instance,
                 sender=search_model.model
             )
+            signal_mayan_post_bulk_create.connect(
+                dispatch_uid='search_handler_index_instance_list_{}'.format(search_model),
+                receiver=handler_index_instance_list,
+                sender=search_model.model
+            )
             pre_delete.connect(
                 dispatch_uid='search_handler_deindex_instance_{}'.format(search_model),
                 receiver=handler_factory_deindex_instance(search_model=search_model),
@@ -238,6 +269,11 @@ class SearchModel(AppsModuleLoaderMixin):
                     receiver=handler_index_instance,
                     sender=proxy
                 )
+                signal_mayan_post_bulk_create.connect(
+                    dispatch_uid='search_handler_index_instance_list_{}'.format(search_model),
+                    receiver=handler_index_instance_list,
+                    sender=proxy
+                )
                 pre_delete.connect(
                     dispatch_uid='search_handler_deindex_instance_{}'.format(search_model),
                     receiver=handler_factory_deindex_instance(search_model=search_model),
@@ -359,12 +395,65 @@ class SearchModel(AppsModuleLoaderMixin):
     def get_full_name(self):
         return '{}.{}'.format(self.app_label, self.model_name)
 
+    def get_id_list_chunks(self, chunk_size):
+        """
+        Yield the primary keys of all the instances of the search model
+        in lists of up to `chunk_size` elements. Uses keyset pagination
+        to avoid loading the entire primary key list in memory.
+        """
+        queryset = self.model._meta.default_manager.order_by('pk')
+        last_pk = None
+
+        while True:
+            if last_pk is None:
+                chunk_queryset = queryset
+            else:
+                chunk_queryset = queryset.filter(pk__gt=last_pk)
+
+            id_list = list(
+                chunk_queryset.values_list('pk', flat=True)[:chunk_size]
+            )
+
+            if not id_list:
+                break
+
+            yield id_list
+
+            last_pk = id_list[-1]
+
+    def get_indexing_queryset(self, id_list=None):
+        """
+        Return the queryset of instances to index with the related models
+        of the search fields prefetched, to allow sieving many instances
+        with a fixed number of queries.
+        """
+        queryset = self.model._meta.default_manager.prefetch_related(
+            *self.get_related_lookups()
+        )
+
+        if id_list is not None:
+            queryset = queryset.filter(pk__in=id_list)
+
+        return queryset
+
     def get_queryset(self):
         if self.queryset:
             return self.queryset()
         else:
             return self.model.objects.all()
 
+    def get_related_lookups(self):
+        """
+        Return the list of relationship lookups used by the search fields.
+        """
+        result = set()
+        for search_field in self.search_fields:
+            field_path = search_field.field.split(LOOKUP_SEP)
+            if len(field_path) > 1:
+                result.add(LOOKUP_SEP.join(field_path[:-1]))
+
+        return sorted(result)
+
     def get_search_field(self, full_name):
         try:
             return self.search_fields[full_name]
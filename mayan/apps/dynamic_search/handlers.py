@@ -1,4 +1,9 @@
-from .tasks import task_deindex_instance, task_index_instance
+from django.apps import apps
+
+from .settings import setting_update_queue_enable
+from .tasks import (
+    task_deindex_instance, task_index_instance, task_index_instance_list
+)
 
 
 def handler_factory_deindex_instance(search_model):
@@ -20,10 +25,38 @@ def handler_factory_deindex_instance(search_model):
 def handler_index_instance(sender, **kwargs):
     instance = kwargs['instance']
 
-    task_index_instance.apply_async(
-        kwargs={
-            'app_label': instance._meta.app_label,
-            'model_name': instance._meta.model_name,
-            'object_id': instance.pk
-        }
-    )
+    if setting_update_queue_enable.value:
+        UpdateQueueEntry = apps.get_model(
+            app_label='dynamic_search', model_name='UpdateQueueEntry'
+        )
+        UpdateQueueEntry.objects.add(instance=instance)
+    else:
+        task_index_instance.apply_async(
+            kwargs={
+                'app_label': instance._meta.app_label,
+                'model_name': instance._meta.model_name,
+                'object_id': instance.pk
+            }
+        )
+
+
+def handler_index_instance_list(sender, **kwargs):
+    instance_list = kwargs['instances']
+
+    if not instance_list:
+        return
+
+    if setting_update_queue_enable.value:
+        UpdateQueueEntry = apps.get_model(
+            app_label='dynamic_search', model_name='UpdateQueueEntry'
+        )
+        for instance in instance_list:
+            UpdateQueueEntry.objects.add(instance=instance)
+    else:
+        task_index_instance_list.apply_async(
+            kwargs={
+                'app_label': sender._meta.app_label,
+                'id_list': [instance.pk for instance in instance_list],
+                'model_name': sender._meta.model_name
+            }
+        )
@@ -4,8 +4,11 @@ DEFAULT_RESULTS_LIMIT = 100
 DEFAULT_SEARCH_BACKEND = 'mayan.apps.dynamic_search.backends.django.DjangoSearchBackend'
 DEFAULT_SEARCH_BACKEND_ARGUMENTS = {}
 DEFAULT_SEARCH_DISABLE_SIMPLE_SEARCH = False
+DEFAULT_SEARCH_INDEXING_CHUNK_SIZE = 100
 DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE = 'false'
 DEFAULT_SEARCH_RESULTS_LIMIT = 100
+DEFAULT_SEARCH_UPDATE_QUEUE_ENABLE = False
+DEFAULT_SEARCH_UPDATE_QUEUE_INTERVAL = 10
 
 DELIMITER = '_'
 
@@ -0,0 +1,75 @@
+from django.core import management
+from django.core.management.base import CommandError
+from django.utils.translation import ugettext_lazy as _
+
+from ...classes import SearchBackend, SearchModel
+from ...settings import setting_indexing_chunk_size
+
+
+class Command(management.BaseCommand):
+    help = 'Erase and populate the search backend index in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk_size', action='store', dest='chunk_size', type=int,
+            help=_(
+                'Number of instances to index per batch. Defaults to the '
+                'value of the SEARCH_INDEXING_CHUNK_SIZE setting.'
+            )
+        )
+        parser.add_argument(
+            '--search_model', action='store', dest='search_model',
+            help=_(
+                'Full name of the search model to reindex. If omitted all '
+                'search models are reindexed.'
+            )
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size'] or setting_indexing_chunk_size.value
+
+        if options['search_model']:
+            try:
+                search_models = (
+                    SearchModel.get(name=options['search_model']),
+                )
+            except KeyError:
+                raise CommandError(
+                    'Unknown search model: %s' % options['search_model']
+                )
+        else:
+            search_models = SearchModel.all()
+
+        search_backend = SearchBackend.get_instance()
+
+        for search_model in search_models:
+            total = search_model.model._meta.default_manager.count()
+            count = 0
+
+            self.stdout.write(
+                'Reindexing search model: {}; instances: {}'.format(
+                    search_model.get_full_name(), total
+                )
+            )
+
+            search_backend.clear_search_model_index(search_model=search_model)
+
+            id_list_chunks = search_model.get_id_list_chunks(
+                chunk_size=chunk_size
+            )
+
+            for id_list in id_list_chunks:
+                search_backend.index_instances(
+                    id_list=id_list, search_model=search_model
+                )
+                count += len(id_list)
+                # Instances created after the initial count are also
+                # indexed.
+                total = max(count, total)
+
+                self.stdout.write(
+                    '{}: {}/{} ({:.0%})'.format(
+                        search_model.get_full_name(), count, total,
+                        count / total
+                    )
+                )
@@ -0,0 +1,27 @@
+from django.apps import apps
+from django.core import management
+
+
+class Command(management.BaseCommand):
+    help = 'Show the status of the search update queue.'
+
+    def handle(self, *args, **options):
+        UpdateQueueEntry = apps.get_model(
+            app_label='dynamic_search', model_name='UpdateQueueEntry'
+        )
+
+        self.stdout.write(
+            'Queue depth: {}'.format(
+                UpdateQueueEntry.objects.get_queue_depth()
+            )
+        )
+        self.stdout.write(
+            'Index requests: {}'.format(
+                UpdateQueueEntry.objects.get_request_count()
+            )
+        )
+        self.stdout.write(
+            'Coalescing ratio: {:.2f}'.format(
+                UpdateQueueEntry.objects.get_coalescing_ratio()
+            )
+        )
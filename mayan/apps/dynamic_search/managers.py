@@ -0,0 +1,115 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Sum
+
+from .classes import SearchBackend
+
+
+class UpdateQueueEntryManager(models.Manager):
+    def _add(self, content_type, object_id, request_count=1):
+        queryset = self.filter(content_type=content_type, object_id=object_id)
+
+        if not queryset.update(request_count=F('request_count') + request_count):
+            try:
+                with transaction.atomic():
+                    self.create(
+                        content_type=content_type, object_id=object_id,
+                        request_count=request_count
+                    )
+            except IntegrityError:
+                # Another process queued the same instance concurrently.
+                queryset.update(
+                    request_count=F('request_count') + request_count
+                )
+
+    def _remove(self, entries):
+        """
+        Remove indexed entries from the queue. Entries that received
+        requests during the indexing are kept with only those requests to
+        be indexed again.
+        """
+        with transaction.atomic():
+            for entry in entries:
+                queryset = self.filter(pk=entry.pk)
+
+                deleted_count = queryset.filter(
+                    request_count=entry.request_count
+                ).delete()[0]
+
+                if not deleted_count:
+                    queryset.update(
+                        request_count=F('request_count') - entry.request_count
+                    )
+
+    def add(self, instance):
+        """
+        Add an instance to the update queue. If the instance is already
+        queued, only its request counter is incremented.
+        """
+        self._add(
+            content_type=ContentType.objects.get_for_model(model=instance),
+            object_id=instance.pk
+        )
+
+    def flush(self, chunk_size):
+        """
+        Index the queued instances in batches of up to `chunk_size`
+        entries. Returns a dictionary with the number of index requests
+        received and the number of instances indexed.
+        """
+        search_backend = SearchBackend.get_instance()
+        result = {'instance_count': 0, 'request_count': 0}
+
+        while True:
+            entries = list(
+                self.select_related('content_type').order_by('pk')[:chunk_size]
+            )
+
+            if not entries:
+                break
+
+            instance_list = []
+            model_id_lists = {}
+
+            for entry in entries:
+                model_id_lists.setdefault(
+                    entry.content_type.model_class(), []
+                ).append(entry.object_id)
+
+            for model, id_list in model_id_lists.items():
+                if model:
+                    instance_list.extend(
+                        model._meta.default_manager.filter(pk__in=id_list)
+                    )
+
+            # The entries stay in the queue if the indexing fails.
+            search_backend.index_instance_list(instance_list=instance_list)
+
+            self._remove(entries=entries)
+
+            result['instance_count'] += len(entries)
+            result['request_count'] += sum(
+                entry.request_count for entry in entries
+            )
+
+        return result
+
+    def get_coalescing_ratio(self):
+        """
+        Return the average number of index requests merged into each
+        queued instance.
+        """
+        queue_depth = self.get_queue_depth()
+
+        if queue_depth:
+            return self.get_request_count() / queue_depth
+        else:
+            return 0
+
+    def get_queue_depth(self):
+        return self.count()
+
+    def get_request_count(self):
+        return self.aggregate(
+            request_count=Sum('request_count')
+        )['request_count'] or 0
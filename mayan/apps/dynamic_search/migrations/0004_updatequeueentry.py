@@ -0,0 +1,53 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('dynamic_search', '0003_auto_20161028_0707'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UpdateQueueEntry',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True,
+                        serialize=False, verbose_name='ID'
+                    )
+                ),
+                (
+                    'object_id', models.PositiveIntegerField(
+                        verbose_name='Object ID'
+                    )
+                ),
+                (
+                    'datetime', models.DateTimeField(
+                        auto_now_add=True, verbose_name='Date time'
+                    )
+                ),
+                (
+                    'request_count', models.PositiveIntegerField(
+                        default=1, help_text='Number of index requests '
+                        'received for the instance while it was queued.',
+                        verbose_name='Request count'
+                    )
+                ),
+                (
+                    'content_type', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to='contenttypes.ContentType',
+                        verbose_name='Content type'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Update queue entry',
+                'verbose_name_plural': 'Update queue entries',
+                'ordering': ('pk',),
+                'unique_together': {('content_type', 'object_id')},
+            },
+        ),
+    ]
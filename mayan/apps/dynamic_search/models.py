@@ -0,0 +1,42 @@
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+
+from .managers import UpdateQueueEntryManager
+
+
+class UpdateQueueEntry(models.Model):
+    """
+    Model to collect the instances that need to be indexed. Allows
+    merging multiple index requests for the same instance into a single
+    index operation.
+    """
+    content_type = models.ForeignKey(
+        on_delete=models.CASCADE, to=ContentType,
+        verbose_name=_('Content type')
+    )
+    object_id = models.PositiveIntegerField(verbose_name=_('Object ID'))
+    content_object = GenericForeignKey(
+        ct_field='content_type', fk_field='object_id'
+    )
+    datetime = models.DateTimeField(
+        auto_now_add=True, verbose_name=_('Date time')
+    )
+    request_count = models.PositiveIntegerField(
+        default=1, help_text=_(
+            'Number of index requests received for the instance while '
+            'it was queued.'
+        ), verbose_name=_('Request count')
+    )
+
+    objects = UpdateQueueEntryManager()
+
+    class Meta:
+        ordering = ('pk',)
+        unique_together = ('content_type', 'object_id')
+        verbose_name = _('Update queue entry')
+        verbose_name_plural = _('Update queue entries')
+
+    def __str__(self):
+        return '{}.{}'.format(self.content_type, self.object_id)
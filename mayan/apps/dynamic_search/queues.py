@@ -1,12 +1,20 @@
+from datetime import timedelta
+
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.queues import queue_tools
 from mayan.apps.task_manager.classes import CeleryQueue
 from mayan.apps.task_manager.workers import worker_b
 
+from .settings import setting_update_queue_interval
+
 queue_search = CeleryQueue(
     label=_('Search'), name='search', worker=worker_b
 )
+queue_search_periodic = CeleryQueue(
+    label=_('Search periodic'), name='search_periodic', transient=True,
+    worker=worker_b
+)
 
 queue_search.add_task_type(
     dotted_path='mayan.apps.dynamic_search.tasks.task_deindex_instance',
@@ -18,6 +26,24 @@ queue_search.add_task_type(
     label=_('Index a model instance to the search engine.'),
     name='task_index_instance',
 )
+queue_search.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_index_instance_list',
+    label=_('Index a list of model instances and their related instances to the search engine.'),
+    name='task_index_instance_list',
+)
+queue_search.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_index_instances',
+    label=_('Index a batch of model instances to the search engine.'),
+    name='task_index_instances',
+)
+
+queue_search_periodic.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_update_queue_flush',
+    label=_('Index the instances in the search update queue.'),
+    name='task_update_queue_flush', schedule=timedelta(
+        seconds=setting_update_queue_interval.value
+    )
+)
 
 queue_tools.add_task_type(
     dotted_path='mayan.apps.dynamic_search.tasks.task_index_search_model',
@@ -4,8 +4,9 @@ from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
     DEFAULT_SEARCH_BACKEND, DEFAULT_SEARCH_BACKEND_ARGUMENTS,
-    DEFAULT_SEARCH_DISABLE_SIMPLE_SEARCH,
-    DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE, DEFAULT_SEARCH_RESULTS_LIMIT
+    DEFAULT_SEARCH_DISABLE_SIMPLE_SEARCH, DEFAULT_SEARCH_INDEXING_CHUNK_SIZE,
+    DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE, DEFAULT_SEARCH_RESULTS_LIMIT,
+    DEFAULT_SEARCH_UPDATE_QUEUE_ENABLE, DEFAULT_SEARCH_UPDATE_QUEUE_INTERVAL
 )
 
 namespace = SettingNamespace(label=_('Search'), name='search')
@@ -27,6 +28,14 @@ setting_disable_simple_search = namespace.add_setting(
         'search button.'
     )
 )
+setting_indexing_chunk_size = namespace.add_setting(
+    default=DEFAULT_SEARCH_INDEXING_CHUNK_SIZE,
+    global_name='SEARCH_INDEXING_CHUNK_SIZE', help_text=_(
+        'Number of instances to index per batch when indexing a complete '
+        'search model. Each batch is written to the search backend in a '
+        'single operation.'
+    )
+)
 setting_match_all_default_value = namespace.add_setting(
     global_name='SEARCH_MATCH_ALL_DEFAULT_VALUE',
     default=DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE,
@@ -36,3 +45,19 @@ setting_results_limit = namespace.add_setting(
     default=DEFAULT_SEARCH_RESULTS_LIMIT, global_name='SEARCH_RESULTS_LIMIT',
     help_text=_('Maximum number search results to fetch and display.')
 )
+setting_update_queue_enable = namespace.add_setting(
+    default=DEFAULT_SEARCH_UPDATE_QUEUE_ENABLE,
+    global_name='SEARCH_UPDATE_QUEUE_ENABLE', help_text=_(
+        'Collect the instances to be indexed in a queue instead of indexing '
+        'them as soon as they are saved. Multiple updates to the same '
+        'instance are merged and the queue is indexed in batches.'
+    )
+)
+setting_update_queue_interval = namespace.add_setting(
+    default=DEFAULT_SEARCH_UPDATE_QUEUE_INTERVAL,
+    global_name='SEARCH_UPDATE_QUEUE_INTERVAL', help_text=_(
+        'Time in seconds between each indexing of the update queue. '
+        'Updates to the same instance during this interval are '
+        'coalesced into a single index operation.'
+    )
+)
@@ -2,11 +2,13 @@ import logging
 
 from django.apps import apps
 
+from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
 from .classes import SearchBackend, SearchModel
 from .literals import TASK_RETRY_DELAY
+from .settings import setting_indexing_chunk_size
 
 logger = logging.getLogger(name=__name__)
 
@@ -36,12 +38,15 @@ def task_deindex_instance(self, app_label, model_name, object_id):
 def task_index_search_model(self, search_model_full_name):
     search_model = SearchModel.get(name=search_model_full_name)
 
-    for instance in search_model.model._meta.default_manager.all():
-        task_index_instance.apply_async(
+    id_list_chunks = search_model.get_id_list_chunks(
+        chunk_size=setting_indexing_chunk_size.value
+    )
+
+    for id_list in id_list_chunks:
+        task_index_instances.apply_async(
             kwargs={
-                'app_label': instance._meta.app_label,
-                'model_name': instance._meta.model_name,
-                'object_id': instance.pk
+                'id_list': id_list,
+                'search_model_full_name': search_model_full_name
             }
         )
 
@@ -75,3 +80,95 @@ def task_index_instance(self, app_label, model_name, object_id):
                 raise self.retry(exc=exception)
 
     logger.info('Finished')
+
+
+@app.task(
+    bind=True, default_retry_delay=TASK_RETRY_DELAY, max_retries=None,
+    ignore_result=True
+)
+def task_index_instance_list(self, app_label, model_name, id_list):
+    logger.info('Executing')
+
+    try:
+        Model = apps.get_model(app_label=app_label, model_name=model_name)
+    except LookupError:
+        """
+        The app or model does not exists anymore. Non fatal, just exit
+        the task.
+        """
+    else:
+        instance_list = list(
+            Model._meta.default_manager.filter(pk__in=id_list)
+        )
+
+        try:
+            SearchBackend.get_instance().index_instance_list(
+                instance_list=instance_list
+            )
+        except LockError as exception:
+            raise self.retry(exc=exception)
+
+    logger.info('Finished')
+
+
+@app.task(
+    bind=True, default_retry_delay=TASK_RETRY_DELAY, max_retries=None,
+    ignore_result=True
+)
+def task_index_instances(self, search_model_full_name, id_list):
+    logger.info('Executing')
+
+    try:
+        search_model = SearchModel.get(name=search_model_full_name)
+    except KeyError:
+        """
+        The search model does not exists anymore. Non fatal, just exit
+        the task.
+        """
+    else:
+        try:
+            SearchBackend.get_instance().index_instances(
+                id_list=id_list, search_model=search_model
+            )
+        except LockError as exception:
+            raise self.retry(exc=exception)
+
+    logger.info('Finished')
+
+
+@app.task(ignore_result=True)
+def task_update_queue_flush():
+    logger.debug('Executing')
+
+    UpdateQueueEntry = apps.get_model(
+        app_label='dynamic_search', model_name='UpdateQueueEntry'
+    )
+
+    try:
+        lock = LockingBackend.get_backend().acquire_lock(
+            name='dynamic_search_update_queue_flush'
+        )
+    except LockError:
+        logger.debug('Update queue flush already in progress.')
+    else:
+        try:
+            result = UpdateQueueEntry.objects.flush(
+                chunk_size=setting_indexing_chunk_size.value
+            )
+        except LockError:
+            logger.debug(
+                'Unable to acquire the search backend lock; queue entries '
+                'will be indexed on the next flush.'
+            )
+        else:
+            if result['instance_count']:
+                logger.info(
+                    'Update queue flushed; requests: %d, instances '
+                    'indexed: %d, coalescing ratio: %.2f',
+                    result['request_count'], result['instance_count'],
+                    result['request_count'] / result['instance_count']
+                )
+        finally:
+            lock.release()
+
+    logger.debug('Finished')
@@ -1,9 +1,18 @@
+import mock
+
+from django.db import DatabaseError
 from django.test import override_settings
 from django.utils.encoding import force_text
 
-from mayan.apps.documents.permissions import permission_document_view
-from mayan.apps.documents.search import document_search
+from mayan.apps.documents.permissions import (
+    permission_document_version_view, permission_document_view
+)
+from mayan.apps.documents.search import (
+    document_search, document_type_search, document_version_page_search
+)
 from mayan.apps.documents.tests.mixins.document_mixins import DocumentTestMixin
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.storage.utils import fs_cleanup, mkdtemp
 from mayan.apps.testing.tests.base import BaseTestCase
 
@@ -348,3 +357,146 @@ class WhooshSearchBackendDocumentSearchTestCase(
             user=self._test_case_user
         )
         self.assertEqual(queryset.count(), 1)
+
+    def test_bulk_created_instances(self):
+        self._upload_test_document(label='first_doc')
+
+        self.grant_access(
+            obj=self.test_document,
+            permission=permission_document_version_view
+        )
+
+        queryset = self.search_backend.search(
+            search_model=document_version_page_search,
+            query_string={'q': 'first*'}, user=self._test_case_user
+        )
+        self.assertEqual(
+            queryset.count(), self.test_document.version_active.pages.count()
+        )
+
+    def test_index_instances(self):
+        self._upload_test_document(label='first_doc')
+        self._upload_test_document(label='second_doc')
+
+        for test_document in self.test_documents:
+            self.grant_access(
+                obj=test_document, permission=permission_document_view
+            )
+
+        self.search_backend.clear_search_model_index(
+            search_model=document_search
+        )
+
+        self.search_backend.index_instances(
+            id_list=[
+                test_document.pk for test_document in self.test_documents
+            ], search_model=document_search
+        )
+
+        queryset = self.search_backend.search(
+            search_model=document_search,
+            query_string={'q': 'first* OR second*'}, user=self._test_case_user
+        )
+        self.assertEqual(queryset.count(), 2)
+
+    def test_index_search_model(self):
+        self._upload_test_document(label='first_doc')
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_view
+        )
+
+        self.search_backend.clear_search_model_index(
+            search_model=document_search
+        )
+        self.search_backend.index_search_model(search_model=document_search)
+
+        queryset = self.search_backend.search(
+            search_model=document_search,
+            query_string={'q': 'first*'}, user=self._test_case_user
+        )
+        self.assertEqual(queryset.count(), 1)
+
+    def test_search_model_lock_isolation(self):
+        self._upload_test_document(label='first_doc')
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self.search_backend.get_lock_name(
+                search_model=document_search
+            )
+        )
+
+        try:
+            # Indexing other search models is not blocked.
+            self.search_backend.index_instances(
+                id_list=[self.test_document_type.pk],
+                search_model=document_type_search
+            )
+
+            with self.assertRaises(expected_exception=LockError):
+                self.search_backend.index_instances(
+                    id_list=[self.test_document.pk],
+                    search_model=document_search
+                )
+        finally:
+            lock.release()
+
+    def test_async_writer(self):
+        setting_backend_arguments.set(
+            value={
+                'index_path': setting_backend_arguments.value['index_path'],
+                'writer_async': True
+            }
+        )
+        self.search_backend = SearchBackend.get_instance()
+
+        self._upload_test_document(label='first_doc')
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_view
+        )
+
+        queryset = self.search_backend.search(
+            search_model=document_search,
+            query_string={'q': 'first*'}, user=self._test_case_user
+        )
+        self.assertEqual(queryset.count(), 1)
+
+    def test_index_instances_queryset_error(self):
+        self._upload_test_document(label='first_doc')
+
+        test_queryset = mock.MagicMock()
+        test_queryset.__iter__.side_effect = DatabaseError
+
+        with mock.patch.object(
+            document_search, 'get_indexing_queryset',
+            return_value=test_queryset
+        ):
+            with self.assertRaises(expected_exception=DatabaseError):
+                self.search_backend.index_instances(
+                    id_list=[self.test_document.pk],
+                    search_model=document_search
+                )
+
+    def test_index_write_lock(self):
+        setting_backend_arguments.set(
+            value={
+                'index_path': setting_backend_arguments.value['index_path'],
+                'writer_async': True
+            }
+        )
+        self.search_backend = SearchBackend.get_instance()
+
+        self._upload_test_document(label='first_doc')
+
+        # Emulate an asynchronous writer holding Whoosh's index lock.
+        writer = self.search_backend.get_index(
+            search_model=document_search
+        ).writer()
+
+        try:
+            with self.assertRaises(expected_exception=LockError):
+                self.search_backend.index_instances(
+                    id_list=[self.test_document.pk],
+                    search_model=document_search
+                )
+        finally:
+            writer.cancel()
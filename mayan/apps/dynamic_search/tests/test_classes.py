@@ -90,3 +90,35 @@ class ScopedSearchTestCase(DocumentTestMixin, TagTestMixin, BaseTestCase):
             user=self._test_case_user
         )
         self.assertEqual(queryset.count(), 1)
+
+
+class SearchModelTestCase(DocumentTestMixin, BaseTestCase):
+    auto_upload_test_document = False
+
+    def test_get_id_list_chunks(self):
+        for count in range(5):
+            self._create_test_document_stub()
+
+        id_list_chunks = list(
+            document_search.get_id_list_chunks(chunk_size=2)
+        )
+
+        self.assertEqual(
+            [len(id_list) for id_list in id_list_chunks], [2, 2, 1]
+        )
+        self.assertEqual(
+            sum(id_list_chunks, []),
+            sorted(
+                [test_document.pk for test_document in self.test_documents]
+            )
+        )
+
+    def test_get_indexing_queryset(self):
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+
+        queryset = document_search.get_indexing_queryset(
+            id_list=[self.test_documents[0].pk]
+        )
+
+        self.assertEqual(list(queryset), [self.test_documents[0]])
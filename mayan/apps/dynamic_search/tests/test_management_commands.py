@@ -0,0 +1,68 @@
+from io import StringIO
+
+from django.core import management
+from django.test import override_settings
+
+from mayan.apps.documents.permissions import permission_document_view
+from mayan.apps.documents.search import document_search
+from mayan.apps.documents.tests.mixins.document_mixins import DocumentTestMixin
+from mayan.apps.storage.utils import fs_cleanup, mkdtemp
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import SearchBackend
+from ..settings import setting_backend_arguments
+
+
+@override_settings(SEARCH_BACKEND='mayan.apps.dynamic_search.backends.whoosh.WhooshSearchBackend')
+class SearchReindexManagementCommandTestCase(
+    DocumentTestMixin, BaseTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        self.old_value = setting_backend_arguments.value
+        super().setUp()
+        setting_backend_arguments.set(
+            value={'index_path': mkdtemp()}
+        )
+        self.search_backend = SearchBackend.get_instance()
+
+    def tearDown(self):
+        fs_cleanup(
+            filename=setting_backend_arguments.value['index_path']
+        )
+        setting_backend_arguments.set(value=self.old_value)
+        super().tearDown()
+
+    def _call_command(self):
+        output = StringIO()
+        options = {
+            'chunk_size': 1,
+            'search_model': document_search.get_full_name(),
+            'stdout': output
+        }
+        management.call_command(command_name='search_reindex', **options)
+        return output.getvalue()
+
+    def test_search_reindex_command(self):
+        self._upload_test_document(label='first_doc')
+        self._upload_test_document(label='second_doc')
+
+        for test_document in self.test_documents:
+            self.grant_access(
+                obj=test_document, permission=permission_document_view
+            )
+
+        self.search_backend.clear_search_model_index(
+            search_model=document_search
+        )
+
+        output = self._call_command()
+
+        self.assertTrue('2/2' in output)
+
+        queryset = self.search_backend.search(
+            search_model=document_search,
+            query_string={'q': 'first* OR second*'}, user=self._test_case_user
+        )
+        self.assertEqual(queryset.count(), 2)
@@ -0,0 +1,118 @@
+from django.test import override_settings
+
+import mock
+
+from mayan.apps.documents.permissions import permission_document_view
+from mayan.apps.documents.search import document_search
+from mayan.apps.documents.tests.mixins.document_mixins import DocumentTestMixin
+from mayan.apps.lock_manager.exceptions import LockError
+from mayan.apps.storage.utils import fs_cleanup, mkdtemp
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import SearchBackend
+from ..models import UpdateQueueEntry
+from ..settings import setting_backend_arguments
+
+
+@override_settings(
+    SEARCH_BACKEND='mayan.apps.dynamic_search.backends.whoosh.WhooshSearchBackend',
+    SEARCH_UPDATE_QUEUE_ENABLE=True
+)
+class UpdateQueueEntryTestCase(DocumentTestMixin, BaseTestCase):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        self.old_value = setting_backend_arguments.value
+        super().setUp()
+        setting_backend_arguments.set(
+            value={'index_path': mkdtemp()}
+        )
+        self.search_backend = SearchBackend.get_instance()
+
+    def tearDown(self):
+        fs_cleanup(
+            filename=setting_backend_arguments.value['index_path']
+        )
+        setting_backend_arguments.set(value=self.old_value)
+        super().tearDown()
+
+    def test_instance_update_coalescing(self):
+        self._create_test_document_stub()
+        UpdateQueueEntry.objects.all().delete()
+
+        self.test_document.label = 'first_doc'
+        self.test_document.save()
+        self.test_document.save()
+        self.test_document.save()
+
+        self.assertEqual(UpdateQueueEntry.objects.get_queue_depth(), 1)
+        self.assertEqual(UpdateQueueEntry.objects.get_request_count(), 3)
+        self.assertEqual(UpdateQueueEntry.objects.get_coalescing_ratio(), 3)
+
+    def test_flush(self):
+        self._create_test_document_stub(label='first_doc')
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_view
+        )
+
+        queryset = self.search_backend.search(
+            search_model=document_search,
+            query_string={'q': 'first*'}, user=self._test_case_user
+        )
+        self.assertEqual(queryset.count(), 0)
+
+        result = UpdateQueueEntry.objects.flush(chunk_size=1)
+
+        self.assertEqual(UpdateQueueEntry.objects.get_queue_depth(), 0)
+        self.assertTrue(result['instance_count'] >= 1)
+
+        queryset = self.search_backend.search(
+            search_model=document_search,
+            query_string={'q': 'first*'}, user=self._test_case_user
+        )
+        self.assertEqual(queryset.count(), 1)
+
+    @mock.patch(
+        'mayan.apps.dynamic_search.backends.whoosh.WhooshSearchBackend.index_instance_list'
+    )
+    def test_flush_error(self, mock_index_instance_list):
+        mock_index_instance_list.side_effect = LockError
+
+        self._create_test_document_stub(label='first_doc')
+        queue_depth = UpdateQueueEntry.objects.get_queue_depth()
+        request_count = UpdateQueueEntry.objects.get_request_count()
+
+        with self.assertRaises(expected_exception=LockError):
+            UpdateQueueEntry.objects.flush(chunk_size=100)
+
+        self.assertEqual(
+            UpdateQueueEntry.objects.get_queue_depth(), queue_depth
+        )
+        self.assertEqual(
+            UpdateQueueEntry.objects.get_request_count(), request_count
+        )
+
+    @mock.patch(
+        'mayan.apps.dynamic_search.backends.whoosh.WhooshSearchBackend.index_instance_list'
+    )
+    def test_flush_update_during_indexing(self, mock_index_instance_list):
+        self._create_test_document_stub(label='first_doc')
+        UpdateQueueEntry.objects.all().delete()
+        UpdateQueueEntry.objects.add(instance=self.test_document)
+
+        def index_instance_list(instance_list):
+            if mock_index_instance_list.call_count == 1:
+                # The instance is updated while being indexed.
+                UpdateQueueEntry.objects.add(instance=self.test_document)
+                self.assertEqual(
+                    UpdateQueueEntry.objects.get_request_count(), 2
+                )
+
+        mock_index_instance_list.side_effect = index_instance_list
+
+        UpdateQueueEntry.objects.flush(chunk_size=100)
+
+        # The instance is indexed again for the update received during
+        # the indexing.
+        self.assertEqual(mock_index_instance_list.call_count, 2)
+        self.assertEqual(UpdateQueueEntry.objects.get_queue_depth(), 0)
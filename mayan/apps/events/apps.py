@@ -1,3 +1,5 @@
+from celery.signals import task_postrun, task_prerun
+
 from django.apps import apps
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
@@ -10,6 +12,11 @@ from mayan.apps.common.menus import (
 from mayan.apps.navigation.classes import SourceColumn
 from mayan.apps.views.html_widgets import ObjectLinkWidget, TwoStateWidget
 
+from .classes import EventType
+from .handlers import (
+    handler_event_notification_batch_close,
+    handler_event_notification_batch_open, handler_event_notifications_queue
+)
 from .html_widgets import widget_event_actor_link, widget_event_type_link
 from .links import (
     link_current_user_events, link_current_user_events_export,
@@ -17,6 +24,7 @@ from .links import (
     link_events_list, link_events_list_export, link_notification_mark_read,
     link_notification_mark_read_all, link_user_notifications_list
 )
+from .signals import signal_post_events_commit
 
 
 class EventsApp(MayanAppConfig):
@@ -145,3 +153,19 @@ class EventsApp(MayanAppConfig):
                 link_event_types_subscriptions_list, link_current_user_events
             ), position=50
         )
+
+        signal_post_events_commit.connect(
+            dispatch_uid='events_handler_event_notifications_queue',
+            receiver=handler_event_notifications_queue, sender=EventType
+        )
+
+        # Queue the notifications of the events committed by a task as a
+        # single batch.
+        task_postrun.connect(
+            handler_event_notification_batch_close,
+            dispatch_uid='events_handler_event_notification_batch_close'
+        )
+        task_prerun.connect(
+            handler_event_notification_batch_open,
+            dispatch_uid='events_handler_event_notification_batch_open'
+        )
@@ -1,12 +1,15 @@
+from contextlib import contextmanager
 import csv
 import logging
+import threading
 
 from furl import furl
 
 from django.apps import apps
-from django.contrib.auth import get_user_model
-from django.core.exceptions import PermissionDenied
+from django.db import connection, transaction
+from django.db.models.signals import post_delete
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
@@ -17,12 +20,14 @@ from mayan.apps.common.settings import setting_project_url
 from mayan.apps.common.utils import return_attrib
 
 from .literals import (
-    DEFAULT_EVENT_LIST_EXPORT_FILENAME, EVENT_MANAGER_ORDER_AFTER
+    DEFAULT_EVENT_LIST_EXPORT_FILENAME, EVENT_MANAGER_ORDER_AFTER,
+    EVENT_NOTIFICATION_BATCH_SIZE
 )
 from .links import (
     link_events_for_object, link_object_event_types_user_subcriptions_list
 )
-from .permissions import permission_events_export, permission_events_view
+from .permissions import permission_events_export
+from .signals import signal_post_events_commit
 
 logger = logging.getLogger(name=__name__)
 
@@ -117,6 +122,80 @@ class ActionExporter:
             )
 
 
+class EventCommitBatch:
+    """
+    Defer the events committed while a batch is open and write them with
+    a single bulk insert when the outermost batch of the thread closes.
+    The receivers of signal_post_events_commit are called once for all
+    the events of the batch.
+    """
+    _local = threading.local()
+
+    @classmethod
+    def add(cls, action_list):
+        cls._local.action_list.extend(action_list)
+
+    @classmethod
+    def discard_object(cls, instance):
+        """
+        Remove the deferred actions that reference a deleted object. Saved
+        actions are deleted along with the objects they reference by the
+        generic relations added by actstream.
+        """
+        ContentType = apps.get_model(
+            app_label='contenttypes', model_name='ContentType'
+        )
+
+        content_type_id = ContentType.objects.get_for_model(model=instance).pk
+        object_id = str(instance.pk)
+
+        cls._local.action_list = [
+            action_instance for action_instance in cls._local.action_list
+            if not any(
+                getattr(
+                    action_instance, '{}_content_type_id'.format(name)
+                ) == content_type_id and str(
+                    getattr(action_instance, '{}_object_id'.format(name))
+                ) == object_id for name in (
+                    'action_object', 'actor', 'target'
+                )
+            )
+        ]
+
+    @classmethod
+    def close(cls):
+        cls._local.depth -= 1
+
+        if not cls._local.depth:
+            action_list = cls._local.action_list
+            cls._local.action_list = []
+
+            if action_list:
+                EventType.commit_actions(action_list=action_list)
+
+    @classmethod
+    def is_open(cls):
+        return bool(getattr(cls._local, 'depth', 0))
+
+    @classmethod
+    def open(cls):
+        if not cls.is_open():
+            cls._local.action_list = []
+            cls._local.depth = 0
+
+        cls._local.depth += 1
+
+    @classmethod
+    @contextmanager
+    def scope(cls):
+        cls.open()
+
+        try:
+            yield
+        finally:
+            cls.close()
+
+
 class EventManager:
     EVENT_ATTRIBUTES = ('ignore', 'keep_attributes',)
     EVENT_ARGUMENTS = ('actor', 'action_object', 'target')
@@ -207,8 +286,18 @@ class EventModelRegistry:
     @staticmethod
     def register(model, bind_links=True, menu=None):
         from actstream import registry
+
+        from .handlers import handler_event_commit_batch_discard_object
+
         registry.register(model)
 
+        # Only the models registered with actstream can be referenced by
+        # the deferred actions.
+        post_delete.connect(
+            dispatch_uid='events_handler_event_commit_batch_discard_object',
+            receiver=handler_event_commit_batch_discard_object, sender=model
+        )
+
         if bind_links:
             menu = menu or menu_list_facet
 
@@ -252,6 +341,72 @@ class EventTypeNamespace:
         return EventType.sort(event_type_list=self.event_types)
 
 
+class EventNotificationBatch:
+    """
+    Collect the actions committed while a batch is open and queue the
+    creation of their notifications in tasks of up to
+    EVENT_NOTIFICATION_BATCH_SIZE actions when the outermost batch of the
+    thread closes. Actions committed outside of a batch are queued
+    individually.
+    """
+    _local = threading.local()
+
+    @staticmethod
+    def queue(action_id_list):
+        from .tasks import task_event_notifications_create
+
+        def queue_tasks():
+            for index in range(0, len(action_id_list), EVENT_NOTIFICATION_BATCH_SIZE):
+                task_event_notifications_create.apply_async(
+                    kwargs={
+                        'action_id_list': action_id_list[
+                            index:index + EVENT_NOTIFICATION_BATCH_SIZE
+                        ]
+                    }
+                )
+
+        # The tasks must not run before the actions are committed.
+        transaction.on_commit(func=queue_tasks)
+
+    @classmethod
+    def add(cls, action_list):
+        action_id_list = [action.pk for action in action_list]
+
+        if getattr(cls._local, 'depth', 0):
+            cls._local.action_id_list.extend(action_id_list)
+        else:
+            cls.queue(action_id_list=action_id_list)
+
+    @classmethod
+    def close(cls):
+        cls._local.depth -= 1
+
+        if not cls._local.depth:
+            action_id_list = cls._local.action_id_list
+            cls._local.action_id_list = []
+
+            if action_id_list:
+                cls.queue(action_id_list=action_id_list)
+
+    @classmethod
+    def open(cls):
+        if not getattr(cls._local, 'depth', 0):
+            cls._local.action_id_list = []
+            cls._local.depth = 0
+
+        cls._local.depth += 1
+
+    @classmethod
+    @contextmanager
+    def scope(cls):
+        cls.open()
+
+        try:
+            yield
+        finally:
+            cls.close()
+
+
 class EventType:
     _registry = {}
 
@@ -273,6 +428,30 @@ class EventType:
         except KeyError:
             return _('Unknown or obsolete event type: %s') % name
 
+    @staticmethod
+    def commit_actions(action_list):
+        """
+        Save a list of unsaved actions and send signal_post_events_commit
+        once for all of them.
+        """
+        Action = apps.get_model(app_label='actstream', model_name='Action')
+
+        if connection.features.can_return_ids_from_bulk_insert:
+            action_list = Action.objects.bulk_create(objs=action_list)
+        else:
+            # The receivers of the signal need the primary keys which
+            # are only returned by some database backends when using
+            # bulk_create.
+            with transaction.atomic():
+                for action_instance in action_list:
+                    action_instance.save(force_insert=True)
+
+        signal_post_events_commit.send(
+            sender=EventType, action_list=action_list
+        )
+
+        return action_list
+
     @classmethod
     def refresh(cls):
         for event_type in cls.all():
@@ -291,21 +470,7 @@ class EventType:
     def __str__(self):
         return '{}: {}'.format(self.namespace.label, self.label)
 
-    def commit(self, actor=None, action_object=None, target=None):
-        AccessControlList = apps.get_model(
-            app_label='acls', model_name='AccessControlList'
-        )
-        EventSubscription = apps.get_model(
-            app_label='events', model_name='EventSubscription'
-        )
-        Notification = apps.get_model(
-            app_label='events', model_name='Notification'
-        )
-        ObjectEventSubscription = apps.get_model(
-            app_label='events', model_name='ObjectEventSubscription'
-        )
-        User = get_user_model()
-
+    def _check_arguments(self, actor, target):
         if actor is None and target is None:
             # If the actor and the target are None there is no way to
             # create a new event.
@@ -313,6 +478,57 @@ class EventType:
                 'Attempting to commit event "%s" without an actor or a '
                 'target. This is not yet supported.', self
             )
+            return False
+
+        return True
+
+    def _get_action(self, actor=None, action_object=None, target=None):
+        """
+        Return an unsaved action with the same field values as the ones
+        created by the actstream action handler.
+        """
+        from actstream.registry import check
+
+        if not self._check_arguments(actor=actor, target=target):
+            return
+
+        Action = apps.get_model(app_label='actstream', model_name='Action')
+        ContentType = apps.get_model(
+            app_label='contenttypes', model_name='ContentType'
+        )
+
+        sender = actor or target
+
+        result = Action(
+            actor_content_type=ContentType.objects.get_for_model(
+                model=sender
+            ), actor_object_id=sender.pk, public=True,
+            timestamp=timezone.now(), verb=self.id
+        )
+
+        for name, obj in (('action_object', action_object), ('target', target)):
+            if obj is not None:
+                check(obj)
+                setattr(result, '{}_object_id'.format(name), obj.pk)
+                setattr(
+                    result, '{}_content_type'.format(name),
+                    ContentType.objects.get_for_model(model=obj)
+                )
+
+        return result
+
+    def commit(self, actor=None, action_object=None, target=None):
+        if EventCommitBatch.is_open():
+            result = self._get_action(
+                actor=actor, action_object=action_object, target=target
+            )
+
+            if result:
+                EventCommitBatch.add(action_list=(result,))
+
+            return result
+
+        if not self._check_arguments(actor=actor, target=target):
             return
 
         result = action.send(
@@ -322,73 +538,33 @@ class EventType:
         # The [0][1] means: get the first and only action from the list
         # and ignore the handler.
 
-        # Create notifications for the actions created by the event committed.
-
-        # Gather the users subscribed globally to the event.
-        user_queryset = User.objects.filter(
-            id__in=EventSubscription.objects.filter(
-                stored_event_type__name=result.verb
-            ).values('user')
+        signal_post_events_commit.send(
+            sender=EventType, action_list=(result,)
         )
 
-        # Gather the users subscribed to the target object event.
-        if result.target:
-            user_queryset = user_queryset | User.objects.filter(
-                id__in=ObjectEventSubscription.objects.filter(
-                    content_type=result.target_content_type,
-                    object_id=result.target.pk,
-                    stored_event_type__name=result.verb
-                ).values('user')
-            )
+        return result
 
-        # Gather the users subscribed to the action object event.
-        if result.action_object:
-            user_queryset = user_queryset | User.objects.filter(
-                id__in=ObjectEventSubscription.objects.filter(
-                    content_type=result.action_object_content_type,
-                    object_id=result.action_object.pk,
-                    stored_event_type__name=result.verb
-                ).values('user')
+    def commit_bulk(self, event_list):
+        """
+        Commit one event for each (actor, action_object, target) tuple of
+        event_list with a single bulk insert.
+        """
+        action_list = []
+
+        for actor, action_object, target in event_list:
+            result = self._get_action(
+                actor=actor, action_object=action_object, target=target
             )
 
-        for user in user_queryset:
-            if result.target:
-                try:
-                    AccessControlList.objects.check_access(
-                        obj=result.target,
-                        permissions=(permission_events_view,),
-                        user=user
-                    )
-                except PermissionDenied:
-                    """
-                    User is subscribed to the event but does
-                    not have permissions for the event's target.
-                    """
-                else:
-                    Notification.objects.create(action=result, user=user)
-                    # Don't check or add any other notification for the
-                    # same user-event-object.
-                    continue
-
-            if result.action_object:
-                try:
-                    AccessControlList.objects.check_access(
-                        obj=result.action_object,
-                        permissions=(permission_events_view,),
-                        user=user
-                    )
-                except PermissionDenied:
-                    """
-                    User is subscribed to the event but does
-                    not have permissions for the event's action_object.
-                    """
-                else:
-                    Notification.objects.create(action=result, user=user)
-                    # Don't check or add any other notification for the
-                    # same user-event-object.
-                    continue
+            if result:
+                action_list.append(result)
 
-        return result
+        if EventCommitBatch.is_open():
+            EventCommitBatch.add(action_list=action_list)
+        elif action_list:
+            EventType.commit_actions(action_list=action_list)
+
+        return action_list
 
     def get_stored_event_type(self):
         if not self.stored_event_type:
@@ -0,0 +1,18 @@
+from .classes import EventCommitBatch, EventNotificationBatch
+
+
+def handler_event_commit_batch_discard_object(sender, instance, **kwargs):
+    if EventCommitBatch.is_open() and instance.pk is not None:
+        EventCommitBatch.discard_object(instance=instance)
+
+
+def handler_event_notification_batch_close(sender, **kwargs):
+    EventNotificationBatch.close()
+
+
+def handler_event_notification_batch_open(sender, **kwargs):
+    EventNotificationBatch.open()
+
+
+def handler_event_notifications_queue(sender, action_list, **kwargs):
+    EventNotificationBatch.add(action_list=action_list)
@@ -2,3 +2,6 @@ DEFAULT_EVENT_LIST_EXPORT_FILENAME = 'events_list.csv'
 
 EVENT_MANAGER_ORDER_AFTER = 1
 EVENT_MANAGER_ORDER_BEFORE = 2
+
+EVENT_NOTIFICATION_BATCH_SIZE = 500
+EVENT_NOTIFICATION_RETRY_DELAY = 10
@@ -1,6 +1,12 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
 
+from mayan.apps.acls.classes import ModelPermission
+
+from .permissions import permission_events_view
+
 
 class EventSubscriptionManager(models.Manager):
     def create_for(self, stored_event_type, user):
@@ -15,6 +21,131 @@ class EventSubscriptionManager(models.Manager):
 
 
 class NotificationManager(models.Manager):
+    def create_for_actions(self, action_id_list):
+        """
+        Create the notifications of the subscribers of the actions. The
+        subscribers of all the actions are gathered with one query per
+        subscription type and content type and the access to the targets
+        and action objects is checked once per user and model. A user is
+        notified if it has access to the target or to the action object.
+        """
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+        Action = apps.get_model(app_label='actstream', model_name='Action')
+        EventSubscription = apps.get_model(
+            app_label='events', model_name='EventSubscription'
+        )
+        ObjectEventSubscription = apps.get_model(
+            app_label='events', model_name='ObjectEventSubscription'
+        )
+
+        actions = tuple(Action.objects.filter(pk__in=action_id_list))
+        verbs = {action.verb for action in actions}
+
+        # Subscribers keyed by verb and by verb and object reference.
+        subscribers = {}
+        # Action references to its target and action object as tuples of
+        # model and primary key.
+        action_references = {}
+        object_id_lists = {}
+
+        queryset = EventSubscription.objects.filter(
+            stored_event_type__name__in=verbs
+        ).values_list('stored_event_type__name', 'user_id')
+
+        for verb, user_id in queryset:
+            subscribers.setdefault(verb, set()).add(user_id)
+
+        for action in actions:
+            action_references[action.pk] = []
+
+            for content_type_id, object_id in (
+                (action.target_content_type_id, action.target_object_id),
+                (
+                    action.action_object_content_type_id,
+                    action.action_object_object_id
+                )
+            ):
+                if content_type_id and object_id is not None:
+                    model = ContentType.objects.get_for_id(
+                        id=content_type_id
+                    ).model_class()
+
+                    if model:
+                        reference = (
+                            model, model._meta.pk.to_python(object_id)
+                        )
+                        action_references[action.pk].append(reference)
+                        object_id_lists.setdefault(model, set()).add(
+                            reference[1]
+                        )
+
+        for model, object_id_list in object_id_lists.items():
+            queryset = ObjectEventSubscription.objects.filter(
+                content_type=ContentType.objects.get_for_model(model=model),
+                object_id__in=object_id_list,
+                stored_event_type__name__in=verbs
+            ).values_list('stored_event_type__name', 'object_id', 'user_id')
+
+            for verb, object_id, user_id in queryset:
+                subscribers.setdefault(
+                    (verb, model, object_id), set()
+                ).add(user_id)
+
+        # Users to check for each model.
+        user_id_lists = {}
+        action_users = {}
+
+        for action in actions:
+            user_id_list = set(subscribers.get(action.verb, ()))
+
+            for model, object_id in action_references[action.pk]:
+                user_id_list.update(
+                    subscribers.get((action.verb, model, object_id), ())
+                )
+
+            if action_references[action.pk]:
+                action_users[action.pk] = user_id_list
+
+                for model, object_id in action_references[action.pk]:
+                    user_id_lists.setdefault(model, set()).update(
+                        user_id_list
+                    )
+
+        users = get_user_model().objects.in_bulk(
+            id_list=set().union(*user_id_lists.values())
+        )
+
+        # Objects of each model accessible by each user.
+        allowed_object_id_lists = {}
+        for model, user_id_list in user_id_lists.items():
+            queryset = ModelPermission.get_manager(model=model).filter(
+                pk__in=object_id_lists[model]
+            )
+
+            for user_id in user_id_list.intersection(users):
+                allowed_object_id_lists[(model, user_id)] = set(
+                    AccessControlList.objects.restrict_queryset(
+                        permission=permission_events_view,
+                        queryset=queryset, user=users[user_id]
+                    ).values_list('pk', flat=True)
+                )
+
+        notifications = []
+        for action in actions:
+            for user_id in action_users.get(action.pk, ()):
+                for model, object_id in action_references[action.pk]:
+                    if object_id in allowed_object_id_lists.get((model, user_id), ()):
+                        notifications.append(
+                            self.model(action=action, user_id=user_id)
+                        )
+                        # Don't add any other notification for the same
+                        # user and action.
+                        break
+
+        return self.bulk_create(objs=notifications)
+
     def get_unread(self):
         return self.filter(read=False)
 
@@ -0,0 +1,14 @@
+from ..classes import EventNotificationBatch
+
+
+class EventNotificationBatchMiddleware:
+    """
+    Queue the notifications of all the events committed while processing
+    a request as a single batch.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with EventNotificationBatch.scope():
+            return self.get_response(request)
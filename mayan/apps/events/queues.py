@@ -8,6 +8,11 @@ queue_events = CeleryQueue(
     worker=worker_c
 )
 
+queue_events.add_task_type(
+    dotted_path='mayan.apps.events.tasks.task_event_notifications_create',
+    label=_('Create event notifications'),
+    name='task_event_notifications_create',
+)
 queue_events.add_task_type(
     dotted_path='mayan.apps.events.tasks.task_event_queryset_export',
     label=_('Export event querysets'), name='task_event_queryset_export',
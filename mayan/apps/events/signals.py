@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+signal_post_events_commit = Signal(
+    providing_args=('action_list',), use_caching=True
+)
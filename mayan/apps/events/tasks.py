@@ -1,9 +1,12 @@
+from django.apps import apps
 from django.contrib.auth import get_user_model
+from django.db import OperationalError
 
 from mayan.apps.common.classes import QuerysetParametersSerializer
 from mayan.celery import app
 
 from .classes import ActionExporter
+from .literals import EVENT_NOTIFICATION_RETRY_DELAY
 
 
 @app.task(ignore_result=True)
@@ -18,3 +21,20 @@ def task_event_queryset_export(decomposed_queryset, user_id=None):
         user = None
 
     ActionExporter(queryset=queryset).export_to_download_file(user=user)
+
+
+@app.task(
+    bind=True, default_retry_delay=EVENT_NOTIFICATION_RETRY_DELAY,
+    ignore_result=True
+)
+def task_event_notifications_create(self, action_id_list):
+    Notification = apps.get_model(
+        app_label='events', model_name='Notification'
+    )
+
+    try:
+        Notification.objects.create_for_actions(
+            action_id_list=action_id_list
+        )
+    except OperationalError as exception:
+        raise self.retry(exc=exception)
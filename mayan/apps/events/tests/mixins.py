@@ -1,4 +1,5 @@
 from actstream.models import Action
+import mock
 
 from mayan.apps.acls.classes import ModelPermission
 from mayan.apps.permissions.tests.mixins import RoleTestMixin
@@ -113,6 +114,17 @@ class EventsExportViewTestMixin:
 class NotificationTestMixin(
     EventTypeTestMixin, GroupTestMixin, RoleTestMixin
 ):
+    def setUp(self):
+        super().setUp()
+        # The transaction of the test case is never committed, queue the
+        # notification tasks immediately.
+        patcher = mock.patch(
+            'django.db.transaction.on_commit',
+            side_effect=lambda func: func()
+        )
+        self._mock_transaction_on_commit = patcher.start()
+        self.addCleanup(patcher.stop)
+
     def _create_local_test_object(self):
         super()._create_test_object()
 
@@ -1,9 +1,13 @@
+import mock
+
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..classes import (
-    EventManagerMethodAfter, EventModelRegistry, EventType, ModelEventType
+    EventCommitBatch, EventManagerMethodAfter, EventModelRegistry, EventType,
+    ModelEventType
 )
 from ..decorators import method_event
+from ..signals import signal_post_events_commit
 
 from .mixins import EventTypeTestMixin
 
@@ -45,3 +49,91 @@ class EventManagerTestCase(EventTypeTestMixin, BaseTestCase):
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
+
+
+class EventCommitBatchTestCase(EventTypeTestMixin, BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self._create_test_event_type()
+        self._create_test_user()
+
+        for index in range(2):
+            self._create_test_object()
+            EventModelRegistry.register(model=self.TestModel)
+
+        self.mock_receiver = mock.Mock()
+        signal_post_events_commit.connect(
+            dispatch_uid='events_test_mock_receiver',
+            receiver=self.mock_receiver, sender=EventType
+        )
+
+    def tearDown(self):
+        signal_post_events_commit.disconnect(
+            dispatch_uid='events_test_mock_receiver', sender=EventType
+        )
+        super().tearDown()
+
+    def test_commit_bulk(self):
+        self._clear_events()
+
+        self.test_event_type.commit_bulk(
+            event_list=(
+                (self.test_user, None, self.test_objects[0]),
+                (self.test_user, None, self.test_objects[1]),
+            )
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 2)
+        self.assertEqual(
+            {event.target for event in events}, set(self.test_objects)
+        )
+        self.assertEqual(events[0].actor, self.test_user)
+        self.assertEqual(events[0].verb, self.test_event_type.id)
+
+        self.assertEqual(self.mock_receiver.call_count, 1)
+        self.assertEqual(
+            len(self.mock_receiver.call_args[1]['action_list']), 2
+        )
+
+    def test_scope(self):
+        self._clear_events()
+
+        with EventCommitBatch.scope():
+            with EventCommitBatch.scope():
+                self.test_event_type.commit(target=self.test_objects[0])
+
+            self.test_event_type.commit(target=self.test_objects[1])
+
+            self.assertEqual(self._get_test_events().count(), 0)
+
+        self.assertEqual(self._get_test_events().count(), 2)
+        self.assertEqual(self.mock_receiver.call_count, 1)
+
+    def test_scope_deleted_object(self):
+        self._clear_events()
+
+        with EventCommitBatch.scope():
+            self.test_event_type.commit(target=self.test_objects[0])
+            self.test_event_type.commit(target=self.test_objects[1])
+            self.test_objects[0].delete()
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 1)
+        self.assertEqual(events[0].target, self.test_objects[1])
+
+    def test_scope_deleted_unregistered_object(self):
+        self._create_test_object()
+        self._clear_events()
+
+        with EventCommitBatch.scope():
+            self.test_event_type.commit(target=self.test_objects[0])
+
+            with mock.patch.object(
+                EventCommitBatch, 'discard_object'
+            ) as mock_discard_object:
+                self.test_objects[2].delete()
+
+            self.assertFalse(mock_discard_object.called)
+
+        self.assertEqual(self._get_test_events().count(), 1)
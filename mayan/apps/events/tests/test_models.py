@@ -1,6 +1,9 @@
+import mock
+
 from mayan.apps.acls.models import AccessControlList
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..classes import EventNotificationBatch
 from ..models import EventSubscription, Notification, ObjectEventSubscription
 from ..permissions import permission_events_view
 
@@ -435,3 +438,66 @@ class ObjectEventNotificationModelTestCase(NotificationTestMixin, BaseTestCase):
         self.assertEqual(notifications[0].action, result_1)
         self.assertEqual(notifications[1].user, self.test_users[0])
         self.assertEqual(notifications[1].action, result_0)
+
+
+class EventNotificationBatchTestCase(NotificationTestMixin, BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self._create_test_event_type()
+        self._create_local_test_user()
+        self._create_local_test_object()
+        self._create_local_test_object()
+
+        EventSubscription.objects.create(
+            stored_event_type=self.test_event_type.stored_event_type,
+            user=self.test_user
+        )
+
+        AccessControlList.objects.grant(
+            obj=self.test_objects[0], permission=permission_events_view,
+            role=self.test_role
+        )
+
+    def test_batch_notifications(self):
+        notification_count = Notification.objects.count()
+
+        with EventNotificationBatch.scope():
+            result_0 = self.test_event_type.commit(
+                target=self.test_objects[0]
+            )
+            self.test_event_type.commit(target=self.test_objects[1])
+
+            self.assertEqual(
+                Notification.objects.count(), notification_count
+            )
+
+        self.assertEqual(Notification.objects.count(), notification_count + 1)
+        notification = Notification.objects.first()
+        self.assertEqual(notification.user, self.test_user)
+        self.assertEqual(notification.action, result_0)
+
+    @mock.patch('mayan.apps.events.tasks.task_event_notifications_create.apply_async')
+    def test_batch_task_count(self, mock_apply_async):
+        with EventNotificationBatch.scope():
+            with EventNotificationBatch.scope():
+                self.test_event_type.commit(target=self.test_objects[0])
+
+            self.test_event_type.commit(target=self.test_objects[1])
+
+        self.assertEqual(mock_apply_async.call_count, 1)
+        self.assertEqual(
+            len(mock_apply_async.call_args[1]['kwargs']['action_id_list']), 2
+        )
+
+    @mock.patch('mayan.apps.events.tasks.task_event_notifications_create.apply_async')
+    def test_notifications_queued_on_transaction_commit(self, mock_apply_async):
+        self._mock_transaction_on_commit.reset_mock(side_effect=True)
+
+        self.test_event_type.commit(target=self.test_objects[0])
+
+        self.assertEqual(mock_apply_async.call_count, 0)
+        self.assertEqual(self._mock_transaction_on_commit.call_count, 1)
+
+        self._mock_transaction_on_commit.call_args[1]['func']()
+
+        self.assertEqual(mock_apply_async.call_count, 1)
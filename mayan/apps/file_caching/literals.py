@@ -1,2 +1,7 @@
+CACHE_PRUNE_LOCK_NAME = 'file_caching-cache_prune-{}'
+CACHE_PRUNE_LOCK_TIMEOUT = 600
+
 DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS = 100
-DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS = 100
+DEFAULT_PRUNE_BATCH_SIZE = 100
+DEFAULT_PRUNE_HIGH_WATER_MARK = 100
+DEFAULT_PRUNE_LOW_WATER_MARK = 90
@@ -0,0 +1,44 @@
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def operation_cache_total_size_calculate(apps, schema_editor):
+    Cache = apps.get_model(app_label='file_caching', model_name='Cache')
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+
+    for cache in Cache.objects.using(schema_editor.connection.alias).all():
+        cache.total_size = CachePartitionFile.objects.using(
+            schema_editor.connection.alias
+        ).filter(partition__cache=cache).aggregate(
+            file_size__sum=Sum('file_size')
+        )['file_size__sum'] or 0
+        cache.save(update_fields=('total_size',))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('file_caching', '0008_auto_20210426_0717'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cache', name='total_size',
+            field=models.BigIntegerField(
+                default=0, editable=False, help_text='Running total of the '
+                'size of the files in the cache in bytes.',
+                verbose_name='Total size'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='cachepartitionfile',
+            index=models.Index(
+                fields=['hits', 'datetime'], name='file_caching_eviction_idx'
+            ),
+        ),
+        migrations.RunPython(
+            code=operation_cache_total_size_calculate,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
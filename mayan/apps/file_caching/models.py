@@ -28,9 +28,10 @@ from .events import (
 )
 from .exceptions import FileCachingException
 from .settings import (
-    setting_maximum_failed_prune_attempts,
-    setting_maximum_normal_prune_attempts
+    setting_maximum_failed_prune_attempts, setting_prune_batch_size,
+    setting_prune_high_water_mark, setting_prune_low_water_mark
 )
+from .tasks import task_cache_prune
 
 logger = logging.getLogger(name=__name__)
 
@@ -46,6 +47,11 @@ class Cache(ValueChangeModelMixin, models.Model):
             validators.MinValueValidator(limit_value=1)
         ], verbose_name=_('Maximum size')
     )
+    total_size = models.BigIntegerField(
+        default=0, editable=False, help_text=_(
+            'Running total of the size of the files in the cache in bytes.'
+        ), verbose_name=_('Total size')
+    )
 
     class Meta:
         verbose_name = _('Cache')
@@ -84,14 +90,16 @@ class Cache(ValueChangeModelMixin, models.Model):
         """
         Return the actual usage of the cache.
         """
-        return self.get_files().aggregate(
-            file_size__sum=Sum('file_size')
-        )['file_size__sum'] or 0
+        return Cache.objects.filter(pk=self.pk).values_list(
+            'total_size', flat=True
+        ).first() or 0
 
     def get_total_size_display(self):
+        total_size = self.get_total_size()
+
         return format_lazy(
-            '{} ({:0.1f}%)', filesizeformat(bytes_=self.get_total_size()),
-            self.get_total_size() / self.maximum_size * 100
+            '{} ({:0.1f}%)', filesizeformat(bytes_=total_size),
+            total_size / self.maximum_size * 100
         )
 
     get_total_size_display.short_description = _('Current size')
@@ -101,32 +109,40 @@ class Cache(ValueChangeModelMixin, models.Model):
     def label(self):
         return self.get_defined_storage().label
 
+    def is_above_high_water_mark(self):
+        return self.get_total_size() >= self.maximum_size * setting_prune_high_water_mark.value / 100
+
     def prune(self):
         """
-        Deletes files until the total size of the cache is below the allowed
-        maximum size of the cache.
+        Deletes the least used files until the total size of the cache is
+        below the low water mark. Files are selected in batches, ordered
+        by hits and age.
         """
         failed_attempts = 0
-        normal_attempts = 0
-        file_index = 0
+        locked_file_id_list = []
+        target_size = self.maximum_size * setting_prune_low_water_mark.value / 100
+        total_size = self.get_total_size()
 
-        while self.get_total_size() >= self.maximum_size:
-            cache_partition_file_queryset = self.get_files().order_by(
-                'hits', 'datetime'
-            )
+        while total_size >= target_size:
+            cache_partition_file_queryset = self.get_files().exclude(
+                pk__in=locked_file_id_list
+            ).order_by('hits', 'datetime')[:setting_prune_batch_size.value]
 
-            try:
-                cache_partition_file = cache_partition_file_queryset[file_index]
-            except IndexError:
-                # Attempted to get a file beyond what the queryset provided.
-                file_index = 0
-            else:
+            cache_partition_files = list(cache_partition_file_queryset)
+
+            if not cache_partition_files:
+                # The running total no longer matches the files of the
+                # cache. Recalculate it and stop.
+                self.total_size_recalculate()
+                break
+
+            for cache_partition_file in cache_partition_files:
                 try:
                     cache_partition_file.delete()
                 except CachePartitionFile.DoesNotExist:
                     # The file selected from deletion was deleted by another
                     # process before the lock was acquired.
-                    file_index += 1
+                    """Ignore exception."""
                 except LockError:
                     logger.debug(
                         'Lock error trying to delete file "%s" for prune. '
@@ -134,21 +150,19 @@ class Cache(ValueChangeModelMixin, models.Model):
                         cache_partition_file
                     )
                     failed_attempts += 1
-                    file_index += 1
+                    locked_file_id_list.append(cache_partition_file.pk)
 
                     if failed_attempts > setting_maximum_failed_prune_attempts.value:
                         raise FileCachingException(
                             'Too many cache prune attempts failed.'
                         )
                 else:
-                    file_index = 0
-                    normal_attempts += 1
+                    total_size -= cache_partition_file.file_size
 
-                    if normal_attempts > setting_maximum_normal_prune_attempts.value:
-                        raise FileCachingException(
-                            'Too many cache prunes trying to create a '
-                            'single new file.'
-                        )
+                    if total_size < target_size:
+                        break
+
+            total_size = self.get_total_size()
 
     @method_event(
         event=event_cache_purged,
@@ -188,6 +202,14 @@ class Cache(ValueChangeModelMixin, models.Model):
             field='maximum_size'
         )
 
+        if not self._state.adding and 'update_fields' not in kwargs:
+            # The running total is only updated with F() expressions.
+            # Leave it out to avoid overwriting it with a stale value.
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'total_size'
+            ]
+
         result = super().save(*args, **kwargs)
 
         if self.maximum_size < old_maximum_size:
@@ -199,6 +221,15 @@ class Cache(ValueChangeModelMixin, models.Model):
     def storage(self):
         return self.get_defined_storage().get_storage_instance()
 
+    def total_size_recalculate(self):
+        """
+        Update the running total from the size of the files of the cache.
+        """
+        self.total_size = self.get_files().aggregate(
+            file_size__sum=Sum('file_size')
+        )['file_size__sum'] or 0
+        Cache.objects.filter(pk=self.pk).update(total_size=self.total_size)
+
 
 class CachePartition(models.Model):
     cache = models.ForeignKey(
@@ -229,7 +260,10 @@ class CachePartition(models.Model):
             lock = LockingBackend.get_backend().acquire_lock(name=lock_name)
             logger.debug('acquired lock: %s', lock_name)
             try:
-                self.cache.prune()
+                if self.cache.is_above_high_water_mark():
+                    task_cache_prune.apply_async(
+                        kwargs={'cache_id': self.cache.pk}
+                    )
 
                 # Since open "wb+" doesn't create files, force the creation
                 # of an empty file.
@@ -319,6 +353,12 @@ class CachePartitionFile(models.Model):
 
     class Meta:
         get_latest_by = 'datetime'
+        indexes = (
+            models.Index(
+                fields=('hits', 'datetime'),
+                name='file_caching_eviction_idx'
+            ),
+        )
         unique_together = ('partition', 'filename')
         verbose_name = _('Cache partition file')
         verbose_name_plural = _('Cache partition files')
@@ -349,10 +389,14 @@ class CachePartitionFile(models.Model):
         """
         Called after creation and initial write only.
         """
+        old_file_size = self.file_size
         self.file_size = self.partition.cache.storage.size(
             name=self.full_filename
         )
         self.save()
+        Cache.objects.filter(pk=self.partition.cache_id).update(
+            total_size=F('total_size') + self.file_size - old_file_size
+        )
         if self.file_size > self.partition.cache.maximum_size:
             raise FileCachingException(
                 'Cache partition file %s is bigger than the maximum cache '
@@ -368,7 +412,11 @@ class CachePartitionFile(models.Model):
     @locked_class_method
     def delete(self, *args, **kwargs):
         self.partition.cache.storage.delete(name=self.full_filename)
-        return super().delete(*args, **kwargs)
+        result = super().delete(*args, **kwargs)
+        Cache.objects.filter(pk=self.partition.cache_id).update(
+            total_size=F('total_size') - self.file_size
+        )
+        return result
 
     @cached_property
     def full_filename(self):
@@ -3,8 +3,8 @@ from django.utils.translation import ugettext_lazy as _
 from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
-    DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS,
-    DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS
+    DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS, DEFAULT_PRUNE_BATCH_SIZE,
+    DEFAULT_PRUNE_HIGH_WATER_MARK, DEFAULT_PRUNE_LOW_WATER_MARK
 )
 
 namespace = SettingNamespace(label=_('File caching'), name='file_caching')
@@ -17,10 +17,24 @@ setting_maximum_failed_prune_attempts = namespace.add_setting(
         'giving up.'
     )
 )
-setting_maximum_normal_prune_attempts = namespace.add_setting(
-    default=DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS,
-    global_name='FILE_CACHING_MAXIMUM_NORMAL_PRUNE_ATTEMPTS', help_text=_(
-        'Number of times a cache will attempt to prune files to free up '
-        'space for new a file being requested, before giving up.'
+setting_prune_batch_size = namespace.add_setting(
+    default=DEFAULT_PRUNE_BATCH_SIZE,
+    global_name='FILE_CACHING_PRUNE_BATCH_SIZE', help_text=_(
+        'Number of cache files selected for deletion at a time when '
+        'pruning a cache.'
+    )
+)
+setting_prune_high_water_mark = namespace.add_setting(
+    default=DEFAULT_PRUNE_HIGH_WATER_MARK,
+    global_name='FILE_CACHING_PRUNE_HIGH_WATER_MARK', help_text=_(
+        'Percentage of the maximum size of a cache at which a background '
+        'prune of the cache is started.'
+    )
+)
+setting_prune_low_water_mark = namespace.add_setting(
+    default=DEFAULT_PRUNE_LOW_WATER_MARK,
+    global_name='FILE_CACHING_PRUNE_LOW_WATER_MARK', help_text=_(
+        'Percentage of the maximum size of a cache to which a cache is '
+        'reduced when pruned.'
     )
 )
@@ -3,9 +3,12 @@ import logging
 from django.apps import apps
 from django.contrib.auth import get_user_model
 
+from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
+from .literals import CACHE_PRUNE_LOCK_NAME, CACHE_PRUNE_LOCK_TIMEOUT
+
 logger = logging.getLogger(name=__name__)
 
 
@@ -69,3 +72,29 @@ def task_cache_purge(self, cache_id, user_id=None):
         raise self.retry(exc=exception)
     else:
         logger.info('Finished cache id %s purge', cache)
+
+
+@app.task(ignore_result=True)
+def task_cache_prune(cache_id):
+    Cache = apps.get_model(
+        app_label='file_caching', model_name='Cache'
+    )
+
+    lock_name = CACHE_PRUNE_LOCK_NAME.format(cache_id)
+
+    try:
+        logger.debug('trying to acquire lock: %s', lock_name)
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=lock_name, timeout=CACHE_PRUNE_LOCK_TIMEOUT
+        )
+    except LockError:
+        logger.debug('Cache id %s is already being pruned', cache_id)
+    else:
+        logger.debug('acquired lock: %s', lock_name)
+        try:
+            cache = Cache.objects.get(pk=cache_id)
+            logger.info('Starting cache id %s prune', cache)
+            cache.prune()
+            logger.info('Finished cache id %s prune', cache)
+        finally:
+            lock.release()
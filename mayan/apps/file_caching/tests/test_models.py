@@ -3,7 +3,7 @@ import mock
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..exceptions import FileCachingException
-from ..models import CachePartitionFile
+from ..models import Cache, CachePartitionFile
 
 from .literals import TEST_CACHE_PARTITION_FILE_FILENAME
 from .mixins import CacheTestMixin
@@ -160,6 +160,77 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         self.test_cache.save()
         self.assertTrue(mock_cache_prune_method.called)
 
+    def test_cache_total_size(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=3)
+        self._create_test_cache_partition_file(file_size=5)
+
+        self.assertEqual(self.test_cache.get_total_size(), 8)
+
+        self.test_cache_partition_files[0].delete()
+
+        self.assertEqual(self.test_cache.get_total_size(), 5)
+
+    def test_cache_save_total_size(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+
+        test_cache = Cache.objects.get(pk=self.test_cache.pk)
+
+        self._create_test_cache_partition_file(file_size=3)
+
+        test_cache.label = 'edited'
+        test_cache.save()
+
+        self.assertEqual(self.test_cache.get_total_size(), 3)
+
+    def test_cache_prune_low_water_mark(self):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 10
+            }
+        )
+        self._create_test_cache_partition()
+
+        for index in range(10):
+            self._create_test_cache_partition_file(file_size=1)
+
+        with self.test_cache_partition_files[0].open():
+            """Increase hits of file #0"""
+
+        self.test_cache.prune()
+
+        # Pruned below the default low water mark of 90%.
+        self.assertEqual(self.test_cache.get_total_size(), 8)
+        self.assertTrue(
+            self.test_cache_partition_files[0] in CachePartitionFile.objects.all()
+        )
+        self.assertTrue(
+            self.test_cache_partition_files[1] not in CachePartitionFile.objects.all()
+        )
+        self.assertTrue(
+            self.test_cache_partition_files[2] not in CachePartitionFile.objects.all()
+        )
+
+    def test_cache_prune_total_size_recalculate(self):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 10
+            }
+        )
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+
+        # Files deleted in bulk do not update the running total.
+        self.test_cache_partition.files.all().delete()
+        self.assertEqual(self.test_cache.get_total_size(), 1)
+
+        self.test_cache.maximum_size = 1
+        self.test_cache.save()
+
+        self.assertEqual(self.test_cache.get_total_size(), 0)
+
     def test_incremental_file_index_cache_prune(self):
         self._create_test_cache(
             extra_data={
@@ -93,10 +93,14 @@ class FileMetadataDriver:
 
         results = self._process(document_file=document_file) or {}
 
-        for key, value in results.items():
-            document_file_driver_entry.entries.create(
-                key=key, value=value
-            )
+        document_file_driver_entry.entries.bulk_create(
+            objs=[
+                document_file_driver_entry.entries.model(
+                    document_file_driver_entry=document_file_driver_entry,
+                    key=key, value=value
+                ) for key, value in results.items()
+            ]
+        )
 
     def _process(self, document_file):
         raise NotImplementedError(
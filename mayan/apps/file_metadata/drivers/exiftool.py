@@ -1,6 +1,10 @@
+import atexit
 import json
 import logging
 from pathlib import Path
+import queue
+import subprocess
+import threading
 
 import sh
 
@@ -8,16 +12,173 @@ from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.storage.utils import fs_cleanup, mkdtemp
 
-from ..literals import DEFAULT_EXIF_PATH
+from ..literals import (
+    DEFAULT_EXIF_PATH, DEFAULT_EXIF_POOL_SIZE, DEFAULT_EXIF_POOL_TIMEOUT,
+    DEFAULT_EXIF_STAY_OPEN
+)
 from ..classes import FileMetadataDriver
+from ..exceptions import FileMetadataDriverError
 from ..settings import setting_drivers_arguments
 
 logger = logging.getLogger(name=__name__)
 
 
+class EXIFToolProcess:
+    """
+    Long lived exiftool process in "stay open" mode. Arguments are fed
+    one per line to the standard input and each command is terminated
+    with a numbered "-execute" argument. The output of each command ends
+    with the matching "{ready}" marker.
+    """
+    def __init__(self, exiftool_path):
+        self.command_number = 0
+        self.process = subprocess.Popen(
+            args=(
+                exiftool_path, '-stay_open', 'True', '-@', '-',
+                '-common_args', '-j'
+            ), stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+
+    def close(self):
+        if self.is_alive():
+            try:
+                self.process.stdin.write(b'-stay_open\nFalse\n')
+                self.process.stdin.flush()
+                self.process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+                self.process.wait()
+
+    def execute(self, *args):
+        self.command_number += 1
+        ready_marker = '{{ready{}}}'.format(self.command_number).encode()
+
+        lines = list(args)
+        lines.append('-execute{}'.format(self.command_number))
+
+        self.process.stdin.write(
+            ''.join('{}\n'.format(line) for line in lines).encode('utf-8')
+        )
+        self.process.stdin.flush()
+
+        output = []
+        while True:
+            line = self.process.stdout.readline()
+            if not line:
+                raise FileMetadataDriverError(
+                    'exiftool process exited unexpectedly.'
+                )
+            elif line.rstrip() == ready_marker:
+                break
+            else:
+                output.append(line)
+
+        return b''.join(output).decode('utf-8')
+
+    def is_alive(self):
+        return self.process.poll() is None
+
+
+class EXIFToolProcessPool:
+    """
+    Process local pool of exiftool processes. Processes are started
+    lazily up to the pool size and are reused by all the driver
+    instances of the process. If no process becomes available before the
+    timeout, a replacement is started over the pool size and the extra
+    processes are discarded as they finish.
+    """
+    def __init__(self, exiftool_path, size, timeout=DEFAULT_EXIF_POOL_TIMEOUT):
+        self.exiftool_path = exiftool_path
+        self.lock = threading.Lock()
+        self.process_count = 0
+        self.process_queue = queue.LifoQueue()
+        self.processes = []
+        self.size = size
+        self.timeout = timeout
+
+    def _spawn(self):
+        self.process_count += 1
+        try:
+            process = EXIFToolProcess(exiftool_path=self.exiftool_path)
+        except Exception:
+            self.process_count -= 1
+            raise
+        else:
+            self.processes.append(process)
+            return process
+
+    def acquire(self):
+        try:
+            return self.process_queue.get_nowait()
+        except queue.Empty:
+            with self.lock:
+                if self.process_count < self.size:
+                    return self._spawn()
+
+            try:
+                return self.process_queue.get(timeout=self.timeout)
+            except queue.Empty:
+                logger.warning(
+                    'No exiftool process became available after %s seconds. '
+                    'Starting a replacement process.', self.timeout
+                )
+
+                with self.lock:
+                    return self._spawn()
+
+    def close(self):
+        with self.lock:
+            for process in self.processes:
+                process.close()
+
+            self.process_count = 0
+            self.process_queue = queue.LifoQueue()
+            self.processes = []
+
+    def discard(self, process):
+        process.close()
+        with self.lock:
+            self.process_count -= 1
+            self.processes.remove(process)
+
+    def execute(self, *args):
+        process = self.acquire()
+
+        try:
+            result = process.execute(*args)
+        except Exception:
+            self.discard(process=process)
+            raise
+        else:
+            self.release(process=process)
+
+        return result
+
+    def release(self, process):
+        """
+        Return a process to the pool. Processes that exited or that exceed
+        the pool size are discarded.
+        """
+        if process.is_alive() and self.process_count <= self.size:
+            self.process_queue.put(process)
+        else:
+            self.discard(process=process)
+
+
 class EXIFToolDriver(FileMetadataDriver):
     label = _('EXIF Tool')
     internal_name = 'exiftool'
+    _process_pools = {}
+    _process_pools_lock = threading.Lock()
+
+    @classmethod
+    def close_process_pools(cls):
+        with cls._process_pools_lock:
+            for process_pool in cls._process_pools.values():
+                process_pool.close()
+
+            cls._process_pools = {}
 
     def __init__(self, *args, **kwargs):
         auto_initialize = kwargs.pop('auto_initialize', True)
@@ -35,21 +196,27 @@ class EXIFToolDriver(FileMetadataDriver):
     def _process(self, document_file):
         if self.command_exiftool:
             temporary_folder = mkdtemp()
-            path_temporary_file = Path(temporary_folder, document_file.document.label)
+            path_temporary_file = Path(
+                temporary_folder, document_file.document.label
+            )
 
             try:
+                # exiftool reports the file name as part of the results.
+                # Copy the file using the label of the document as the
+                # name.
                 with path_temporary_file.open(mode='xb') as temporary_fileobject:
-                    document_file.save_to_file(file_object=temporary_fileobject)
-                    temporary_fileobject.seek(0)
-                    try:
-                        result = self.command_exiftool(temporary_fileobject.name)
-                    except sh.ErrorReturnCode_1 as exception:
-                        result = json.loads(s=exception.stdout)[0]
-                        if result.get('Error', '') == 'Unknown file type':
-                            # Not a fatal error
-                            return result
-                    else:
-                        return json.loads(s=result.stdout)[0]
+                    document_file.save_to_file(
+                        file_object=temporary_fileobject
+                    )
+
+                if self.stay_open:
+                    return self._process_stay_open(
+                        path=str(path_temporary_file)
+                    )
+                else:
+                    return self._process_command(
+                        path=str(path_temporary_file)
+                    )
             except Exception as exception:
                 logger.error(
                     'Error processing document file: %s; %s',
@@ -58,16 +225,62 @@ class EXIFToolDriver(FileMetadataDriver):
                 raise
             finally:
                 fs_cleanup(filename=str(path_temporary_file))
+                fs_cleanup(filename=temporary_folder)
         else:
             logger.warning(
                 'EXIFTool binary not found, not processing document '
                 'file: %s', document_file
             )
 
+    def _process_command(self, path):
+        try:
+            result = self.command_exiftool(path)
+        except sh.ErrorReturnCode_1 as exception:
+            result = json.loads(s=exception.stdout)[0]
+            if result.get('Error', '') == 'Unknown file type':
+                # Not a fatal error
+                return result
+        else:
+            return json.loads(s=result.stdout)[0]
+
+    def _process_stay_open(self, path):
+        output = self.get_process_pool().execute(path)
+
+        # Errors like "Unknown file type" are part of the JSON output
+        # and are not fatal.
+        if output.strip():
+            return json.loads(s=output)[0]
+
+    def get_process_pool(self):
+        with self.__class__._process_pools_lock:
+            try:
+                return self.__class__._process_pools[self.exiftool_path]
+            except KeyError:
+                process_pool = EXIFToolProcessPool(
+                    exiftool_path=self.exiftool_path, size=self.pool_size,
+                    timeout=self.pool_timeout
+                )
+                self.__class__._process_pools[self.exiftool_path] = process_pool
+                return process_pool
+
     def read_settings(self):
-        self.exiftool_path = setting_drivers_arguments.value.get(
+        driver_arguments = setting_drivers_arguments.value.get(
             'exif_driver', {}
-        ).get('exiftool_path', DEFAULT_EXIF_PATH)
+        )
+
+        self.exiftool_path = driver_arguments.get(
+            'exiftool_path', DEFAULT_EXIF_PATH
+        )
+        self.pool_size = driver_arguments.get(
+            'pool_size', DEFAULT_EXIF_POOL_SIZE
+        )
+        self.pool_timeout = driver_arguments.get(
+            'pool_timeout', DEFAULT_EXIF_POOL_TIMEOUT
+        )
+        self.stay_open = driver_arguments.get(
+            'stay_open', DEFAULT_EXIF_STAY_OPEN
+        )
 
 
+atexit.register(EXIFToolDriver.close_process_pools)
 EXIFToolDriver.register(mimetypes=('*',))
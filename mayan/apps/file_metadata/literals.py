@@ -5,9 +5,19 @@ if platform.system() in ('FreeBSD', 'OpenBSD', 'Darwin'):
 else:
     DEFAULT_EXIF_PATH = '/usr/bin/exiftool'
 
+DEFAULT_EXIF_POOL_SIZE = 2
+DEFAULT_EXIF_POOL_TIMEOUT = 60
+DEFAULT_EXIF_STAY_OPEN = True
+
 LOCK_EXPIRE = 60 * 10  # Adjust to worst case scenario
 
 DEFAULT_FILE_METADATA_AUTO_PROCESS = True
 DEFAULT_FILE_METADATA_DRIVERS_ARGUMENTS = {
-    'exif_driver': {'exiftool_path': DEFAULT_EXIF_PATH}
+    'exif_driver': {
+        'exiftool_path': DEFAULT_EXIF_PATH,
+        'pool_size': DEFAULT_EXIF_POOL_SIZE,
+        'pool_timeout': DEFAULT_EXIF_POOL_TIMEOUT,
+        'stay_open': DEFAULT_EXIF_STAY_OPEN
+    }
 }
+DEFAULT_FILE_METADATA_PROCESSING_BATCH_SIZE = 50
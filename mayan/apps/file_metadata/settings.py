@@ -4,7 +4,8 @@ from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
     DEFAULT_FILE_METADATA_AUTO_PROCESS,
-    DEFAULT_FILE_METADATA_DRIVERS_ARGUMENTS
+    DEFAULT_FILE_METADATA_DRIVERS_ARGUMENTS,
+    DEFAULT_FILE_METADATA_PROCESSING_BATCH_SIZE
 )
 from .setting_migrations import FileMetadataSettingMigration
 
@@ -22,6 +23,17 @@ setting_auto_process = namespace.add_setting(
 setting_drivers_arguments = namespace.add_setting(
     default=DEFAULT_FILE_METADATA_DRIVERS_ARGUMENTS,
     global_name='FILE_METADATA_DRIVERS_ARGUMENTS', help_text=_(
-        'Arguments to pass to the drivers.'
+        'Arguments to pass to the drivers. The EXIF tool driver accepts '
+        '"exiftool_path", "stay_open" to keep a pool of long lived exiftool '
+        'processes, "pool_size" for the maximum number of processes of '
+        'the pool per worker process and "pool_timeout" for the number of '
+        'seconds to wait for a busy process before starting a replacement.'
+    )
+)
+setting_processing_batch_size = namespace.add_setting(
+    default=DEFAULT_FILE_METADATA_PROCESSING_BATCH_SIZE,
+    global_name='FILE_METADATA_PROCESSING_BATCH_SIZE', help_text=_(
+        'Maximum number of document files to process per file metadata '
+        'batch task.'
     )
 )
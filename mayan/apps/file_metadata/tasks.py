@@ -13,15 +13,8 @@ from .classes import FileMetadataDriver
 logger = logging.getLogger(name=__name__)
 
 
-@app.task(ignore_result=True)
-def task_process_document_file(document_file_id):
-    DocumentFile = apps.get_model(
-        app_label='documents', model_name='DocumentFile'
-    )
-
-    document_file = DocumentFile.objects.get(pk=document_file_id)
-
-    lock_id = 'task_process_document_file-%d' % document_file_id
+def _process_document_file(document_file):
+    lock_id = 'task_process_document_file-%d' % document_file.pk
     try:
         logger.debug('trying to acquire lock: %s', lock_id)
         # Acquire lock to avoid processing the same document file more
@@ -37,3 +30,35 @@ def task_process_document_file(document_file_id):
             )
         finally:
             lock.release()
+
+
+@app.task(ignore_result=True)
+def task_process_document_file(document_file_id):
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+
+    document_file = DocumentFile.objects.get(pk=document_file_id)
+
+    _process_document_file(document_file=document_file)
+
+
+@app.task(ignore_result=True)
+def task_process_document_file_list(document_file_id_list):
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+
+    queryset = DocumentFile.objects.filter(
+        pk__in=document_file_id_list
+    ).select_related('document')
+
+    for document_file in queryset.iterator():
+        try:
+            _process_document_file(document_file=document_file)
+        except Exception as exception:
+            # Don't let one document file stop the rest of the batch.
+            logger.error(
+                'Error processing document file: %s; %s',
+                document_file, exception, exc_info=True
+            )
@@ -6,3 +6,29 @@ TEST_FILE_METADATA_INDEX_NODE_TEMPLATE = "{{{{ document.file_metadata_value_of.{
 )
 TEST_PDF_FILE_METADATA_DOTTED_NAME = 'exiftool__Producer'
 TEST_PDF_FILE_METADATA_VALUE = 'pdfTeX-1.40.10'
+TEST_FILE_METADATA_RESULTS = {
+    TEST_FILE_METADATA_KEY: TEST_FILE_METADATA_VALUE,
+    'MIMEType': 'image/png'
+}
+# Emulates the "stay open" mode of exiftool by reporting the path of
+# each command.
+TEST_EXIFTOOL_SCRIPT = '''#!{python}
+import json
+import sys
+
+arguments = []
+for line in iter(sys.stdin.readline, ''):
+    line = line.rstrip('\\n')
+    if line.startswith('-execute'):
+        sys.stdout.write(
+            json.dumps([{{'SourceFile': arguments[-1]}}]) + '\\n'
+        )
+        sys.stdout.write('{{ready%s}}\\n' % line[len('-execute'):])
+        sys.stdout.flush()
+        arguments = []
+    elif arguments == ['-stay_open'] and line == 'False':
+        break
+    else:
+        arguments.append(line)
+'''
+TEST_EXIFTOOL_SCRIPT_FILENAME = 'exiftool'
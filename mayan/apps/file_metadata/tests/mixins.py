@@ -1,3 +1,11 @@
+from pathlib import Path
+import sys
+
+from mayan.apps.storage.utils import fs_cleanup, mkdtemp
+
+from .literals import TEST_EXIFTOOL_SCRIPT, TEST_EXIFTOOL_SCRIPT_FILENAME
+
+
 class DocumentTypeViewsTestMixin:
     def _request_document_type_settings_view(self):
         return self.get(
@@ -13,6 +21,24 @@ class DocumentTypeViewsTestMixin:
         )
 
 
+class EXIFToolTestMixin:
+    def setUp(self):
+        super().setUp()
+        self.temporary_directory = mkdtemp()
+        path_exiftool = Path(
+            self.temporary_directory, TEST_EXIFTOOL_SCRIPT_FILENAME
+        )
+        path_exiftool.write_text(
+            data=TEST_EXIFTOOL_SCRIPT.format(python=sys.executable)
+        )
+        path_exiftool.chmod(mode=0o700)
+        self.test_exiftool_path = str(path_exiftool)
+
+    def tearDown(self):
+        fs_cleanup(filename=self.temporary_directory)
+        super().tearDown()
+
+
 class FileMetadataViewsTestMixin:
     def _request_document_file_driver_list_view(self):
         return self.get(
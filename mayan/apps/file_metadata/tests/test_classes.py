@@ -1,9 +1,18 @@
+import json
+
+import mock
+
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.documents.tests.literals import TEST_PDF_DOCUMENT_FILENAME
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..drivers.exiftool import EXIFToolProcess, EXIFToolProcessPool
 
 from .literals import (
-    TEST_PDF_FILE_METADATA_DOTTED_NAME, TEST_PDF_FILE_METADATA_VALUE
+    TEST_FILE_METADATA_RESULTS, TEST_PDF_FILE_METADATA_DOTTED_NAME,
+    TEST_PDF_FILE_METADATA_VALUE
 )
+from .mixins import EXIFToolTestMixin
 
 
 class EXIFToolDriverTestCase(GenericDocumentTestCase):
@@ -15,3 +24,89 @@ class EXIFToolDriverTestCase(GenericDocumentTestCase):
             dotted_name=TEST_PDF_FILE_METADATA_DOTTED_NAME
         )
         self.assertEqual(value, TEST_PDF_FILE_METADATA_VALUE)
+
+
+class EXIFToolProcessTestCase(EXIFToolTestMixin, BaseTestCase):
+    def test_execute(self):
+        process = EXIFToolProcess(exiftool_path=self.test_exiftool_path)
+        self.addCleanup(process.close)
+
+        for path in ('test_file_1', 'test_file_2'):
+            self.assertEqual(
+                json.loads(s=process.execute(path)), [{'SourceFile': path}]
+            )
+
+        self.assertTrue(process.is_alive())
+
+    def test_close(self):
+        process = EXIFToolProcess(exiftool_path=self.test_exiftool_path)
+        process.close()
+
+        self.assertFalse(process.is_alive())
+
+
+class EXIFToolProcessPoolTestCase(EXIFToolTestMixin, BaseTestCase):
+    def _create_test_process_pool(self, timeout=1):
+        self.test_process_pool = EXIFToolProcessPool(
+            exiftool_path=self.test_exiftool_path, size=1, timeout=timeout
+        )
+        self.addCleanup(self.test_process_pool.close)
+
+    def test_execute_process_reuse(self):
+        self._create_test_process_pool()
+
+        for path in ('test_file_1', 'test_file_2'):
+            self.assertEqual(
+                json.loads(s=self.test_process_pool.execute(path)),
+                [{'SourceFile': path}]
+            )
+
+        self.assertEqual(len(self.test_process_pool.processes), 1)
+
+    def test_acquire_timeout(self):
+        self._create_test_process_pool(timeout=0.1)
+        self._silence_logger(name='mayan.apps.file_metadata.drivers.exiftool')
+
+        process_1 = self.test_process_pool.acquire()
+        process_2 = self.test_process_pool.acquire()
+
+        self.assertNotEqual(process_1, process_2)
+        self.assertEqual(self.test_process_pool.process_count, 2)
+
+        # The replacement process over the pool size is discarded.
+        self.test_process_pool.release(process=process_2)
+        self.assertEqual(self.test_process_pool.process_count, 1)
+        self.assertFalse(process_2.is_alive())
+
+        self.test_process_pool.release(process=process_1)
+        self.assertEqual(self.test_process_pool.acquire(), process_1)
+
+    def test_execute_process_exited(self):
+        self._create_test_process_pool()
+
+        process = self.test_process_pool.acquire()
+        process.close()
+        self.test_process_pool.release(process=process)
+
+        self.assertEqual(self.test_process_pool.process_count, 0)
+        self.assertEqual(
+            json.loads(s=self.test_process_pool.execute('test_file')),
+            [{'SourceFile': 'test_file'}]
+        )
+
+
+class FileMetadataDriverTestCase(GenericDocumentTestCase):
+    @mock.patch(
+        'mayan.apps.file_metadata.drivers.exiftool.EXIFToolDriver._process'
+    )
+    def test_process_entries(self, mock_process):
+        mock_process.return_value = TEST_FILE_METADATA_RESULTS
+
+        self.test_document.file_latest.submit_for_file_metadata_processing()
+
+        document_file_driver_entry = self.test_document.file_latest.file_metadata_drivers.first()
+
+        self.assertEqual(
+            dict(document_file_driver_entry.entries.values_list('key', 'value')),
+            TEST_FILE_METADATA_RESULTS
+        )
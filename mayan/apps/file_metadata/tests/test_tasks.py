@@ -0,0 +1,38 @@
+import mock
+
+from mayan.apps.documents.tests.base import GenericDocumentTestCase
+
+from ..models import DocumentFileDriverEntry
+from ..tasks import task_process_document_file_list
+
+from .literals import TEST_FILE_METADATA_RESULTS
+
+
+class FileMetadataTaskTestCase(GenericDocumentTestCase):
+    auto_upload_test_document = False
+
+    @mock.patch(
+        'mayan.apps.file_metadata.drivers.exiftool.EXIFToolDriver._process'
+    )
+    def test_task_process_document_file_list(self, mock_process):
+        mock_process.return_value = TEST_FILE_METADATA_RESULTS
+
+        self._upload_test_document()
+        self._upload_test_document()
+
+        DocumentFileDriverEntry.objects.all().delete()
+
+        task_process_document_file_list.apply_async(
+            kwargs={
+                'document_file_id_list': [
+                    test_document.file_latest.pk
+                    for test_document in self.test_documents
+                ]
+            }
+        ).get()
+
+        for test_document in self.test_documents:
+            self.assertEqual(
+                test_document.file_latest.file_metadata_drivers.first().entries.count(),
+                len(TEST_FILE_METADATA_RESULTS)
+            )
@@ -15,6 +15,7 @@ from mayan.apps.views.generics import (
 )
 from mayan.apps.views.mixins import ExternalObjectViewMixin
 
+from .events import event_file_metadata_document_file_submit
 from .icons import icon_file_metadata
 from .links import link_document_file_submit
 from .models import DocumentFileDriverEntry
@@ -22,6 +23,8 @@ from .permissions import (
     permission_document_type_file_metadata_setup,
     permission_file_metadata_submit, permission_file_metadata_view
 )
+from .settings import setting_processing_batch_size
+from .tasks import task_process_document_file_list
 
 
 class DocumentFileDriverListView(ExternalObjectViewMixin, SingleObjectListView):
@@ -170,11 +173,28 @@ class DocumentTypeSubmitView(FormView):
         document_queryset = Document.valid.all()
 
         count = 0
+        document_file_id_list = []
         for document_type in form.cleaned_data['document_type']:
             for document in document_type.documents.filter(pk__in=document_queryset.values('pk')):
-                document.submit_for_file_metadata_processing()
+                document_file = document.file_latest
+                # Don't error out if document has no file
+                if document_file:
+                    event_file_metadata_document_file_submit.commit(
+                        action_object=document, target=document_file
+                    )
+                    document_file_id_list.append(document_file.pk)
                 count += 1
 
+        batch_size = setting_processing_batch_size.value
+        for index in range(0, len(document_file_id_list), batch_size):
+            task_process_document_file_list.apply_async(
+                kwargs={
+                    'document_file_id_list': document_file_id_list[
+                        index:index + batch_size
+                    ]
+                }
+            )
+
         messages.success(
             message=_(
                 '%(count)d documents added to the file metadata processing '
@@ -2,13 +2,71 @@ from shutil import copyfileobj
 
 import magic
 
+from django.utils.encoding import force_bytes
+
 from mayan.apps.storage.utils import NamedTemporaryFile
 
+from .literals import MIMETYPE_FULL_FILE_MIMETYPES, MIMETYPE_HEADER_SIZE
+
 
-def get_mimetype(file_object, mimetype_only=False):
+def get_mimetype(file_object, mimetype_only=False, header=None):
     """
     Determine a file's mimetype by calling the system's libmagic
-    library via python-magic.
+    library via python-magic. Only the start of the file is inspected.
+    The complete file is copied for inspection only when the start of
+    the file is not enough to identify it. The start of the file can be
+    passed as the header argument when it was already read.
+    """
+    if header is None:
+        file_object.seek(0)
+        data = force_bytes(s=file_object.read(MIMETYPE_HEADER_SIZE))
+        is_complete = not file_object.read(1)
+        file_object.seek(0)
+    else:
+        data = force_bytes(s=header)[:MIMETYPE_HEADER_SIZE]
+        is_complete = len(header) < MIMETYPE_HEADER_SIZE
+
+    file_mimetype, file_mime_encoding = get_mimetype_from_buffer(
+        data=data, mimetype_only=mimetype_only
+    )
+
+    if is_complete or file_mimetype not in MIMETYPE_FULL_FILE_MIMETYPES:
+        return file_mimetype, file_mime_encoding
+    else:
+        return get_mimetype_from_file(
+            file_object=file_object, mimetype_only=mimetype_only
+        )
+
+
+def get_mimetype_from_buffer(data, mimetype_only=False):
+    """
+    Determine the mimetype of a buffer of data, usually the first bytes of
+    a file, by calling the system's libmagic library via python-magic.
+    """
+    file_mime_encoding = None
+
+    kwargs = {'mime': True}
+
+    if not mimetype_only:
+        kwargs['mime_encoding'] = True
+
+    mime = magic.Magic(**kwargs)
+
+    if mimetype_only:
+        file_mimetype = mime.from_buffer(data)
+    else:
+        file_mimetype, file_mime_encoding = mime.from_buffer(
+            data
+        ).split('; charset=')
+
+    return file_mimetype, file_mime_encoding
+
+
+def get_mimetype_from_file(file_object, mimetype_only=False):
+    """
+    Determine the mimetype of the complete content of a file object. The
+    content is copied to a temporary file to allow libmagic to inspect
+    it.
     """
     file_mimetype = None
     file_mime_encoding = None
@@ -0,0 +1,7 @@
+# Amount of data from the start of a file used to detect the MIME type.
+# Matches the default number of bytes inspected by libmagic.
+MIMETYPE_HEADER_SIZE = 1048576
+
+# MIME types detected from the start of a file that require inspecting the
+# complete file to be identified.
+MIMETYPE_FULL_FILE_MIMETYPES = ('application/octet-stream',)
@@ -1,14 +1,22 @@
+from io import BytesIO
 import resource
 import unittest
 
+import mock
+
 from django.test import override_settings, tag
 
 from mayan.apps.documents.models import Document
 from mayan.apps.documents.tests.base import DocumentTestMixin
-from mayan.apps.documents.tests.literals import TEST_PDF_DOCUMENT_FILENAME
+from mayan.apps.documents.tests.literals import (
+    TEST_PDF_DOCUMENT_FILENAME, TEST_SMALL_DOCUMENT_PATH
+)
 from mayan.apps.testing.literals import EXCLUDE_TEST_TAG
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..api import get_mimetype
+from ..literals import MIMETYPE_HEADER_SIZE
+
 from .literals import MAXIMUM_HEAP_MEMORY
 
 
@@ -33,3 +41,51 @@ class MIMETypeTestCase(DocumentTestMixin, BaseTestCase):
         self._upload_test_document()
 
         self.assertEqual(Document.objects.count(), 1)
+
+
+class GetMIMETypeTestCase(BaseTestCase):
+    @mock.patch('mayan.apps.mimetype.api.get_mimetype_from_file')
+    def test_header_detection(self, mock_get_mimetype_from_file):
+        with open(file=TEST_SMALL_DOCUMENT_PATH, mode='rb') as file_object:
+            file_object = BytesIO(
+                file_object.read() + b'\0' * MIMETYPE_HEADER_SIZE
+            )
+
+        self.assertEqual(
+            get_mimetype(file_object=file_object, mimetype_only=True)[0],
+            'image/png'
+        )
+        self.assertFalse(mock_get_mimetype_from_file.called)
+        self.assertEqual(file_object.tell(), 0)
+
+    @mock.patch('mayan.apps.mimetype.api.get_mimetype_from_buffer')
+    @mock.patch('mayan.apps.mimetype.api.get_mimetype_from_file')
+    def test_full_file_detection(
+        self, mock_get_mimetype_from_file, mock_get_mimetype_from_buffer
+    ):
+        mock_get_mimetype_from_buffer.return_value = (
+            'application/octet-stream', None
+        )
+        file_object = BytesIO(b'\0' * (MIMETYPE_HEADER_SIZE + 1))
+
+        get_mimetype(file_object=file_object, mimetype_only=True)
+
+        self.assertTrue(mock_get_mimetype_from_file.called)
+
+    @mock.patch('mayan.apps.mimetype.api.get_mimetype_from_buffer')
+    @mock.patch('mayan.apps.mimetype.api.get_mimetype_from_file')
+    def test_header_argument_full_file_detection(
+        self, mock_get_mimetype_from_file, mock_get_mimetype_from_buffer
+    ):
+        mock_get_mimetype_from_buffer.return_value = (
+            'application/octet-stream', None
+        )
+        file_object = BytesIO(b'\0' * (MIMETYPE_HEADER_SIZE + 1))
+
+        get_mimetype(
+            file_object=file_object,
+            header=file_object.getvalue()[:MIMETYPE_HEADER_SIZE],
+            mimetype_only=True
+        )
+
+        self.assertTrue(mock_get_mimetype_from_file.called)
@@ -97,8 +97,16 @@ class Link:
             except AttributeError:
                 request = Variable('request').resolve(context=context)
 
+        # Resolve the current path only once per request.
         current_path = request.META['PATH_INFO']
-        current_view_name = resolve(current_path).view_name
+        try:
+            resolved_path, current_view_name = request._link_current_view
+        except AttributeError:
+            resolved_path = None
+
+        if resolved_path != current_path:
+            current_view_name = resolve(current_path).view_name
+            request._link_current_view = (current_path, current_view_name)
 
         # ACL is tested agains the resolved_object or just {{ object }} if not
         if not resolved_object:
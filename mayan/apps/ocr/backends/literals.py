@@ -1,3 +1,4 @@
+import os
 import platform
 
 if platform.system() in ('FreeBSD', 'OpenBSD', 'Darwin'):
@@ -5,4 +6,8 @@ if platform.system() in ('FreeBSD', 'OpenBSD', 'Darwin'):
 else:
     DEFAULT_TESSERACT_BINARY_PATH = '/usr/bin/tesseract'
 
+DEFAULT_TESSERACT_THREAD_COUNT = os.cpu_count() or 1
 DEFAULT_TESSERACT_TIMEOUT = 600  # 600 seconds, 10 minutes
+
+DEFAULT_TESSERACT_API_LANGUAGE = 'eng'
+DEFAULT_TESSERACT_API_POOL_SIZE = os.cpu_count() or 1
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
 import shutil
@@ -12,7 +13,10 @@ from mayan.apps.storage.utils import TemporaryFile
 from ..classes import OCRBackendBase
 from ..exceptions import OCRError
 
-from .literals import DEFAULT_TESSERACT_BINARY_PATH, DEFAULT_TESSERACT_TIMEOUT
+from .literals import (
+    DEFAULT_TESSERACT_BINARY_PATH, DEFAULT_TESSERACT_THREAD_COUNT,
+    DEFAULT_TESSERACT_TIMEOUT
+)
 
 logger = logging.getLogger(name=__name__)
 
@@ -25,6 +29,50 @@ class Tesseract(OCRBackendBase):
         if kwargs.get('auto_initialize', True):
             self.initialize()
 
+    def _execute_tesseract(self, image, language):
+        temporary_image_file = TemporaryFile()
+
+        try:
+            shutil.copyfileobj(fsrc=image, fdst=temporary_image_file)
+            temporary_image_file.seek(0)
+
+            arguments = ['-', '-']
+
+            keyword_arguments = {
+                '_in': temporary_image_file,
+                '_timeout': self.command_timeout
+            }
+
+            if language:
+                keyword_arguments['l'] = language
+
+            environment = os.environ.copy()
+            environment.update(self.environment)
+            keyword_arguments['_env'] = environment
+
+            try:
+                result = self.command_tesseract(
+                    *arguments, **keyword_arguments
+                )
+                return force_text(s=result.stdout)
+            except Exception as exception:
+                error_message = (
+                    'Exception calling Tesseract with language option: {}; {}'
+                ).format(language, exception)
+
+                if language not in self.languages:
+                    error_message = (
+                        '{}\nThe requested OCR language "{}" is not '
+                        'available and needs to be installed.\n'
+                    ).format(
+                        error_message, language
+                    )
+
+                logger.error(error_message, exc_info=True)
+                raise OCRError(error_message)
+        finally:
+            temporary_image_file.close()
+
     def execute(self, *args, **kwargs):
         """
         Execute the command line binary of tesseract
@@ -32,51 +80,32 @@ class Tesseract(OCRBackendBase):
         super().execute(*args, **kwargs)
 
         if self.command_tesseract:
-            image = self.converter.get_page()
-
-            try:
-                temporary_image_file = TemporaryFile()
-                shutil.copyfileobj(fsrc=image, fdst=temporary_image_file)
-                temporary_image_file.seek(0)
-
-                arguments = ['-', '-']
-
-                keyword_arguments = {
-                    '_in': temporary_image_file,
-                    '_timeout': self.command_timeout
-                }
-
-                if self.language:
-                    keyword_arguments['l'] = self.language
-
-                environment = os.environ.copy()
-                environment.update(self.environment)
-                keyword_arguments['_env'] = environment
+            return self._execute_tesseract(
+                image=self.converter.get_page(), language=self.language
+            )
 
-                try:
-                    result = self.command_tesseract(
-                        *arguments, **keyword_arguments
-                    )
-                    return force_text(s=result.stdout)
-                except Exception as exception:
-                    error_message = (
-                        'Exception calling Tesseract with language option: {}; {}'
-                    ).format(self.language, exception)
-
-                    if self.language not in self.languages:
-                        error_message = (
-                            '{}\nThe requested OCR language "{}" is not '
-                            'available and needs to be installed.\n'
-                        ).format(
-                            error_message, self.language
-                        )
-
-                    logger.error(error_message, exc_info=True)
-                    raise OCRError(error_message)
-                else:
-                    return result
-            finally:
-                temporary_image_file.close()
+    def execute_batch(self, file_object_list, language=None, transformations=None):
+        """
+        Run one tesseract process per page with up to "thread_count"
+        processes at the same time.
+        """
+        if not self.command_tesseract:
+            return [None] * len(file_object_list)
+
+        images = [
+            self.get_converter(
+                file_object=file_object, transformations=transformations
+            ).get_page() for file_object in file_object_list
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.thread_count) as executor:
+            return list(
+                executor.map(
+                    lambda image: self._execute_tesseract(
+                        image=image, language=language
+                    ), images
+                )
+            )
 
     def initialize(self):
         self.languages = ()
@@ -116,3 +145,6 @@ class Tesseract(OCRBackendBase):
         self.tesseract_binary_path = self.kwargs.get(
             'tesseract_path', DEFAULT_TESSERACT_BINARY_PATH
         )
+        self.thread_count = self.kwargs.get(
+            'thread_count', DEFAULT_TESSERACT_THREAD_COUNT
+        )
@@ -0,0 +1,193 @@
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+import queue
+import threading
+
+from PIL import Image
+
+from django.utils.translation import ugettext_lazy as _
+
+from ..classes import OCRBackendBase
+from ..exceptions import OCRError
+
+from .literals import (
+    DEFAULT_TESSERACT_API_LANGUAGE, DEFAULT_TESSERACT_API_POOL_SIZE
+)
+
+logger = logging.getLogger(name=__name__)
+
+
+class TesseractAPIEnginePool:
+    """
+    Process local pool of Tesseract API handles keyed by language.
+    Handles keep the language data loaded between pages and documents
+    and are created lazily up to the pool size for each language.
+    """
+    def __init__(self, api_class, size, tessdata_path=None):
+        self.api_class = api_class
+        self.engine_counts = {}
+        self.engine_queues = {}
+        self.lock = threading.Lock()
+        self.size = size
+        self.tessdata_path = tessdata_path
+
+    def acquire(self, language):
+        with self.lock:
+            engine_queue = self.engine_queues.setdefault(
+                language, queue.LifoQueue()
+            )
+            try:
+                return engine_queue.get_nowait()
+            except queue.Empty:
+                if self.engine_counts.get(language, 0) < self.size:
+                    self.engine_counts[language] = self.engine_counts.get(
+                        language, 0
+                    ) + 1
+                    create = True
+                else:
+                    create = False
+
+        if create:
+            try:
+                return self.create_engine(language=language)
+            except Exception:
+                with self.lock:
+                    self.engine_counts[language] -= 1
+                raise
+        else:
+            return engine_queue.get()
+
+    def close(self):
+        with self.lock:
+            for engine_queue in self.engine_queues.values():
+                while True:
+                    try:
+                        engine_queue.get_nowait().End()
+                    except queue.Empty:
+                        break
+
+            self.engine_counts = {}
+            self.engine_queues = {}
+
+    def create_engine(self, language):
+        logger.debug('Creating Tesseract API handle for language: %s', language)
+
+        kwargs = {'lang': language}
+        if self.tessdata_path:
+            kwargs['path'] = self.tessdata_path
+
+        return self.api_class(**kwargs)
+
+    def release(self, engine, language):
+        engine.Clear()
+        self.engine_queues[language].put(engine)
+
+
+class TesseractAPI(OCRBackendBase):
+    """
+    OCR backend using the libtesseract bindings provided by the tesserocr
+    package. Engine handles are kept loaded for the life of the worker
+    process and batches of pages are recognized using a thread pool.
+    """
+    _engine_pools = {}
+    _engine_pools_lock = threading.Lock()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.read_settings()
+
+        if kwargs.get('auto_initialize', True):
+            self.initialize()
+
+    def _recognize(self, image, language):
+        language = language or DEFAULT_TESSERACT_API_LANGUAGE
+
+        try:
+            engine = self.engine_pool.acquire(language=language)
+        except Exception as exception:
+            error_message = (
+                'Exception loading Tesseract API with language option: {}; {}'
+            ).format(language, exception)
+
+            if language not in self.languages:
+                error_message = (
+                    '{}\nThe requested OCR language "{}" is not '
+                    'available and needs to be installed.\n'
+                ).format(
+                    error_message, language
+                )
+
+            logger.error(error_message, exc_info=True)
+            raise OCRError(error_message)
+
+        try:
+            engine.SetImage(Image.open(fp=image))
+            return engine.GetUTF8Text()
+        finally:
+            self.engine_pool.release(engine=engine, language=language)
+
+    def execute(self, *args, **kwargs):
+        super().execute(*args, **kwargs)
+
+        return self._recognize(
+            image=self.converter.get_page(), language=self.language
+        )
+
+    def execute_batch(self, file_object_list, language=None, transformations=None):
+        images = [
+            self.get_converter(
+                file_object=file_object, transformations=transformations
+            ).get_page() for file_object in file_object_list
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.thread_count) as executor:
+            return list(
+                executor.map(
+                    lambda image: self._recognize(
+                        image=image, language=language
+                    ), images
+                )
+            )
+
+    def initialize(self):
+        try:
+            import tesserocr
+        except ImportError:
+            raise OCRError(
+                _('The tesserocr package is not installed.')
+            )
+
+        # Must be set before the first handle is created for the library
+        # to use it.
+        for key, value in self.environment.items():
+            os.environ.setdefault(key, value)
+
+        with self.__class__._engine_pools_lock:
+            try:
+                self.engine_pool = self.__class__._engine_pools[
+                    self.tessdata_path
+                ]
+            except KeyError:
+                self.engine_pool = TesseractAPIEnginePool(
+                    api_class=tesserocr.PyTessBaseAPI, size=self.pool_size,
+                    tessdata_path=self.tessdata_path
+                )
+                self.__class__._engine_pools[
+                    self.tessdata_path
+                ] = self.engine_pool
+
+        if self.tessdata_path:
+            self.languages = tesserocr.get_languages(self.tessdata_path)[1]
+        else:
+            self.languages = tesserocr.get_languages()[1]
+
+        logger.debug('Available languages: %s', ', '.join(self.languages))
+
+    def read_settings(self):
+        self.environment = self.kwargs.get('environment', {})
+        self.pool_size = self.kwargs.get(
+            'pool_size', DEFAULT_TESSERACT_API_POOL_SIZE
+        )
+        self.tessdata_path = self.kwargs.get('tessdata_path')
+        self.thread_count = self.kwargs.get('thread_count', self.pool_size)
@@ -19,12 +19,29 @@ class OCRBackendBase:
     def execute(self, file_object, language=None, transformations=None):
         self.language = language
 
-        if not transformations:
-            transformations = []
+        self.converter = self.get_converter(
+            file_object=file_object, transformations=transformations
+        )
 
-        self.converter = ConverterBase.get_converter_class()(
+    def execute_batch(self, file_object_list, language=None, transformations=None):
+        """
+        OCR several page images with the same language and return the
+        text of each one in the same order. Backends able to process
+        pages concurrently override this method.
+        """
+        return [
+            self.execute(
+                file_object=file_object, language=language,
+                transformations=transformations
+            ) for file_object in file_object_list
+        ]
+
+    def get_converter(self, file_object, transformations=None):
+        converter = ConverterBase.get_converter_class()(
             file_object=file_object
         )
 
-        for transformation in transformations:
-            self.converter.transform(transformation=transformation)
+        for transformation in transformations or ():
+            converter.transform(transformation=transformation)
+
+        return converter
@@ -1,3 +1,4 @@
+from contextlib import ExitStack
 import logging
 
 from django.apps import apps
@@ -78,6 +79,113 @@ class DocumentVersionPageOCRContentManager(models.Manager):
             finally:
                 document_version_page_lock.release()
 
+    def process_document_version_pages(
+        self, document_version_pages, user=None
+    ):
+        """
+        OCR a group of pages of the same document version in process.
+        Page images are rendered sequentially, the OCR backend processes
+        them as a batch and the results are written in bulk.
+        """
+        DocumentVersionPageOCRContent = apps.get_model(
+            app_label='ocr', model_name='DocumentVersionPageOCRContent'
+        )
+
+        document_version_pages = tuple(document_version_pages)
+
+        if not document_version_pages:
+            return
+
+        document_version = document_version_pages[0].document_version
+
+        logger.info(
+            'Processing pages: %d to %d of document version: %s',
+            document_version_pages[0].page_number,
+            document_version_pages[-1].page_number, document_version
+        )
+
+        locking_backend = LockingBackend.get_backend()
+        locks = []
+
+        try:
+            for document_version_page in document_version_pages:
+                locks.append(
+                    locking_backend.acquire_lock(
+                        name=document_version_page.get_lock_name(user=user),
+                        timeout=DOCUMENT_IMAGE_TASK_TIMEOUT * 2
+                    )
+                )
+
+            with ExitStack() as stack:
+                file_object_list = []
+                for document_version_page in document_version_pages:
+                    cache_filename = document_version_page.generate_image(
+                        _acquire_lock=False, user=user
+                    )
+                    file_object_list.append(
+                        stack.enter_context(
+                            document_version_page.cache_partition.get_file(
+                                filename=cache_filename
+                            ).open()
+                        )
+                    )
+
+                ocr_content_list = OCRBackendBase.get_instance().execute_batch(
+                    file_object_list=file_object_list,
+                    language=document_version.document.language
+                )
+
+            existing_contents = {
+                document_version_page_ocr_content.document_version_page_id: document_version_page_ocr_content
+                for document_version_page_ocr_content in DocumentVersionPageOCRContent.objects.filter(
+                    document_version_page__in=document_version_pages
+                )
+            }
+
+            contents_create = []
+            contents_update = []
+
+            for document_version_page, ocr_content in zip(document_version_pages, ocr_content_list):
+                try:
+                    document_version_page_ocr_content = existing_contents[
+                        document_version_page.pk
+                    ]
+                except KeyError:
+                    contents_create.append(
+                        DocumentVersionPageOCRContent(
+                            content=ocr_content or '',
+                            document_version_page=document_version_page
+                        )
+                    )
+                else:
+                    document_version_page_ocr_content.content = ocr_content or ''
+                    contents_update.append(document_version_page_ocr_content)
+
+            with transaction.atomic():
+                DocumentVersionPageOCRContent.objects.bulk_update(
+                    objs=contents_update, fields=('content',)
+                )
+                DocumentVersionPageOCRContent.objects.bulk_create(
+                    objs=contents_create
+                )
+        except Exception as exception:
+            logger.error(
+                'OCR error for pages: %d to %d of document version: %s; %s',
+                document_version_pages[0].page_number,
+                document_version_pages[-1].page_number, document_version,
+                exception, exc_info=True
+            )
+            raise
+        else:
+            logger.info(
+                'Finished processing pages: %d to %d of document version: %s',
+                document_version_pages[0].page_number,
+                document_version_pages[-1].page_number, document_version
+            )
+        finally:
+            for lock in locks:
+                lock.release()
+
 
 class DocumentTypeSettingsManager(models.Manager):
     def get_by_natural_key(self, document_type_natural_key):
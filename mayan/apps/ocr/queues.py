@@ -9,6 +9,10 @@ queue_ocr.add_task_type(
     dotted_path='mayan.apps.ocr.tasks.task_document_version_ocr_finished',
     label=_('Finish document file OCR')
 )
+queue_ocr.add_task_type(
+    dotted_path='mayan.apps.ocr.tasks.task_document_version_ocr_chunk_process',
+    label=_('Document version page chunk OCR')
+)
 queue_ocr.add_task_type(
     dotted_path='mayan.apps.ocr.tasks.task_document_version_page_ocr_process',
     label=_('Document file page OCR')
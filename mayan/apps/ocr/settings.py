@@ -3,7 +3,8 @@ from django.utils.translation import ugettext_lazy as _
 from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
-    DEFAULT_OCR_AUTO_OCR, DEFAULT_OCR_BACKEND, DEFAULT_OCR_BACKEND_ARGUMENTS
+    DEFAULT_OCR_AUTO_OCR, DEFAULT_OCR_BACKEND, DEFAULT_OCR_BACKEND_ARGUMENTS,
+    DEFAULT_OCR_PAGE_CHUNK_SIZE
 )
 from .setting_migrations import OCRSettingMigration
 
@@ -24,5 +25,20 @@ setting_ocr_backend = namespace.add_setting(
 )
 setting_ocr_backend_arguments = namespace.add_setting(
     default=DEFAULT_OCR_BACKEND_ARGUMENTS,
-    global_name='OCR_BACKEND_ARGUMENTS'
+    global_name='OCR_BACKEND_ARGUMENTS', help_text=_(
+        'Arguments to pass to the OCR backend. Both Tesseract backends '
+        'accept "thread_count" for the number of pages of a batch '
+        'processed concurrently. The Tesseract API backend '
+        '(mayan.apps.ocr.backends.tesseract_api.TesseractAPI) also accepts '
+        '"pool_size" for the number of persistent engines per language '
+        'and worker process and "tessdata_path".'
+    )
+)
+setting_ocr_page_chunk_size = namespace.add_setting(
+    default=DEFAULT_OCR_PAGE_CHUNK_SIZE,
+    global_name='OCR_PAGE_CHUNK_SIZE', help_text=_(
+        'Number of pages of a document version to OCR per task. The pages '
+        'of each chunk are processed as a batch by the OCR backend. When '
+        'set to 0 each page is processed by a separate task.'
+    )
 )
@@ -11,6 +11,7 @@ from mayan.celery import app
 
 from .events import event_ocr_document_version_finish
 from .literals import TASK_DOCUMENT_VERSION_PAGE_OCR_RETRY_DELAY
+from .settings import setting_ocr_page_chunk_size
 from .signals import signal_post_document_version_ocr
 
 logger = logging.getLogger(name=__name__)
@@ -25,10 +26,51 @@ def task_document_version_ocr_process(self, document_version_id, user_id=None):
         app_label='documents', model_name='DocumentVersion'
     )
 
+    ContentType = apps.get_model(
+        app_label='contenttypes', model_name='ContentType'
+    )
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+    DocumentFilePage = apps.get_model(
+        app_label='documents', model_name='DocumentFilePage'
+    )
+
     document_version = DocumentVersion.objects.get(
         pk=document_version_id
     )
 
+    # Render the source images of the version pages with a single
+    # converter pass per document file before the page tasks request them.
+    document_file_page_id_queryset = document_version.version_pages.filter(
+        content_type=ContentType.objects.get_for_model(model=DocumentFilePage)
+    ).values('object_id')
+
+    document_file_queryset = DocumentFile.objects.filter(
+        file_pages__pk__in=document_file_page_id_queryset
+    ).distinct()
+
+    for document_file in document_file_queryset:
+        try:
+            document_file.pages_base_image_generate()
+        except Exception as exception:
+            # Non fatal, the page tasks render the missing images.
+            logger.warning(
+                'Unable to pre-render the pages of document file ID: %s; %s',
+                document_file.pk, exception
+            )
+
+    page_chunk_size = setting_ocr_page_chunk_size.value
+
+    if page_chunk_size:
+        task_document_version_ocr_chunk_process.apply_async(
+            kwargs={
+                'document_version_id': document_version.pk,
+                'page_chunk_size': page_chunk_size, 'user_id': user_id
+            }
+        )
+        return
+
     try:
         document_version_page_tasks = []
         for document_version_page in document_version.pages.all():
@@ -48,6 +90,85 @@ def task_document_version_ocr_process(self, document_version_id, user_id=None):
         raise
 
 
+@app.task(
+    bind=True, default_retry_delay=TASK_DOCUMENT_VERSION_PAGE_OCR_RETRY_DELAY
+)
+def task_document_version_ocr_chunk_process(
+    self, document_version_id, page_chunk_size, page_offset=0, user_id=None
+):
+    """
+    Process a chunk of pages of a document version and queue the next
+    chunk. The last chunk queues the finish task. Alternative to the
+    chord of page tasks. The chunk size is read from the setting once
+    when the processing starts and used for the whole chain.
+    """
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+    DocumentVersion = apps.get_model(
+        app_label='documents', model_name='DocumentVersion'
+    )
+    DocumentVersionPageOCRContent = apps.get_model(
+        app_label='ocr', model_name='DocumentVersionPageOCRContent'
+    )
+
+    document_version = DocumentVersion.objects.get(pk=document_version_id)
+
+    User = get_user_model()
+
+    if user_id:
+        user = User.objects.get(pk=user_id)
+    else:
+        user = None
+
+    page_count = document_version.pages.count()
+
+    document_version_pages = document_version.pages.all()[
+        page_offset:page_offset + page_chunk_size
+    ]
+
+    try:
+        DocumentVersionPageOCRContent.objects.process_document_version_pages(
+            document_version_pages=document_version_pages, user=user
+        )
+    except CachePartitionFile.DoesNotExist as exception:
+        logger.info(
+            'Document version page image not found. Possible cause '
+            'overloaded system or cache size too small. Retrying task.',
+        )
+        raise self.retry(exc=exception)
+    except LockError as exception:
+        raise self.retry(exc=exception)
+    except OperationalError as exception:
+        raise self.retry(exc=exception)
+    except Exception as exception:
+        document_version.ocr_errors.create(result=exception)
+        raise
+
+    page_offset = min(page_offset + page_chunk_size, page_count)
+
+    logger.info(
+        'OCR progress for document version ID: %s; %d/%d pages',
+        document_version_id, page_offset, page_count
+    )
+
+    if page_offset < page_count:
+        task_document_version_ocr_chunk_process.apply_async(
+            kwargs={
+                'document_version_id': document_version_id,
+                'page_chunk_size': page_chunk_size,
+                'page_offset': page_offset, 'user_id': user_id
+            }
+        )
+    else:
+        task_document_version_ocr_finished.apply_async(
+            kwargs={
+                'document_version_id': document_version_id,
+                'results': None, 'user_id': user_id
+            }
+        )
+
+
 @app.task(
     bind=True, default_retry_delay=TASK_DOCUMENT_VERSION_PAGE_OCR_RETRY_DELAY
 )
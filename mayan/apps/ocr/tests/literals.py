@@ -10,3 +10,6 @@ TEST_OCR_INDEX_NODE_TEMPLATE = '{% if "mayan" in document.version_active.ocr_con
 TEST_OCR_INDEX_NODE_TEMPLATE_LEVEL = 'mayan'
 
 TEST_UPDATE_DOCUMENT_PAGE_OCR_ACTION_DOTTED_PATH = 'mayan.apps.ocr.workflow_actions.UpdateDocumentPageOCRAction'
+
+TEST_TESSERACT_API_LANGUAGE = 'eng'
+TEST_TESSERACT_API_LANGUAGE_ALTERNATE = 'deu'
@@ -0,0 +1,91 @@
+from mayan.apps.documents.tests.base import GenericDocumentTestCase
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..backends.tesseract_api import TesseractAPI, TesseractAPIEnginePool
+
+from .literals import (
+    TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT, TEST_TESSERACT_API_LANGUAGE,
+    TEST_TESSERACT_API_LANGUAGE_ALTERNATE
+)
+
+
+class TestTesseractAPIEngine:
+    instances = []
+
+    def __init__(self, lang):
+        self.lang = lang
+        self.image = None
+        self.instances.append(self)
+
+    def Clear(self):
+        self.image = None
+
+    def End(self):
+        """Nothing to release."""
+
+    def GetUTF8Text(self):
+        return '{} {}'.format(TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT, self.lang)
+
+    def SetImage(self, image):
+        self.image = image
+
+
+class TesseractAPIEnginePoolTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        TestTesseractAPIEngine.instances = []
+        self.test_engine_pool = TesseractAPIEnginePool(
+            api_class=TestTesseractAPIEngine, size=1
+        )
+
+    def test_engine_reuse(self):
+        engine = self.test_engine_pool.acquire(
+            language=TEST_TESSERACT_API_LANGUAGE
+        )
+        self.test_engine_pool.release(
+            engine=engine, language=TEST_TESSERACT_API_LANGUAGE
+        )
+
+        self.assertEqual(
+            self.test_engine_pool.acquire(
+                language=TEST_TESSERACT_API_LANGUAGE
+            ), engine
+        )
+        self.assertEqual(len(TestTesseractAPIEngine.instances), 1)
+
+    def test_engine_per_language(self):
+        engine = self.test_engine_pool.acquire(
+            language=TEST_TESSERACT_API_LANGUAGE
+        )
+        engine_alternate = self.test_engine_pool.acquire(
+            language=TEST_TESSERACT_API_LANGUAGE_ALTERNATE
+        )
+
+        self.assertEqual(engine.lang, TEST_TESSERACT_API_LANGUAGE)
+        self.assertEqual(
+            engine_alternate.lang, TEST_TESSERACT_API_LANGUAGE_ALTERNATE
+        )
+
+
+class TesseractAPIBackendTestCase(GenericDocumentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_backend = TesseractAPI(auto_initialize=False, thread_count=2)
+        self.test_backend.engine_pool = TesseractAPIEnginePool(
+            api_class=TestTesseractAPIEngine, size=2
+        )
+        self.test_backend.languages = (TEST_TESSERACT_API_LANGUAGE,)
+
+    def test_execute_batch(self):
+        test_document_file_page = self.test_document_file.pages.first()
+
+        with test_document_file_page.get_image() as file_object_0:
+            with test_document_file_page.get_image() as file_object_1:
+                result = self.test_backend.execute_batch(
+                    file_object_list=(file_object_0, file_object_1),
+                    language=TEST_TESSERACT_API_LANGUAGE
+                )
+
+        self.assertEqual(len(result), 2)
+        for content in result:
+            self.assertTrue(TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT in content)
@@ -0,0 +1,62 @@
+from django.test import override_settings
+
+import mock
+
+from mayan.apps.documents.tests.base import GenericDocumentTestCase
+from mayan.apps.documents.tests.literals import TEST_MULTI_PAGE_TIFF
+
+from ..classes import OCRBackendBase
+from ..tasks import task_document_version_ocr_chunk_process
+
+from .literals import TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT
+
+
+class TestOCRBackend(OCRBackendBase):
+    batch_count = 0
+
+    def execute_batch(self, *args, **kwargs):
+        TestOCRBackend.batch_count += 1
+        return super().execute_batch(*args, **kwargs)
+
+    def execute(self, *args, **kwargs):
+        super().execute(*args, **kwargs)
+        return TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT
+
+
+@override_settings(OCR_PAGE_CHUNK_SIZE=1)
+class DocumentVersionOCRChunkTaskTestCase(GenericDocumentTestCase):
+    test_document_filename = TEST_MULTI_PAGE_TIFF
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.get_instance')
+    def test_document_version_ocr_chunk_process(self, mock_get_instance):
+        TestOCRBackend.batch_count = 0
+        mock_get_instance.return_value = TestOCRBackend()
+
+        self.test_document.submit_for_ocr()
+
+        self.assertEqual(TestOCRBackend.batch_count, 2)
+
+        for test_document_version_page in self.test_document_version.pages.all():
+            self.assertEqual(
+                test_document_version_page.ocr_content.content,
+                TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT
+            )
+        self.assertFalse(self.test_document_version.ocr_errors.exists())
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.get_instance')
+    def test_document_version_ocr_chunk_process_setting_change(
+        self, mock_get_instance
+    ):
+        TestOCRBackend.batch_count = 0
+        mock_get_instance.return_value = TestOCRBackend()
+
+        with override_settings(OCR_PAGE_CHUNK_SIZE=0):
+            task_document_version_ocr_chunk_process.apply_async(
+                kwargs={
+                    'document_version_id': self.test_document_version.pk,
+                    'page_chunk_size': 1
+                }
+            )
+
+        self.assertEqual(TestOCRBackend.batch_count, 2)
+        self.assertFalse(self.test_document_version.ocr_errors.exists())
@@ -11,7 +11,10 @@ DEFAULT_METADATA_ATTACHMENT_NAME = 'metadata.yaml'
 DEFAULT_POP3_TIMEOUT = 60
 DEFAULT_SOURCE_LOCK_EXPIRE = 600
 DEFAULT_SOURCE_TASK_RETRY_DELAY = 10
+DEFAULT_SOURCES_WATCH_FOLDER_PENDING_FILE_EXPIRE = 3600
+DEFAULT_SOURCES_WATCH_FOLDER_PENDING_FILE_LIMIT = 100
 
+DEFAULT_SOURCES_ARCHIVE_MEMBER_UPLOAD_LIMIT = 50
 DEFAULT_SOURCES_SCANIMAGE_PATH = '/usr/bin/scanimage'
 DEFAULT_SOURCES_STAGING_FILE_CACHE_STORAGE_BACKEND = 'django.core.files.storage.FileSystemStorage'
 DEFAULT_SOURCES_STAGING_FILE_CACHE_STORAGE_BACKEND_ARGUMENTS = {
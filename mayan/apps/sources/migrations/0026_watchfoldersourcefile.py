@@ -0,0 +1,47 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('sources', '0025_delete_sourcelog'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WatchFolderSourceFile',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                ('path', models.TextField(verbose_name='Path')),
+                (
+                    'path_hash', models.CharField(
+                        max_length=64, verbose_name='Path hash'
+                    )
+                ),
+                (
+                    'datetime', models.DateTimeField(
+                        auto_now_add=True, db_index=True,
+                        verbose_name='Date time'
+                    )
+                ),
+                (
+                    'source', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='pending_files',
+                        to='sources.WatchFolderSource',
+                        verbose_name='Watch folder'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Watch folder file',
+                'verbose_name_plural': 'Watch folder files',
+                'unique_together': {('source', 'path_hash')},
+            },
+        ),
+    ]
@@ -1,17 +1,31 @@
+from datetime import timedelta
 import errno
 import fcntl
+import hashlib
 import logging
+import os
 from pathlib import Path
 
+from django.core.files import File
 from django.db import models
+from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
 
+from mayan.apps.storage.models import SharedUploadedFile
+
 from ..exceptions import SourceException
 from ..literals import SOURCE_CHOICE_WATCH, SOURCE_UNCOMPRESS_CHOICE_Y
+from ..settings import (
+    setting_watch_folder_pending_file_expire,
+    setting_watch_folder_pending_file_limit
+)
+from ..tasks import (
+    task_source_handle_upload, task_watch_folder_file_upload
+)
 
 from .base import IntervalBaseModel
 
-__all__ = ('WatchFolderSource',)
+__all__ = ('WatchFolderSource', 'WatchFolderSourceFile')
 logger = logging.getLogger(name=__name__)
 
 
@@ -47,30 +61,130 @@ class WatchFolderSource(IntervalBaseModel):
         verbose_name_plural = _('Watch folders')
 
     def _check_source(self, test=False):
+        """
+        Find the files of the watch folder and queue each one as a
+        separate upload task. Files already queued are tracked to avoid
+        queuing them again while their upload is pending.
+        """
         path = Path(self.folder_path)
         # Force testing the path and raise errors for the log
         path.lstat()
         if not path.is_dir():
             raise SourceException('Path {} is not a directory.'.format(path))
 
-        if self.include_subdirectories:
-            iterator = path.rglob(pattern='*')
-        else:
-            iterator = path.glob(pattern='*')
-
-        for entry in iterator:
-            if entry.is_file() or entry.is_symlink():
-                with entry.open(mode='rb+') as file_object:
-                    try:
-                        fcntl.lockf(file_object, fcntl.LOCK_EX | fcntl.LOCK_NB)
-                    except IOError as exception:
-                        if exception.errno != errno.EAGAIN:
-                            raise
-                    else:
-                        self.handle_upload(
-                            file_object=file_object,
-                            expand=(self.uncompress == SOURCE_UNCOMPRESS_CHOICE_Y),
-                            label=entry.name
-                        )
-                        if not test:
-                            entry.unlink()
+        self.pending_files.filter(
+            datetime__lt=now() - timedelta(
+                seconds=setting_watch_folder_pending_file_expire.value
+            )
+        ).delete()
+
+        pending_hash_list = set(
+            self.pending_files.values_list('path_hash', flat=True)
+        )
+        available = setting_watch_folder_pending_file_limit.value - len(
+            pending_hash_list
+        )
+
+        for file_path in self.get_file_paths():
+            if available <= 0:
+                break
+
+            path_hash = WatchFolderSourceFile.get_path_hash(path=file_path)
+
+            if path_hash not in pending_hash_list:
+                self.pending_files.create(path=file_path, path_hash=path_hash)
+                task_watch_folder_file_upload.apply_async(
+                    kwargs={
+                        'path': file_path, 'source_id': self.pk,
+                        'test': test
+                    }
+                )
+                available -= 1
+
+    def get_file_paths(self):
+        """
+        Generator of the file paths in the watch folder. Uses scandir to
+        avoid a stat call per entry.
+        """
+        folder_list = [self.folder_path]
+
+        while folder_list:
+            with os.scandir(folder_list.pop()) as iterator:
+                for entry in iterator:
+                    if entry.is_dir(follow_symlinks=False):
+                        if self.include_subdirectories:
+                            folder_list.append(entry.path)
+                    elif entry.is_file() or entry.is_symlink():
+                        yield entry.path
+
+    def upload_file(self, path, test=False):
+        """
+        Upload a single file from the watch folder. Files locked by another
+        process are skipped and will be queued again on the next check.
+        """
+        entry = Path(path)
+
+        try:
+            file_object = entry.open(mode='rb+')
+        except FileNotFoundError:
+            logger.debug('File "%s" no longer exists.', path)
+            return
+
+        with file_object:
+            try:
+                fcntl.lockf(file_object, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except IOError as exception:
+                if exception.errno != errno.EAGAIN:
+                    raise
+            else:
+                if self.uncompress == SOURCE_UNCOMPRESS_CHOICE_Y:
+                    # Expand in a separate task that queues the upload
+                    # of each member.
+                    shared_uploaded_file = SharedUploadedFile.objects.create(
+                        file=File(file=file_object, name=entry.name)
+                    )
+                    task_source_handle_upload.apply_async(
+                        kwargs={
+                            'document_type_id': self.document_type_id,
+                            'expand': True, 'label': entry.name,
+                            'shared_uploaded_file_id': shared_uploaded_file.pk,
+                            'source_id': self.pk
+                        }
+                    )
+                else:
+                    self.handle_upload(
+                        file_object=file_object, label=entry.name
+                    )
+
+                if not test:
+                    entry.unlink()
+
+
+class WatchFolderSourceFile(models.Model):
+    """
+    File of a watch folder queued for upload. Keeps track of files already
+    queued for upload between checks.
+    """
+    source = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='pending_files',
+        to=WatchFolderSource, verbose_name=_('Watch folder')
+    )
+    path = models.TextField(verbose_name=_('Path'))
+    path_hash = models.CharField(max_length=64, verbose_name=_('Path hash'))
+    datetime = models.DateTimeField(
+        auto_now_add=True, db_index=True, verbose_name=_('Date time')
+    )
+
+    class Meta:
+        unique_together = ('source', 'path_hash')
+        verbose_name = _('Watch folder file')
+        verbose_name_plural = _('Watch folder files')
+
+    def __str__(self):
+        return self.path
+
+    @staticmethod
+    def get_path_hash(path):
+        return hashlib.sha256(
+            os.fsencode(path)
+        ).hexdigest()
@@ -33,3 +33,7 @@ queue_sources.add_task_type(
     label=_('Upload document'),
     dotted_path='mayan.apps.sources.tasks.task_upload_document'
 )
+queue_sources.add_task_type(
+    label=_('Upload watch folder file'),
+    dotted_path='mayan.apps.sources.tasks.task_watch_folder_file_upload'
+)
@@ -4,9 +4,12 @@ from django.utils.translation import ugettext_lazy as _
 from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
+    DEFAULT_SOURCES_ARCHIVE_MEMBER_UPLOAD_LIMIT,
     DEFAULT_SOURCES_SCANIMAGE_PATH,
     DEFAULT_SOURCES_STAGING_FILE_CACHE_STORAGE_BACKEND,
-    DEFAULT_SOURCES_STAGING_FILE_CACHE_STORAGE_BACKEND_ARGUMENTS
+    DEFAULT_SOURCES_STAGING_FILE_CACHE_STORAGE_BACKEND_ARGUMENTS,
+    DEFAULT_SOURCES_WATCH_FOLDER_PENDING_FILE_EXPIRE,
+    DEFAULT_SOURCES_WATCH_FOLDER_PENDING_FILE_LIMIT
 )
 from .setting_migrations import SourcesSettingMigration
 
@@ -15,6 +18,14 @@ namespace = SettingNamespace(
     name='sources', version='0002'
 )
 
+setting_archive_member_upload_limit = namespace.add_setting(
+    default=DEFAULT_SOURCES_ARCHIVE_MEMBER_UPLOAD_LIMIT,
+    global_name='SOURCES_ARCHIVE_MEMBER_UPLOAD_LIMIT', help_text=_(
+        'Maximum number of members of an expanded compressed file that can '
+        'be queued for upload at the same time. The remaining members are '
+        'queued as the pending uploads finish.'
+    )
+)
 setting_scanimage_path = namespace.add_setting(
     default=DEFAULT_SOURCES_SCANIMAGE_PATH,
     global_name='SOURCES_SCANIMAGE_PATH', help_text=_(
@@ -35,3 +46,18 @@ setting_staging_file_image_cache_storage_arguments = namespace.add_setting(
         'Arguments to pass to the SOURCES_STAGING_FILE_CACHE_STORAGE_BACKEND.'
     )
 )
+setting_watch_folder_pending_file_expire = namespace.add_setting(
+    global_name='SOURCES_WATCH_FOLDER_PENDING_FILE_EXPIRE',
+    default=DEFAULT_SOURCES_WATCH_FOLDER_PENDING_FILE_EXPIRE, help_text=_(
+        'Time in seconds after which a watch folder file queued for upload '
+        'but not yet processed, is queued again.'
+    )
+)
+setting_watch_folder_pending_file_limit = namespace.add_setting(
+    global_name='SOURCES_WATCH_FOLDER_PENDING_FILE_LIMIT',
+    default=DEFAULT_SOURCES_WATCH_FOLDER_PENDING_FILE_LIMIT, help_text=_(
+        'Maximum number of files of a single watch folder that can be '
+        'queued for upload at the same time. Files are uploaded in '
+        'parallel by separate tasks.'
+    )
+)
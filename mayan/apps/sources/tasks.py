@@ -17,6 +17,7 @@ from mayan.apps.storage.exceptions import NoMIMETypeMatch
 from .literals import (
     DEFAULT_SOURCE_LOCK_EXPIRE, DEFAULT_SOURCE_TASK_RETRY_DELAY
 )
+from .settings import setting_archive_member_upload_limit
 
 logger = logging.getLogger(name=__name__)
 
@@ -65,7 +66,7 @@ def task_generate_staging_file_image(staging_folder_pk, encoded_filename, *args,
 
 
 @app.task(bind=True, default_retry_delay=DEFAULT_SOURCE_TASK_RETRY_DELAY, ignore_result=True)
-def task_source_handle_upload(self, document_type_id, shared_uploaded_file_id, source_id, description=None, expand=False, label=None, language=None, querystring=None, skip_list=None, user_id=None):
+def task_source_handle_upload(self, document_type_id, shared_uploaded_file_id, source_id, description=None, expand=False, label=None, language=None, querystring=None, skip_list=None, user_id=None, member_offset=0, pending_id_list=None):
     DocumentType = apps.get_model(
         app_label='documents', model_name='DocumentType'
     )
@@ -99,68 +100,134 @@ def task_source_handle_upload(self, document_type_id, shared_uploaded_file_id, s
     if not skip_list:
         skip_list = []
 
+    def reschedule(member_offset, pending_id_list):
+        task_source_handle_upload.apply_async(
+            countdown=DEFAULT_SOURCE_TASK_RETRY_DELAY, kwargs={
+                'description': description,
+                'document_type_id': document_type_id, 'expand': expand,
+                'label': label, 'language': language,
+                'member_offset': member_offset,
+                'pending_id_list': pending_id_list,
+                'querystring': querystring,
+                'shared_uploaded_file_id': shared_uploaded_file_id,
+                'skip_list': skip_list, 'source_id': source_id,
+                'user_id': user_id
+            }
+        )
+
     with shared_upload.open() as file_object:
         if expand:
             try:
                 compressed_file = Archive.open(file_object=file_object)
-                for compressed_file_child in compressed_file.get_members():
-                    # Use filename in the meantime while a better way to
-                    # uniquely indentify the archive content/child files
-                    # is found.
-                    if force_text(s=compressed_file_child) not in skip_list:
-                        kwargs.update(
-                            {'label': force_text(s=compressed_file_child)}
-                        )
-
-                        try:
-                            child_shared_uploaded_file = SharedUploadedFile.objects.create(
-                                file=File(file=compressed_file_child)
-                            )
-                        except OperationalError as exception:
-                            logger.warning(
-                                'Operational error while preparing to upload '
-                                'child document: %s. Rescheduling.', exception
-                            )
-
-                            task_source_handle_upload.delay(
-                                document_type_id=document_type_id,
-                                shared_uploaded_file_id=shared_uploaded_file_id,
-                                source_id=source_id, description=description,
-                                expand=expand, label=label,
-                                language=language,
-                                skip_list=skip_list, querystring=querystring,
-                                user_id=user_id
-                            )
-                            return
-                        else:
-                            skip_list.append(force_text(s=compressed_file_child))
-                            task_upload_document.delay(
-                                shared_uploaded_file_id=child_shared_uploaded_file.pk,
-                                **kwargs
-                            )
-                        finally:
-                            compressed_file_child.close()
-
-                    compressed_file_child.close()
-                try:
-                    shared_upload.delete()
-                except OperationalError as exception:
-                    logger.warning(
-                        'Operational error during attempt to delete shared '
-                        'upload file: %s; %s. Retrying.', shared_upload,
-                        exception
-                    )
             except NoMIMETypeMatch:
                 logger.debug('Exception: NoMIMETypeMatch')
                 task_upload_document.delay(
                     shared_uploaded_file_id=shared_upload.pk, **kwargs
                 )
+                return
+
+            member_list = compressed_file.members()
+            member_count = len(member_list)
+
+            # Members uploads queued by previous runs that have not
+            # finished. Their shared files are deleted when uploaded.
+            pending_id_list = list(
+                SharedUploadedFile.objects.filter(
+                    pk__in=pending_id_list or ()
+                ).values_list('pk', flat=True)
+            )
+
+            while member_offset < member_count:
+                if len(pending_id_list) >= setting_archive_member_upload_limit.value:
+                    logger.info(
+                        'Expanding shared upload "%s": %d of %d members '
+                        'queued, %d pending. Waiting for pending members.',
+                        shared_upload, member_offset, member_count,
+                        len(pending_id_list)
+                    )
+                    reschedule(
+                        member_offset=member_offset,
+                        pending_id_list=pending_id_list
+                    )
+                    return
+
+                member_name = member_list[member_offset]
+
+                # Use filename in the meantime while a better way to
+                # uniquely indentify the archive content/child files
+                # is found.
+                if force_text(s=member_name) not in skip_list:
+                    kwargs.update({'label': force_text(s=member_name)})
+
+                    try:
+                        with compressed_file.open_member(filename=member_name) as member_file_object:
+                            # Stream the member into the shared storage
+                            # instead of loading it in memory.
+                            child_shared_uploaded_file = SharedUploadedFile.objects.create(
+                                file=File(
+                                    file=member_file_object,
+                                    name=force_text(s=member_name)
+                                )
+                            )
+                    except OperationalError as exception:
+                        logger.warning(
+                            'Operational error while preparing to upload '
+                            'child document: %s. Rescheduling.', exception
+                        )
+                        reschedule(
+                            member_offset=member_offset,
+                            pending_id_list=pending_id_list
+                        )
+                        return
+                    else:
+                        pending_id_list.append(child_shared_uploaded_file.pk)
+                        task_upload_document.delay(
+                            shared_uploaded_file_id=child_shared_uploaded_file.pk,
+                            **kwargs
+                        )
+
+                member_offset += 1
+
+            logger.info(
+                'Expanded shared upload "%s": %d members queued.',
+                shared_upload, member_count
+            )
+
+            try:
+                shared_upload.delete()
+            except OperationalError as exception:
+                logger.warning(
+                    'Operational error during attempt to delete shared '
+                    'upload file: %s; %s. Retrying.', shared_upload,
+                    exception
+                )
         else:
             task_upload_document.delay(
                 shared_uploaded_file_id=shared_upload.pk, **kwargs
             )
 
 
+def _shared_upload_discard(exception, label, shared_upload, source_id):
+    """
+    Delete the shared file of an upload that failed permanently. Archive
+    expansions track their pending members by the existence of their
+    shared files and would otherwise wait for them until they go stale.
+    """
+    logger.error(
+        'Error creating new document "%s" from source id %d; %s',
+        label or shared_upload, source_id, exception
+    )
+
+    if shared_upload:
+        try:
+            shared_upload.delete()
+        except OperationalError as exception:
+            logger.warning(
+                'Operational error during attempt to delete shared upload '
+                'file: %s; %s', shared_upload, exception
+            )
+
+
 @app.task(bind=True, default_retry_delay=DEFAULT_SOURCE_TASK_RETRY_DELAY, ignore_result=True)
 def task_upload_document(self, source_id, document_type_id, shared_uploaded_file_id, description=None, label=None, language=None, querystring=None, user_id=None):
     DocumentType = apps.get_model(
@@ -175,6 +242,8 @@ def task_upload_document(self, source_id, document_type_id, shared_uploaded_file
         app_label='sources', model_name='Source'
     )
 
+    shared_upload = None
+
     try:
         document_type = DocumentType.objects.get(pk=document_type_id)
         shared_upload = SharedUploadedFile.objects.get(
@@ -195,12 +264,25 @@ def task_upload_document(self, source_id, document_type_id, shared_uploaded_file
             )
 
     except OperationalError as exception:
-        logger.warning(
-            'Operational exception while trying to create new document "%s" '
-            'from source id %d; %s. Retying.',
-            label or shared_upload.filename, source_id, exception
+        if self.request.retries < self.max_retries:
+            logger.warning(
+                'Operational exception while trying to create new document '
+                '"%s" from source id %d; %s. Retying.',
+                label or shared_uploaded_file_id, source_id, exception
+            )
+            raise self.retry(exc=exception)
+        else:
+            _shared_upload_discard(
+                exception=exception, label=label,
+                shared_upload=shared_upload, source_id=source_id
+            )
+            raise
+    except Exception as exception:
+        _shared_upload_discard(
+            exception=exception, label=label, shared_upload=shared_upload,
+            source_id=source_id
         )
-        raise self.retry(exc=exception)
+        raise
     else:
         try:
             shared_upload.delete()
@@ -209,3 +291,38 @@ def task_upload_document(self, source_id, document_type_id, shared_uploaded_file
                 'Operational error during attempt to delete shared upload '
                 'file: %s; %s. Retrying.', shared_upload, exception
             )
+
+
+@app.task(bind=True, default_retry_delay=DEFAULT_SOURCE_TASK_RETRY_DELAY, ignore_result=True)
+def task_watch_folder_file_upload(self, path, source_id, test=False):
+    WatchFolderSource = apps.get_model(
+        app_label='sources', model_name='WatchFolderSource'
+    )
+    WatchFolderSourceFile = apps.get_model(
+        app_label='sources', model_name='WatchFolderSourceFile'
+    )
+
+    pending_file_queryset = WatchFolderSourceFile.objects.filter(
+        path_hash=WatchFolderSourceFile.get_path_hash(path=path),
+        source_id=source_id
+    )
+
+    try:
+        source = WatchFolderSource.objects.get(pk=source_id)
+        source.upload_file(path=path, test=test)
+    except OperationalError as exception:
+        logger.warning(
+            'Operational error while trying to upload watch folder file '
+            '"%s"; %s. Retrying.', path, exception
+        )
+        raise self.retry(exc=exception)
+    except Exception as exception:
+        logger.error(
+            'Error uploading watch folder file "%s" from source id: %s; %s',
+            path, source_id, exception, exc_info=True
+        )
+        pending_file_queryset.delete()
+        if settings.DEBUG:
+            raise
+    else:
+        pending_file_queryset.delete()
@@ -1,15 +1,19 @@
 import shutil
 
+from django.core.files import File
+
 from mayan.apps.documents.literals import DOCUMENT_FILE_ACTION_PAGES_NEW
 from mayan.apps.documents.tests.literals import (
     TEST_DOCUMENT_DESCRIPTION, TEST_SMALL_DOCUMENT_PATH
 )
+from mayan.apps.storage.models import SharedUploadedFile
 from mayan.apps.storage.utils import fs_cleanup, mkdtemp
 
 from ..literals import SOURCE_CHOICE_WEB_FORM, SOURCE_UNCOMPRESS_CHOICE_Y
 from ..models.staging_folder_sources import StagingFolderSource
 from ..models.watch_folder_sources import WatchFolderSource
 from ..models.webform_sources import WebFormSource
+from ..tasks import task_source_handle_upload
 
 from .literals import (
     TEST_SOURCE_LABEL, TEST_SOURCE_LABEL_EDITED, TEST_SOURCE_UNCOMPRESS_N,
@@ -284,3 +288,18 @@ class WatchFolderTestMixin:
 
         self.test_watch_folder = WatchFolderSource.objects.create(**kwargs)
         self.test_watch_folders.append(self.test_watch_folder)
+
+
+class SourceTaskTestMixin:
+    def _create_test_shared_uploaded_file(self, path):
+        with open(file=path, mode='rb') as file_object:
+            self.test_shared_uploaded_file = SharedUploadedFile.objects.create(
+                file=File(file=file_object)
+            )
+
+    def _execute_task_source_handle_upload(self, expand=True):
+        task_source_handle_upload(
+            document_type_id=self.test_document_type.pk, expand=expand,
+            shared_uploaded_file_id=self.test_shared_uploaded_file.pk,
+            source_id=self.test_source.pk
+        )
@@ -24,6 +24,8 @@ from mayan.apps.metadata.models import MetadataType
 from ..literals import SOURCE_UNCOMPRESS_CHOICE_Y
 from ..models.email_sources import EmailBaseModel, IMAPEmail, POP3Email
 from ..models.scanner_sources import SaneScanner
+from ..models.watch_folder_sources import WatchFolderSourceFile
+from ..settings import setting_watch_folder_pending_file_limit
 
 from .literals import (
     TEST_EMAIL_ATTACHMENT_AND_INLINE, TEST_EMAIL_BASE64_FILENAME,
@@ -446,6 +448,48 @@ class WatchFolderTestCase(WatchFolderTestMixin, GenericDocumentTestCase):
         self.assertEqual(document.label, TEST_NON_ASCII_DOCUMENT_FILENAME)
         self.assertEqual(document.file_latest.pages.count(), 1)
 
+    def test_pending_file_not_queued_again(self):
+        self._create_test_watchfolder()
+
+        shutil.copy(
+            src=TEST_SMALL_DOCUMENT_PATH, dst=self.temporary_directory
+        )
+        path_test_file = force_text(
+            s=Path(self.temporary_directory, TEST_SMALL_DOCUMENT_FILENAME)
+        )
+        self.test_watch_folder.pending_files.create(
+            path=path_test_file, path_hash=WatchFolderSourceFile.get_path_hash(
+                path=path_test_file
+            )
+        )
+
+        self.test_watch_folder.check_source()
+        self.assertEqual(Document.objects.count(), 0)
+
+    def test_pending_file_limit(self):
+        self._create_test_watchfolder()
+
+        for index in range(3):
+            shutil.copy(
+                src=TEST_SMALL_DOCUMENT_PATH, dst=Path(
+                    self.temporary_directory, '{}_{}'.format(
+                        index, TEST_SMALL_DOCUMENT_FILENAME
+                    )
+                )
+            )
+
+        old_value = setting_watch_folder_pending_file_limit.value
+        self.addCleanup(
+            setting_watch_folder_pending_file_limit.set, value=old_value
+        )
+        setting_watch_folder_pending_file_limit.set(value=2)
+        self.test_watch_folder.check_source()
+        self.assertEqual(Document.objects.count(), 2)
+        self.assertEqual(self.test_watch_folder.pending_files.count(), 0)
+
+        self.test_watch_folder.check_source()
+        self.assertEqual(Document.objects.count(), 3)
+
     def test_locking_support(self):
         self._create_test_watchfolder()
 
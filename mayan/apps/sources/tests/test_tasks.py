@@ -0,0 +1,76 @@
+import mock
+
+from mayan.apps.documents.models import Document
+from mayan.apps.documents.tests.base import GenericDocumentTestCase
+from mayan.apps.documents.tests.literals import TEST_COMPRESSED_DOCUMENT_PATH
+from mayan.apps.storage.models import SharedUploadedFile
+
+from ..settings import setting_archive_member_upload_limit
+
+from .mixins import SourceTaskTestMixin, SourceTestMixin
+
+
+class SourceHandleUploadTaskTestCase(
+    SourceTaskTestMixin, SourceTestMixin, GenericDocumentTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_shared_uploaded_file(
+            path=TEST_COMPRESSED_DOCUMENT_PATH
+        )
+
+    def test_task_expand(self):
+        document_count = Document.objects.count()
+
+        self._execute_task_source_handle_upload()
+
+        self.assertEqual(Document.objects.count(), document_count + 2)
+        self.assertFalse(
+            SharedUploadedFile.objects.filter(
+                pk=self.test_shared_uploaded_file.pk
+            ).exists()
+        )
+
+    @mock.patch('mayan.apps.sources.tasks.task_source_handle_upload.apply_async')
+    @mock.patch('mayan.apps.sources.tasks.task_upload_document.delay')
+    def test_task_expand_member_upload_limit(
+        self, mock_task_upload_document_delay,
+        mock_task_source_handle_upload_apply_async
+    ):
+        old_value = setting_archive_member_upload_limit.value
+        self.addCleanup(
+            setting_archive_member_upload_limit.set, value=old_value
+        )
+        setting_archive_member_upload_limit.set(value=1)
+
+        self._execute_task_source_handle_upload()
+
+        self.assertEqual(mock_task_upload_document_delay.call_count, 1)
+
+        kwargs = mock_task_source_handle_upload_apply_async.call_args[1]['kwargs']
+        self.assertEqual(kwargs['member_offset'], 1)
+        self.assertEqual(len(kwargs['pending_id_list']), 1)
+
+        # The parent upload is kept until all members are queued.
+        self.assertTrue(
+            SharedUploadedFile.objects.filter(
+                pk=self.test_shared_uploaded_file.pk
+            ).exists()
+        )
+
+    @mock.patch('mayan.apps.sources.models.base.Source.upload_document')
+    def test_task_expand_member_upload_error(self, mock_upload_document):
+        mock_upload_document.side_effect = ValueError
+
+        with self.assertRaises(expected_exception=ValueError):
+            self._execute_task_source_handle_upload()
+
+        # The shared file of the failed member is deleted and does not
+        # remain pending.
+        self.assertFalse(
+            SharedUploadedFile.objects.exclude(
+                pk=self.test_shared_uploaded_file.pk
+            ).exists()
+        )
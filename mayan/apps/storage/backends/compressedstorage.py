@@ -1,3 +1,4 @@
+import struct
 import zipfile
 
 try:
@@ -7,7 +8,7 @@ except ImportError:
     COMPRESSION = zipfile.ZIP_STORED
 
 from django.core.files.base import ContentFile
-from django.utils.encoding import force_text
+from django.utils.encoding import force_bytes, force_text
 
 from ..classes import BufferedFile, PassthroughStorage
 
@@ -18,7 +19,7 @@ class BufferedZipFile(BufferedFile):
     def __init__(self, *args, **kwargs):
         self.member_name = kwargs.pop('member_name')
         super().__init__(*args, **kwargs)
-        self.binary_mode = 'b' in self.mode
+        self.position = 0
 
         if 'r' in self.mode:
             zip_mode = 'r'
@@ -32,8 +33,39 @@ class BufferedZipFile(BufferedFile):
             name=self.member_name, mode=zip_mode
         )
 
+        if zip_mode == 'r':
+            self.zip_info = self.zip_container_file_object.getinfo(
+                name=self.member_name
+            )
+
+            if self.zip_info.compress_type == zipfile.ZIP_STORED:
+                self.data_offset = self._get_data_offset()
+            else:
+                self.data_offset = None
+
+    def _get_data_offset(self):
+        """
+        Return the offset of the stored member data in the zip file. The
+        length of the local header name and extra fields are stored in
+        bytes 26 to 29 of the local header.
+        """
+        self.file_object.seek(self.zip_info.header_offset)
+        header = self.file_object.read(zipfile.sizeFileHeader)
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+
+        return self.zip_info.header_offset + zipfile.sizeFileHeader + name_length + extra_length
+
     def _get_file_object_chunk(self):
-        chunk = self.zip_file_object.read(ZIP_CHUNK_SIZE)
+        if self.data_offset is None:
+            chunk = self.zip_file_object.read(ZIP_CHUNK_SIZE)
+        else:
+            # Stored members are read directly from the zip file.
+            self.file_object.seek(self.data_offset + self.position)
+            chunk = self.file_object.read(
+                min(ZIP_CHUNK_SIZE, self.zip_info.file_size - self.position)
+            )
+
+        self.position += len(chunk)
 
         if chunk:
             if self.binary_mode:
@@ -45,12 +77,57 @@ class BufferedZipFile(BufferedFile):
         self.zip_file_object.close()
         self.zip_container_file_object.close()
         self.file_object.close()
+        self._buffer_discard()
+
+    def seek(self, pos, whence=0):
+        if whence == 1:
+            pos = self.tell() + pos
+        elif whence == 2:
+            pos = self.zip_info.file_size + pos
+
+        pos = max(min(pos, self.zip_info.file_size), 0)
+
+        # Position of the start of the current buffer.
+        buffer_start = self.position - len(self.buffer)
+        if self.binary_mode and buffer_start <= pos <= self.position:
+            self.buffer_offset = pos - buffer_start
+            return pos
+
+        self._buffer_discard()
+
+        if self.data_offset is None:
+            if pos < self.position:
+                # Compressed data can only be read forward, restart from
+                # the beginning of the member.
+                self.zip_file_object.close()
+                self.zip_file_object = self.zip_container_file_object.open(
+                    name=self.member_name
+                )
+                self.position = 0
+
+            while self.position < pos:
+                data = self.zip_file_object.read(
+                    min(ZIP_CHUNK_SIZE, pos - self.position)
+                )
+                if not data:
+                    break
+
+                self.position += len(data)
+        else:
+            self.position = pos
+
+        return self.position
+
+    def seekable(self):
+        return 'r' in self.mode
 
     def tell(self):
-        return self.zip_file_object.tell()
+        return self.position - self.buffer_size
 
     def write(self, data):
-        return self.zip_file_object.write(data)
+        count = self.zip_file_object.write(data)
+        self.position += count
+        return count
 
 
 class ZipCompressedPassthroughStorage(PassthroughStorage):
@@ -107,7 +184,20 @@ class ZipCompressedPassthroughStorage(PassthroughStorage):
             ) as file_object:
                 # From Python: ZipFile requires mode 'r', 'w', 'x', or 'a'
                 with zipfile.ZipFile(file=file_object, mode='w', compression=COMPRESSION) as zip_file_object:
-                    zip_file_object.writestr(ZIP_MEMBER_FILENAME, content.read())
+                    # The size is not known in advance, force ZIP64 to
+                    # allow members larger than 2 GiB.
+                    with zip_file_object.open(
+                        name=ZIP_MEMBER_FILENAME, mode='w', force_zip64=True
+                    ) as member_file_object:
+                        while True:
+                            chunk = content.read(ZIP_CHUNK_SIZE)
+
+                            if chunk:
+                                member_file_object.write(
+                                    force_bytes(s=chunk)
+                                )
+                            else:
+                                break
 
                     for file in zip_file_object.filelist:
                         file.create_system = 0
@@ -1,21 +1,36 @@
+import os
+import shutil
+import struct
+
 from Crypto.Cipher import AES
 from Crypto.Hash import SHA256
 from Crypto.Protocol.KDF import PBKDF2
+from Crypto.Random import get_random_bytes
 from Crypto.Util.Padding import pad, unpad
 
 from django.conf import settings
-from django.core.files.base import ContentFile
-from django.utils.encoding import force_text
+from django.core.files.base import ContentFile, File
+from django.utils.encoding import force_bytes, force_text
 
 from ..classes import BufferedFile, PassthroughStorage
+from ..utils import TemporaryFile
 
 from .literals import (
-    ENCRYPTION_FILE_CHUNK_SIZE, ENCRYPTION_KEY_DERIVATION_ITERATIONS,
-    ENCRYPTION_KEY_SIZE
+    ENCRYPTION_FILE_CHUNK_SIZE, ENCRYPTION_FORMAT_CHUNK_SIZE,
+    ENCRYPTION_FORMAT_HEADER, ENCRYPTION_FORMAT_MAGIC,
+    ENCRYPTION_FORMAT_NONCE_PREFIX_SIZE, ENCRYPTION_FORMAT_TAG_SIZE,
+    ENCRYPTION_FORMAT_VERSION, ENCRYPTION_KEY_DERIVATION_ITERATIONS,
+    ENCRYPTION_KEY_SIZE, ENCRYPTION_UPGRADE_SUFFIX
 )
 
+ENCRYPTION_FORMAT_HEADER_SIZE = struct.calcsize(ENCRYPTION_FORMAT_HEADER)
+
 
 class BufferedEncryptedFile(BufferedFile):
+    """
+    Legacy format. A single AES-CBC stream where each chunk is padded
+    individually. Can only be read sequentially.
+    """
     def __init__(self, *args, **kwargs):
         self.key = kwargs.pop('key')
 
@@ -29,7 +44,10 @@ class BufferedEncryptedFile(BufferedFile):
         self.position = 0
 
     def _get_file_object_chunk(self):
-        chunk = self.file_object.read(ENCRYPTION_FILE_CHUNK_SIZE)
+        # Each padded chunk is written with an extra block of padding.
+        chunk = self.file_object.read(
+            ENCRYPTION_FILE_CHUNK_SIZE + AES.block_size
+        )
 
         if chunk:
             data = unpad(
@@ -83,7 +101,198 @@ class BufferedEncryptedFile(BufferedFile):
         return count
 
 
+class ChunkedEncryptedFile(File):
+    """
+    Chunked format. A header followed by fixed size chunks, each encrypted
+    and authenticated individually using AES-GCM. The nonce of each chunk
+    is derived from its index, allowing seeking to any position by
+    decrypting only the chunk that contains it.
+    """
+    def __init__(self, file_object, key, mode, name=None):
+        self.binary_mode = 'b' in mode
+        self.chunk_cache_data = None
+        self.chunk_cache_index = None
+        self.file_object = file_object
+        self.key = key
+        self.mode = mode
+        self.name = name
+        self.position = 0
+        self._closed = False
+
+        if 'w' in mode:
+            self.chunk_count = 0
+            self.chunk_size = ENCRYPTION_FORMAT_CHUNK_SIZE
+            self.nonce_prefix = get_random_bytes(
+                ENCRYPTION_FORMAT_NONCE_PREFIX_SIZE
+            )
+            self.write_buffer = bytearray()
+            self.file_object.write(
+                struct.pack(
+                    ENCRYPTION_FORMAT_HEADER, ENCRYPTION_FORMAT_MAGIC,
+                    ENCRYPTION_FORMAT_VERSION, self.chunk_size,
+                    self.nonce_prefix
+                )
+            )
+        else:
+            self.file_object.seek(0)
+            magic, version, self.chunk_size, self.nonce_prefix = struct.unpack(
+                ENCRYPTION_FORMAT_HEADER, self.file_object.read(
+                    ENCRYPTION_FORMAT_HEADER_SIZE
+                )
+            )
+            if magic != ENCRYPTION_FORMAT_MAGIC or version != ENCRYPTION_FORMAT_VERSION:
+                raise ValueError('Unknown encrypted file format.')
+
+            self.file_object.seek(0, 2)
+            full_chunks, remainder = divmod(
+                self.file_object.tell() - ENCRYPTION_FORMAT_HEADER_SIZE,
+                self.chunk_size + ENCRYPTION_FORMAT_TAG_SIZE
+            )
+            self.chunk_count = full_chunks + (1 if remainder else 0)
+            self.size = full_chunks * self.chunk_size + max(
+                remainder - ENCRYPTION_FORMAT_TAG_SIZE, 0
+            )
+
+    def _get_cipher(self, index, final):
+        cipher = AES.new(
+            key=self.key, mode=AES.MODE_GCM, nonce=self.nonce_prefix + struct.pack(
+                '>I', index
+            ), mac_len=ENCRYPTION_FORMAT_TAG_SIZE
+        )
+        # Authenticate the position of the last chunk to detect
+        # truncated files.
+        cipher.update(b'\x01' if final else b'\x00')
+        return cipher
+
+    def _get_chunk(self, index):
+        if index != self.chunk_cache_index:
+            self.file_object.seek(
+                ENCRYPTION_FORMAT_HEADER_SIZE + index * (
+                    self.chunk_size + ENCRYPTION_FORMAT_TAG_SIZE
+                )
+            )
+            data = self.file_object.read(
+                self.chunk_size + ENCRYPTION_FORMAT_TAG_SIZE
+            )
+            cipher = self._get_cipher(
+                index=index, final=index == self.chunk_count - 1
+            )
+            self.chunk_cache_data = cipher.decrypt_and_verify(
+                ciphertext=data[:-ENCRYPTION_FORMAT_TAG_SIZE],
+                received_mac_tag=data[-ENCRYPTION_FORMAT_TAG_SIZE:]
+            )
+            self.chunk_cache_index = index
+
+        return self.chunk_cache_data
+
+    def _write_chunk(self, data, final):
+        cipher = self._get_cipher(index=self.chunk_count, final=final)
+        ciphertext, tag = cipher.encrypt_and_digest(plaintext=bytes(data))
+        self.file_object.write(ciphertext)
+        self.file_object.write(tag)
+        self.chunk_count += 1
+
+    def close(self):
+        if not self._closed:
+            if 'w' in self.mode:
+                # The last chunk is always written, even when empty, to
+                # mark the end of the file.
+                self._write_chunk(data=self.write_buffer, final=True)
+                self.write_buffer = bytearray()
+
+            self._closed = True
+            self.chunk_cache_data = None
+            self.file_object.close()
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def flush(self):
+        return self.file_object.flush()
+
+    def read(self, size=None):
+        remaining = max(self.size - self.position, 0)
+
+        if size is None or size < 0:
+            size = remaining
+        else:
+            size = min(size, remaining)
+
+        result = []
+        while size > 0:
+            index, offset = divmod(self.position, self.chunk_size)
+            data = self._get_chunk(index=index)[offset:offset + size]
+            result.append(data)
+            self.position += len(data)
+            size -= len(data)
+
+        data = b''.join(result)
+
+        if self.binary_mode:
+            return data
+        else:
+            return force_text(s=data)
+
+    def readable(self):
+        return 'r' in self.mode
+
+    def seek(self, pos, whence=0):
+        if 'w' in self.mode:
+            raise AttributeError('Seeking is not supported when writing.')
+
+        if whence == 0:
+            self.position = pos
+        elif whence == 1:
+            self.position = self.position + pos
+        elif whence == 2:
+            self.position = self.size + pos
+
+        self.position = max(self.position, 0)
+        return self.position
+
+    def seekable(self):
+        return 'r' in self.mode
+
+    def tell(self):
+        return self.position
+
+    def writable(self):
+        return 'w' in self.mode
+
+    def write(self, data):
+        data = force_bytes(s=data)
+        self.write_buffer.extend(data)
+
+        # Keep at least one chunk buffered, the last chunk is written
+        # on close.
+        while len(self.write_buffer) > self.chunk_size:
+            self._write_chunk(
+                data=self.write_buffer[:self.chunk_size], final=False
+            )
+            del self.write_buffer[:self.chunk_size]
+
+        self.position += len(data)
+        return len(data)
+
+
 class EncryptedPassthroughStorage(PassthroughStorage):
+    @classmethod
+    def get_pipeline_instance(cls, storage_instance):
+        """
+        Return the encrypted storage of a storage pipeline or None if the
+        pipeline does not use encryption. File names are passed unchanged
+        along the pipeline, allowing the files to be processed directly by
+        the encrypted storage.
+        """
+        while not isinstance(storage_instance, cls):
+            if isinstance(storage_instance, PassthroughStorage):
+                storage_instance = storage_instance.next_storage_backend
+            else:
+                return None
+
+        return storage_instance
+
     def __init__(self, *args, **kwargs):
         password = kwargs.pop('password')
         super().__init__(*args, **kwargs)
@@ -107,15 +316,29 @@ class EncryptedPassthroughStorage(PassthroughStorage):
             return self._call_backend_method(
                 method_name='open', kwargs=next_kwargs
             )
+        elif 'w' in mode:
+            next_kwargs['mode'] = 'wb'
+            storage_file = self._call_backend_method(
+                method_name='open', kwargs=next_kwargs
+            )
+            return ChunkedEncryptedFile(
+                file_object=storage_file, key=self.key, mode=mode,
+            )
         else:
             # Mode is always 'rb' when reading the encrypted file
             next_kwargs['mode'] = 'rb+'
             storage_file = self._call_backend_method(
                 method_name='open', kwargs=next_kwargs
             )
-            return BufferedEncryptedFile(
-                file_object=storage_file, key=self.key, mode=mode,
-            )
+
+            if self._is_chunked_format(file_object=storage_file):
+                return ChunkedEncryptedFile(
+                    file_object=storage_file, key=self.key, mode=mode,
+                )
+            else:
+                return BufferedEncryptedFile(
+                    file_object=storage_file, key=self.key, mode=mode,
+                )
 
     def save(self, name, content, max_length=None, _direct=False):
         next_kwargs = {'max_length': max_length, 'name': name}
@@ -129,7 +352,6 @@ class EncryptedPassthroughStorage(PassthroughStorage):
                 method_name='save', kwargs=next_kwargs
             )
         else:
-            cipher = AES.new(key=self.key, mode=AES.MODE_CBC)
             if not self._call_backend_method(
                 method_name='exists', kwargs={'name': name}
             ):
@@ -139,28 +361,130 @@ class EncryptedPassthroughStorage(PassthroughStorage):
                     }
                 )
 
-            with self._call_backend_method(
-                method_name='open', kwargs={
-                    'name': name, 'mode': 'wb'
-                }
-            ) as file_object:
-                file_object.write(cipher.iv)
-
+            with self.open(name=name, mode='wb') as file_object:
                 while True:
-                    chunk = content.read(ENCRYPTION_FILE_CHUNK_SIZE)
+                    chunk = content.read(ENCRYPTION_FORMAT_CHUNK_SIZE)
+
+                    if chunk:
+                        file_object.write(chunk)
+                    else:
+                        break
 
-                    try:
-                        chunk = chunk.encode('utf-8')
-                    except AttributeError:
-                        """Already a byte string"""
+            return name
+
+    def is_legacy_format(self, name):
+        """
+        Return True if the file was saved using the legacy sequential
+        AES-CBC format.
+        """
+        storage_file = self._call_backend_method(
+            method_name='open', kwargs={'mode': 'rb', 'name': name}
+        )
+
+        with storage_file:
+            return not self._is_chunked_format(file_object=storage_file)
+
+    def upgrade(self, name):
+        """
+        Rewrite a file saved in the legacy AES-CBC format using the chunked
+        format. Returns True if the file was rewritten. The new file is
+        written under a temporary name and verified before it replaces the
+        original, which is left untouched if any step fails.
+        """
+        if not self.is_legacy_format(name=name):
+            return False
+
+        with TemporaryFile() as temporary_file:
+            hash_object = SHA256.new()
+
+            with self.open(name=name, mode='rb') as file_object:
+                while True:
+                    chunk = file_object.read(ENCRYPTION_FILE_CHUNK_SIZE)
 
                     if chunk:
-                        chunk = pad(
-                            data_to_pad=chunk, block_size=AES.block_size
-                        )
+                        hash_object.update(chunk)
+                        temporary_file.write(chunk)
                     else:
                         break
 
-                    file_object.write(cipher.encrypt(chunk))
+            temporary_file.seek(0)
+            upgrade_name = self.save(
+                name='{}{}'.format(name, ENCRYPTION_UPGRADE_SUFFIX),
+                content=File(file=temporary_file)
+            )
+
+        checksum = hash_object.digest()
 
-            return name
+        try:
+            self._verify(checksum=checksum, name=upgrade_name)
+        except Exception:
+            self._call_backend_method(
+                method_name='delete', kwargs={'name': upgrade_name}
+            )
+            raise
+
+        self._replace(
+            checksum=checksum, name=name, source_name=upgrade_name
+        )
+
+        return True
+
+    def _is_chunked_format(self, file_object):
+        header = file_object.read(len(ENCRYPTION_FORMAT_MAGIC))
+        file_object.seek(0)
+        return header == ENCRYPTION_FORMAT_MAGIC
+
+    def _replace(self, checksum, name, source_name):
+        """
+        Replace a stored file with the encrypted data of another. The source
+        file is renamed over the original when the next storage provides
+        local paths. Otherwise the data is copied and the source is deleted
+        only after the copy is verified.
+        """
+        try:
+            path_source = self._call_backend_method(
+                method_name='path', kwargs={'name': source_name}
+            )
+            path_destination = self._call_backend_method(
+                method_name='path', kwargs={'name': name}
+            )
+        except NotImplementedError:
+            with self.open(name=source_name, mode='rb', _direct=True) as source_file_object:
+                with self.open(name=name, mode='wb', _direct=True) as file_object:
+                    shutil.copyfileobj(
+                        fsrc=source_file_object, fdst=file_object,
+                        length=ENCRYPTION_FORMAT_CHUNK_SIZE
+                    )
+
+            self._verify(checksum=checksum, name=name)
+            self._call_backend_method(
+                method_name='delete', kwargs={'name': source_name}
+            )
+        else:
+            os.replace(src=path_source, dst=path_destination)
+
+    def _verify(self, checksum, name):
+        """
+        Raise ValueError if the decrypted content of the file does not match
+        the checksum. Chunks are authenticated while being read.
+        """
+        hash_object = SHA256.new()
+
+        with self.open(name=name, mode='rb') as file_object:
+            if not isinstance(file_object, ChunkedEncryptedFile):
+                raise ValueError(
+                    'File {} was not saved in the chunked format.'.format(name)
+                )
+
+            while True:
+                chunk = file_object.read(ENCRYPTION_FORMAT_CHUNK_SIZE)
+
+                if chunk:
+                    hash_object.update(chunk)
+                else:
+                    break
+
+        if hash_object.digest() != checksum:
+            raise ValueError(
+                'Content of file {} does not match the original.'.format(name)
+            )
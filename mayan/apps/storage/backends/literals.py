@@ -1,6 +1,13 @@
 ENCRYPTION_FILE_CHUNK_SIZE = 64 * 1024  # 64K
+ENCRYPTION_FORMAT_CHUNK_SIZE = 64 * 1024  # 64K
+ENCRYPTION_FORMAT_HEADER = '>8sBI8s'
+ENCRYPTION_FORMAT_MAGIC = b'MAYANAES'
+ENCRYPTION_FORMAT_NONCE_PREFIX_SIZE = 8
+ENCRYPTION_FORMAT_TAG_SIZE = 16
+ENCRYPTION_FORMAT_VERSION = 1
 ENCRYPTION_KEY_DERIVATION_ITERATIONS = 100000
 ENCRYPTION_KEY_SIZE = 32
+ENCRYPTION_UPGRADE_SUFFIX = '.upgrade'
 
 ZIP_CHUNK_SIZE = 64 * 1024  # 64K
 ZIP_MEMBER_FILENAME = 'mayan_file'
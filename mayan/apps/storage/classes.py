@@ -1,5 +1,5 @@
+import io
 import logging
-from io import BytesIO, StringIO
 
 from django.core.files.base import File
 from django.core.files.storage import Storage
@@ -15,48 +15,108 @@ logger = logging.getLogger(name=__name__)
 
 
 class BufferedFile(File):
+    """
+    Base class for file like objects that transform the data of another
+    file object one chunk at a time. Only the last chunk produced is kept
+    in memory and consumed data is discarded as it is read.
+    """
     def __init__(self, file_object, mode, name=None):
+        self.binary_mode = 'b' in mode
         self.file_object = file_object
         self.mode = mode
-        if 'b' in mode:
-            self.stream = BytesIO()
+        self.name = name
+        self._buffer_discard()
+
+    def _buffer_discard(self):
+        self.buffer = self._get_empty_data()
+        self.buffer_offset = 0
+
+    def _buffer_fill(self):
+        chunk = self._get_file_object_chunk()
+
+        if chunk:
+            if self.binary_mode:
+                # Slicing a memoryview does not copy the data.
+                self.buffer = memoryview(chunk)
+            else:
+                self.buffer = chunk
+
+            self.buffer_offset = 0
+            return True
         else:
-            self.stream = StringIO()
+            self._buffer_discard()
+            return False
 
-        self.name = name
-        self.stream_size = 0
+    def _buffer_take(self, size):
+        data = self.buffer[self.buffer_offset:self.buffer_offset + size]
+        self.buffer_offset += len(data)
+        return data
+
+    def _get_empty_data(self):
+        if self.binary_mode:
+            return b''
+        else:
+            return ''
+
+    def _get_file_object_chunk(self):
+        raise NotImplementedError
+
+    @property
+    def buffer_size(self):
+        """
+        Amount of data already produced by the file object that has not
+        been read.
+        """
+        return len(self.buffer) - self.buffer_offset
 
     def close(self):
         self.file_object.close()
-        self.stream.close()
+        self._buffer_discard()
 
     def flush(self):
         return self.file_object.flush()
 
+    def iter_chunks(self):
+        """
+        Yield the remaining data in the chunks produced by the file object.
+        In binary mode the chunks are memoryview instances.
+        """
+        if self.buffer_size:
+            yield self._buffer_take(size=self.buffer_size)
+
+        while self._buffer_fill():
+            yield self._buffer_take(size=self.buffer_size)
+
     def read(self, size=None):
-        if size is None:
-            size = -1
-
-        if size == -1 or size > self.stream_size:
-            while True:
-                position = self.stream.tell()
-                chunk = self._get_file_object_chunk()
-                if chunk:
-                    self.stream_size += len(chunk)
-                    self.stream.write(chunk)
-                    self.stream.seek(position)
-                    if self.stream_size >= size and size != -1:
-                        break
-                else:
+        if size is None or size < 0:
+            result = list(self.iter_chunks())
+        else:
+            result = []
+            while size > 0:
+                if not self.buffer_size and not self._buffer_fill():
                     break
 
-        if size:
-            read_size = min(size, self.stream_size)
-            self.stream_size -= read_size
-        else:
-            read_size = None
+                data = self._buffer_take(size=size)
+                result.append(data)
+                size -= len(data)
+
+        return self._get_empty_data().join(result)
+
+    def readinto(self, b):
+        if not self.binary_mode:
+            raise io.UnsupportedOperation('readinto requires binary mode.')
+
+        view = memoryview(b).cast('B')
+        count = 0
+        while count < len(view):
+            if not self.buffer_size and not self._buffer_fill():
+                break
+
+            data = self._buffer_take(size=len(view) - count)
+            view[count:count + len(data)] = data
+            count += len(data)
 
-        return self.stream.read(read_size)
+        return count
 
 
 class DefinedStorage(AppsModuleLoaderMixin):
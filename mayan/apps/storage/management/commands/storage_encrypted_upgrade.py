@@ -0,0 +1,43 @@
+from django.core import management
+from django.utils.translation import ugettext_lazy as _
+
+from ...tasks import task_storage_encrypted_upgrade
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Queue the upgrade of model files stored using the legacy encrypted '
+        'storage format.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--app', action='store', dest='app_label',
+            help=_('Name of the app to process.'),
+            required=True,
+        )
+        parser.add_argument(
+            '--attribute', action='store', default='file',
+            dest='file_attribute',
+            help=_('Name of the model file field. Defaults to "file".'),
+        )
+        parser.add_argument(
+            '--model', action='store', dest='model_name',
+            help=_('Process a specific model.'),
+            required=True,
+        )
+        parser.add_argument(
+            '--storage_name', action='store', dest='defined_storage_name',
+            help=_('Name of the storage to process.'),
+            required=True,
+        )
+
+    def handle(self, *args, **options):
+        task_storage_encrypted_upgrade.apply_async(
+            kwargs={
+                'app_label': options['app_label'],
+                'defined_storage_name': options['defined_storage_name'],
+                'file_attribute': options['file_attribute'],
+                'model_name': options['model_name']
+            }
+        )
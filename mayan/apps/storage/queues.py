@@ -2,6 +2,7 @@ from datetime import timedelta
 
 from django.utils.translation import ugettext_lazy as _
 
+from mayan.apps.common.queues import queue_tools
 from mayan.apps.task_manager.classes import CeleryQueue
 from mayan.apps.task_manager.workers import worker_d
 
@@ -29,3 +30,14 @@ queue_storage_periodic.add_task_type(
         seconds=TASK_DOWNLOAD_FILE_STALE_INTERVAL
     )
 )
+
+queue_tools.add_task_type(
+    dotted_path='mayan.apps.storage.tasks.task_storage_encrypted_file_upgrade',
+    label=_('Upgrade the format of an encrypted file'),
+    name='task_storage_encrypted_file_upgrade'
+)
+queue_tools.add_task_type(
+    dotted_path='mayan.apps.storage.tasks.task_storage_encrypted_upgrade',
+    label=_('Upgrade the format of encrypted files'),
+    name='task_storage_encrypted_upgrade'
+)
@@ -4,6 +4,9 @@ from django.apps import apps
 
 from mayan.celery import app
 
+from .backends.encryptedstorage import EncryptedPassthroughStorage
+from .classes import DefinedStorage
+
 logger = logging.getLogger(name=__name__)
 
 
@@ -41,3 +44,60 @@ def task_shared_upload_stale_delete():
         expired_upload.delete()
 
     logger.debug('Finished')
+
+
+@app.task(ignore_result=True)
+def task_storage_encrypted_file_upgrade(defined_storage_name, file_name):
+    """
+    Rewrite a file stored using the legacy encrypted storage format using
+    the chunked, seekable format.
+    """
+    logger.debug('Executing')
+
+    storage_instance = EncryptedPassthroughStorage.get_pipeline_instance(
+        storage_instance=DefinedStorage.get(
+            name=defined_storage_name
+        ).get_storage_instance()
+    )
+
+    if not storage_instance:
+        logger.debug(
+            'Storage %s does not use encryption', defined_storage_name
+        )
+        return
+
+    try:
+        if storage_instance.upgrade(name=file_name):
+            logger.debug('Upgraded file: %s', file_name)
+    except Exception as exception:
+        logger.error(
+            'Error upgrading encrypted file: %s; %s', file_name, exception
+        )
+
+    logger.debug('Finished')
+
+
+@app.task(ignore_result=True)
+def task_storage_encrypted_upgrade(
+    app_label, defined_storage_name, model_name, file_attribute='file'
+):
+    """
+    Queue the upgrade of each file of a model stored using the legacy
+    encrypted storage format.
+    """
+    logger.debug('Executing')
+
+    model = apps.get_model(app_label=app_label, model_name=model_name)
+
+    for instance in model.objects.all().iterator():
+        file_name = getattr(instance, file_attribute).name
+
+        if file_name:
+            task_storage_encrypted_file_upgrade.apply_async(
+                kwargs={
+                    'defined_storage_name': defined_storage_name,
+                    'file_name': file_name
+                }
+            )
+
+    logger.debug('Finished')
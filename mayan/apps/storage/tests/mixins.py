@@ -3,6 +3,9 @@ import logging
 from pathlib import Path
 import shutil
 
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad
+
 from django.core.files.base import ContentFile
 
 from mayan.apps.acls.classes import ModelPermission
@@ -10,6 +13,7 @@ from mayan.apps.documents.literals import STORAGE_NAME_DOCUMENT_FILES
 from mayan.apps.permissions.tests.mixins import PermissionTestMixin
 from mayan.apps.smart_settings.classes import SettingNamespace
 
+from ..backends.literals import ENCRYPTION_FILE_CHUNK_SIZE
 from ..classes import DefinedStorage
 from ..compressed_files import Archive
 from ..models import DownloadFile
@@ -118,6 +122,25 @@ class DownloadFileViewTestMixin:
         return self.get(viewname='storage:download_file_list')
 
 
+class EncryptedStorageTestMixin:
+    def _save_test_legacy_encrypted_file(self, content, key, path):
+        cipher = AES.new(key=key, mode=AES.MODE_CBC)
+
+        with open(file=path, mode='wb') as file_object:
+            file_object.write(cipher.iv)
+
+            for offset in range(0, len(content), ENCRYPTION_FILE_CHUNK_SIZE):
+                file_object.write(
+                    cipher.encrypt(
+                        pad(
+                            data_to_pad=content[
+                                offset:offset + ENCRYPTION_FILE_CHUNK_SIZE
+                            ], block_size=AES.block_size
+                        )
+                    )
+                )
+
+
 class StorageProcessorTestMixin:
     @classmethod
     def setUpClass(cls):
@@ -125,6 +148,7 @@ class StorageProcessorTestMixin:
         cls.defined_storage = DefinedStorage.get(
             name=STORAGE_NAME_DOCUMENT_FILES
         )
+        cls.document_storage_dotted_path = cls.defined_storage.dotted_path
         cls.document_storage_kwargs = cls.defined_storage.kwargs
 
     def setUp(self):
@@ -136,6 +160,7 @@ class StorageProcessorTestMixin:
     def tearDown(self):
         super().tearDown()
         shutil.rmtree(path=self.temporary_directory, ignore_errors=True)
+        self.defined_storage.dotted_path = self.document_storage_dotted_path
         self.defined_storage.kwargs = self.document_storage_kwargs
 
 
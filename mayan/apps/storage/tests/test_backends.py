@@ -1,19 +1,32 @@
+import os
 from pathlib import Path
+import zipfile
 
 from django.core.files.base import ContentFile
 from django.utils.encoding import force_bytes
 
+import mock
+
 from mayan.apps.mimetype.api import get_mimetype
 from mayan.apps.storage.utils import fs_cleanup, mkdtemp
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..backends.compressedstorage import ZipCompressedPassthroughStorage
-from ..backends.encryptedstorage import EncryptedPassthroughStorage
+from ..backends.encryptedstorage import (
+    ChunkedEncryptedFile, EncryptedPassthroughStorage
+)
+from ..backends.literals import (
+    ENCRYPTION_FILE_CHUNK_SIZE, ENCRYPTION_FORMAT_CHUNK_SIZE,
+    ENCRYPTION_UPGRADE_SUFFIX, ZIP_CHUNK_SIZE, ZIP_MEMBER_FILENAME
+)
 
 from .literals import TEST_CONTENT, TEST_FILE_NAME
+from .mixins import EncryptedStorageTestMixin
 
 
-class EncryptedPassthroughStorageTestCase(BaseTestCase):
+class EncryptedPassthroughStorageTestCase(
+    EncryptedStorageTestMixin, BaseTestCase
+):
     def setUp(self):
         super().setUp()
         self.temporary_directory = mkdtemp()
@@ -53,6 +66,152 @@ class EncryptedPassthroughStorageTestCase(BaseTestCase):
         with storage.open(name=TEST_FILE_NAME, mode='r') as file_object:
             self.assertEqual(file_object.read(999), TEST_CONTENT)
 
+    def _get_test_storage(self):
+        return EncryptedPassthroughStorage(
+            password='testpassword',
+            next_storage_backend_arguments={
+                'location': self.temporary_directory,
+            }
+        )
+
+    def _save_legacy_file(self, storage, content):
+        self._save_test_legacy_encrypted_file(
+            content=content, key=storage.key,
+            path=Path(self.temporary_directory) / TEST_FILE_NAME
+        )
+
+    def test_file_seek(self):
+        storage = self._get_test_storage()
+        test_content = os.urandom(ENCRYPTION_FORMAT_CHUNK_SIZE * 3 + 100)
+
+        storage.save(
+            name=TEST_FILE_NAME, content=ContentFile(content=test_content)
+        )
+
+        with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            self.assertTrue(isinstance(file_object, ChunkedEncryptedFile))
+            self.assertEqual(file_object.size, len(test_content))
+
+            offset = ENCRYPTION_FORMAT_CHUNK_SIZE * 2 - 10
+            file_object.seek(offset)
+            self.assertEqual(
+                file_object.read(20), test_content[offset:offset + 20]
+            )
+            self.assertEqual(file_object.tell(), offset + 20)
+
+            file_object.seek(-50, 2)
+            self.assertEqual(file_object.read(), test_content[-50:])
+
+            file_object.seek(0)
+            self.assertEqual(file_object.read(), test_content)
+
+    def test_file_save_empty(self):
+        storage = self._get_test_storage()
+
+        storage.save(name=TEST_FILE_NAME, content=ContentFile(content=b''))
+
+        with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            self.assertEqual(file_object.read(), b'')
+
+    def test_file_truncated(self):
+        storage = self._get_test_storage()
+        test_content = os.urandom(ENCRYPTION_FORMAT_CHUNK_SIZE * 2)
+
+        storage.save(
+            name=TEST_FILE_NAME, content=ContentFile(content=test_content)
+        )
+
+        path_file = Path(self.temporary_directory) / TEST_FILE_NAME
+        with path_file.open(mode='rb+') as file_object:
+            file_object.seek(0, 2)
+            file_object.truncate(file_object.tell() // 2)
+
+        with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            with self.assertRaises(ValueError):
+                file_object.read()
+
+    def test_legacy_file_load(self):
+        storage = self._get_test_storage()
+        test_content = os.urandom(ENCRYPTION_FILE_CHUNK_SIZE * 2 + 100)
+
+        self._save_legacy_file(storage=storage, content=test_content)
+
+        self.assertTrue(storage.is_legacy_format(name=TEST_FILE_NAME))
+
+        with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            self.assertEqual(file_object.read(), test_content)
+
+    def test_legacy_file_upgrade(self):
+        storage = self._get_test_storage()
+        test_content = os.urandom(ENCRYPTION_FILE_CHUNK_SIZE * 2 + 100)
+
+        self._save_legacy_file(storage=storage, content=test_content)
+
+        self.assertTrue(storage.upgrade(name=TEST_FILE_NAME))
+        self.assertFalse(storage.is_legacy_format(name=TEST_FILE_NAME))
+        self.assertFalse(storage.upgrade(name=TEST_FILE_NAME))
+
+        with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            self.assertEqual(file_object.read(), test_content)
+
+        self.assertFalse(
+            storage.exists(
+                name='{}{}'.format(TEST_FILE_NAME, ENCRYPTION_UPGRADE_SUFFIX)
+            )
+        )
+
+    def test_legacy_file_upgrade_without_path(self):
+        storage = self._get_test_storage()
+        test_content = os.urandom(ENCRYPTION_FILE_CHUNK_SIZE * 2 + 100)
+
+        self._save_legacy_file(storage=storage, content=test_content)
+
+        call_backend_method = storage._call_backend_method
+
+        def _call_backend_method(method_name, kwargs):
+            # Emulate a remote storage without local paths.
+            if method_name == 'path':
+                raise NotImplementedError
+
+            return call_backend_method(method_name=method_name, kwargs=kwargs)
+
+        with mock.patch.object(
+            storage, '_call_backend_method', side_effect=_call_backend_method
+        ):
+            self.assertTrue(storage.upgrade(name=TEST_FILE_NAME))
+
+        self.assertFalse(storage.is_legacy_format(name=TEST_FILE_NAME))
+        self.assertFalse(
+            storage.exists(
+                name='{}{}'.format(TEST_FILE_NAME, ENCRYPTION_UPGRADE_SUFFIX)
+            )
+        )
+
+        with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            self.assertEqual(file_object.read(), test_content)
+
+    def test_legacy_file_upgrade_verification_error(self):
+        storage = self._get_test_storage()
+        test_content = os.urandom(ENCRYPTION_FILE_CHUNK_SIZE * 2 + 100)
+
+        self._save_legacy_file(storage=storage, content=test_content)
+
+        with mock.patch.object(
+            storage, '_verify', side_effect=ValueError
+        ):
+            with self.assertRaises(ValueError):
+                storage.upgrade(name=TEST_FILE_NAME)
+
+        self.assertTrue(storage.is_legacy_format(name=TEST_FILE_NAME))
+        self.assertFalse(
+            storage.exists(
+                name='{}{}'.format(TEST_FILE_NAME, ENCRYPTION_UPGRADE_SUFFIX)
+            )
+        )
+
+        with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            self.assertEqual(file_object.read(), test_content)
+
 
 class ZipCompressedPassthroughStorageTestCase(BaseTestCase):
     def setUp(self):
@@ -90,6 +249,68 @@ class ZipCompressedPassthroughStorageTestCase(BaseTestCase):
         with storage.open(name=TEST_FILE_NAME, mode='r') as file_object:
             self.assertEqual(file_object.read(), TEST_CONTENT)
 
+    def _get_test_storage(self):
+        return ZipCompressedPassthroughStorage(
+            next_storage_backend_arguments={
+                'location': self.temporary_directory
+            }
+        )
+
+    def _test_file_seek(self, storage, test_content):
+        with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            offset = ZIP_CHUNK_SIZE * 2 - 10
+            file_object.seek(offset)
+            self.assertEqual(
+                file_object.read(20), test_content[offset:offset + 20]
+            )
+            self.assertEqual(file_object.tell(), offset + 20)
+
+            file_object.seek(10)
+            self.assertEqual(file_object.read(20), test_content[10:30])
+
+            file_object.seek(-50, 2)
+            self.assertEqual(file_object.read(), test_content[-50:])
+
+    def test_file_read_chunks(self):
+        storage = self._get_test_storage()
+        test_content = os.urandom(ZIP_CHUNK_SIZE * 3 + 100)
+
+        storage.save(
+            name=TEST_FILE_NAME, content=ContentFile(content=test_content)
+        )
+
+        with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            buffer = bytearray(100)
+            self.assertEqual(file_object.readinto(buffer), 100)
+            self.assertEqual(bytes(buffer), test_content[:100])
+
+            chunks = list(file_object.iter_chunks())
+            self.assertTrue(
+                all(len(chunk) <= ZIP_CHUNK_SIZE for chunk in chunks)
+            )
+            self.assertEqual(b''.join(chunks), test_content[100:])
+            self.assertEqual(file_object.buffer_size, 0)
+
+    def test_file_seek(self):
+        storage = self._get_test_storage()
+        test_content = os.urandom(ZIP_CHUNK_SIZE * 3 + 100)
+
+        storage.save(
+            name=TEST_FILE_NAME, content=ContentFile(content=test_content)
+        )
+
+        self._test_file_seek(storage=storage, test_content=test_content)
+
+    def test_stored_file_seek(self):
+        storage = self._get_test_storage()
+        test_content = os.urandom(ZIP_CHUNK_SIZE * 3 + 100)
+
+        path_file = Path(self.temporary_directory) / TEST_FILE_NAME
+        with zipfile.ZipFile(file=str(path_file), mode='w', compression=zipfile.ZIP_STORED) as zip_file_object:
+            zip_file_object.writestr(ZIP_MEMBER_FILENAME, test_content)
+
+        self._test_file_seek(storage=storage, test_content=test_content)
+
 
 class CombinationPassthroughStorageTestCase(BaseTestCase):
     def setUp(self):
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from django.core import management
 from django.utils.encoding import force_text
 
@@ -5,7 +7,9 @@ from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.documents.storages import storage_document_files
 from mayan.apps.mimetype.api import get_mimetype
 
-from .mixins import StorageProcessorTestMixin
+from ..backends.encryptedstorage import EncryptedPassthroughStorage
+
+from .mixins import EncryptedStorageTestMixin, StorageProcessorTestMixin
 
 
 class StorageProcessManagementCommandTestCase(
@@ -73,3 +77,56 @@ class StorageProcessManagementCommandTestCase(
             self.test_document.file_latest.checksum,
             self.test_document.file_latest.checksum_update(save=False)
         )
+
+
+class StorageEncryptedUpgradeManagementCommandTestCase(
+    EncryptedStorageTestMixin, StorageProcessorTestMixin,
+    GenericDocumentTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self.defined_storage.dotted_path = 'mayan.apps.storage.backends.encryptedstorage.EncryptedPassthroughStorage'
+        self.defined_storage.kwargs = {
+            'next_storage_backend': 'django.core.files.storage.FileSystemStorage',
+            'next_storage_backend_arguments': {
+                'location': self.document_storage_kwargs['location']
+            },
+            'password': 'testpassword'
+        }
+
+    def _call_command(self):
+        options = {
+            'app_label': 'documents',
+            'defined_storage_name': storage_document_files.name,
+            'model_name': 'DocumentFile'
+        }
+        management.call_command(
+            command_name='storage_encrypted_upgrade', **options
+        )
+
+    def test_storage_encrypted_upgrade_command(self):
+        self._upload_test_document()
+
+        storage = EncryptedPassthroughStorage.get_pipeline_instance(
+            storage_instance=self.defined_storage.get_storage_instance()
+        )
+        file_name = self.test_document.file_latest.file.name
+
+        with storage.open(name=file_name, mode='rb') as file_object:
+            content = file_object.read()
+
+        self._save_test_legacy_encrypted_file(
+            content=content, key=storage.key,
+            path=Path(self.document_storage_kwargs['location']) / file_name
+        )
+        self.assertTrue(storage.is_legacy_format(name=file_name))
+
+        self._call_command()
+
+        self.assertFalse(storage.is_legacy_format(name=file_name))
+        self.assertEqual(
+            self.test_document.file_latest.checksum,
+            self.test_document.file_latest.checksum_update(save=False)
+        )
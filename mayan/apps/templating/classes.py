@@ -1,3 +1,4 @@
+import functools
 import hashlib
 
 from django.template import Context, Engine, Template as DjangoTemplate
@@ -6,6 +7,10 @@ from django.urls import reverse
 
 from mayan.apps.common.settings import setting_home_view
 
+from .literals import TEMPLATE_CACHE_MAXIMUM_SIZE
+
+_template_engine = None
+
 
 class AJAXTemplate:
     _registry = {}
@@ -51,18 +56,59 @@ class AJAXTemplate:
         return self
 
 
+def create_template_engine():
+    return Engine(
+        builtins=[
+            'mathfilters.templatetags.mathfilters',
+            'mayan.apps.templating.templatetags.templating_tags',
+        ]
+    )
+
+
+def get_template_engine():
+    global _template_engine
+
+    if not _template_engine:
+        _template_engine = create_template_engine()
+
+    return _template_engine
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_MAXIMUM_SIZE)
+def get_compiled_template(template_string):
+    return DjangoTemplate(
+        engine=get_template_engine(), template_string=template_string
+    )
+
+
 class Template:
-    def __init__(self, template_string):
-        engine = Engine(
-            builtins=[
-                'mathfilters.templatetags.mathfilters',
-                'mayan.apps.templating.templatetags.templating_tags',
-            ]
-        )
+    """
+    Template using the shared engine with the Mayan builtins. Compiled
+    templates are cached by template string. Set `cache` to False to
+    compile the template with a new engine every time.
+    """
+    @staticmethod
+    def cache_clear():
+        get_compiled_template.cache_clear()
 
-        self._template = DjangoTemplate(
-            engine=engine, template_string=template_string
-        )
+    @staticmethod
+    def get_cache_info():
+        """
+        Return the hits, misses, maxsize and currsize counters of the
+        compiled template cache.
+        """
+        return get_compiled_template.cache_info()
+
+    def __init__(self, template_string, cache=True):
+        if cache:
+            self._template = get_compiled_template(
+                template_string=template_string
+            )
+        else:
+            self._template = DjangoTemplate(
+                engine=create_template_engine(),
+                template_string=template_string
+            )
 
     def render(self, context=None):
         context_object = Context(dict_=context or {})
@@ -1 +1,2 @@
 EMPTY_LABEL = '---------'
+TEMPLATE_CACHE_MAXIMUM_SIZE = 1024
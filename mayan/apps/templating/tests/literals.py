@@ -1,2 +1,3 @@
 TEST_AJAXTEMPLATE_RESULT = '<div'
 TEST_TEMPLATE = '{{ document.label }}'
+TEST_TEMPLATE_CONTEXT_LABEL = 'test label'
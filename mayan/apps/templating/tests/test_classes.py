@@ -0,0 +1,38 @@
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import Template
+
+from .literals import TEST_TEMPLATE, TEST_TEMPLATE_CONTEXT_LABEL
+
+
+class TemplateCacheTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        Template.cache_clear()
+
+    def test_cache_hit(self):
+        Template(template_string=TEST_TEMPLATE)
+        template = Template(template_string=TEST_TEMPLATE)
+
+        cache_info = Template.get_cache_info()
+        self.assertEqual(cache_info.hits, 1)
+        self.assertEqual(cache_info.misses, 1)
+
+        self.assertEqual(
+            template.render(
+                context={'document': {'label': TEST_TEMPLATE_CONTEXT_LABEL}}
+            ), TEST_TEMPLATE_CONTEXT_LABEL
+        )
+
+    def test_cache_disabled(self):
+        template = Template(cache=False, template_string=TEST_TEMPLATE)
+
+        cache_info = Template.get_cache_info()
+        self.assertEqual(cache_info.hits, 0)
+        self.assertEqual(cache_info.misses, 0)
+
+        self.assertEqual(
+            template.render(
+                context={'document': {'label': TEST_TEMPLATE_CONTEXT_LABEL}}
+            ), TEST_TEMPLATE_CONTEXT_LABEL
+        )
@@ -20,6 +20,7 @@ from django.views.generic.list import ListView
 
 from pure_pagination.mixins import PaginationMixin
 
+from mayan.apps.acls.classes import AccessCache
 from mayan.apps.acls.models import AccessControlList
 
 from .forms import ChoiceForm
@@ -887,6 +888,15 @@ class SingleObjectListView(
 
         return result
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+
+        # Evaluate the access to the objects of the page in bulk when the
+        # links of the first one are resolved.
+        AccessCache.register_objects(object_list=context['object_list'])
+
+        return context
+
     def get_paginate_by(self, queryset):
         return setting_paginate_by.value
 
@@ -11,6 +11,7 @@ from django.views.generic.detail import SingleObjectMixin
 from mayan.apps.acls.classes import ModelPermission
 from mayan.apps.acls.models import AccessControlList
 from mayan.apps.common.settings import setting_home_view
+from mayan.apps.events.classes import EventCommitBatch
 from mayan.apps.permissions import Permission
 
 from .compat import FileResponse
@@ -401,18 +402,20 @@ class ObjectActionViewMixin:
         self.action_count = 0
         self.action_id_list = []
 
-        for instance in self.object_list:
-            try:
-                self.object_action(form=form, instance=instance)
-            except ActionError as exception:
-                messages.error(
-                    message=self.error_message % {
-                        'exception': exception, 'instance': instance
-                    }, request=self.request
-                )
-            else:
-                self.action_count += 1
-                self.action_id_list.append(instance.pk)
+        # Write the events of all the objects with a single bulk insert.
+        with EventCommitBatch.scope():
+            for instance in self.object_list:
+                try:
+                    self.object_action(form=form, instance=instance)
+                except ActionError as exception:
+                    messages.error(
+                        message=self.error_message % {
+                            'exception': exception, 'instance': instance
+                        }, request=self.request
+                    )
+                else:
+                    self.action_count += 1
+                    self.action_id_list.append(instance.pk)
 
         messages.success(
             message=self.get_success_message(count=self.action_count),
@@ -143,6 +143,8 @@ MIDDLEWARE = (
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'mayan.apps.authentication.middleware.impersonate.ImpersonateMiddleware',
+    'mayan.apps.acls.middleware.access_cache.AccessCacheMiddleware',
+    'mayan.apps.events.middleware.event_notification_batch.EventNotificationBatchMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'django.middleware.locale.LocaleMiddleware',